@@ -0,0 +1,311 @@
+# Copyright (c) 2025 mrbooo895.
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""
+Benchmark suite for pyinit's own commands on synthetic large projects.
+
+Usage:
+
+    python benchmarks/run_benchmarks.py [--sizes 10000,100000] [--repeat 3]
+                                        [--output results.json]
+                                        [--compare baseline.json] [--threshold 20]
+
+For every size, a synthetic project with that many modules (plus
+`__pycache__` trees, test and build artifacts and a large stand-in venv) is
+generated in a temporary directory, and the following are timed:
+
+- clean_project: the recursive search and removal of 'pyinit clean'
+- get_project_stats: the file and line count of 'pyinit info'
+- initialize_project: 'pyinit init' migrating a tenth as many root modules
+- find_project_root: the upward search from 10, 50 and 200 levels deep
+- startup: 'python -m pyinit.main --version', and 'pyinit run' with and
+  without its cached launch record
+
+Git, venv creation and the interactive prompt are replaced by local
+stand-ins, so the suite runs offline and measures pyinit itself. The results
+are printed and written as JSON; with `--compare`, the medians are checked
+against an earlier JSON file and the exit code is 1 past the threshold.
+"""
+
+import argparse
+import io
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from unittest import mock
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "src"))
+
+from rich.console import Console  # noqa: E402
+
+import pyinit  # noqa: E402
+from pyinit.clean import clean_project  # noqa: E402
+from pyinit.info import get_project_stats  # noqa: E402
+from pyinit.init import initialize_project  # noqa: E402
+from pyinit.utils import find_project_root  # noqa: E402
+
+from synthetic import (  # noqa: E402
+    make_deep_directory,
+    make_project,
+    restore_pycache,
+)
+
+DEPTHS = (10, 50, 200)
+
+
+def measure(func, repeat: int, setup=None, number: int = 1) -> list[float]:
+    """
+    Times `number` calls of a function, `repeat` times.
+
+    :param callable func: The function to time.
+    :param int repeat: The number of measurements.
+    :param callable, optional setup: Called, untimed, before every measurement.
+    :param int number: Calls per measurement; the result is per call.
+    :return: Seconds per call of every measurement.
+    :rtype: list[float]
+    """
+    timings = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        timings.append((time.perf_counter() - start) / number)
+    return timings
+
+
+@contextmanager
+def working_directory(path: Path):
+    previous = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+
+@contextmanager
+def offline_stand_ins():
+    """
+    Replaces subprocesses, venv creation and console I/O with local stand-ins.
+    """
+
+    def fake_run(cmd, *args, **kwargs):
+        return subprocess.CompletedProcess(cmd, 0, stdout="bench\n", stderr="")
+
+    def quiet_console(*args, **kwargs):
+        return Console(file=io.StringIO())
+
+    def fake_venv_create(path, *args, **kwargs):
+        Path(path).mkdir(parents=True, exist_ok=True)
+
+    with mock.patch("pyinit.init.subprocess.run", fake_run), mock.patch(
+        "pyinit.create.subprocess.run", fake_run
+    ), mock.patch("pyinit.init.venv.create", fake_venv_create), mock.patch(
+        "pyinit.clean.Console", quiet_console
+    ), mock.patch(
+        "pyinit.init.Console", quiet_console
+    ), mock.patch.object(
+        Console, "input", return_value="y"
+    ):
+        yield
+
+
+def _ignore_exit(func):
+    def wrapper():
+        try:
+            func()
+        except SystemExit:
+            pass
+
+    return wrapper
+
+
+def bench_project_commands(workdir: Path, size: int, repeat: int) -> list[dict]:
+    """Times the commands that walk a project of `size` modules."""
+    results = []
+    project = make_project(workdir / f"project_{size}", files=size)
+
+    with offline_stand_ins(), working_directory(project):
+        timings = measure(
+            _ignore_exit(clean_project), repeat, setup=lambda: restore_pycache(project)
+        )
+    results.append(record("clean_project", size, timings))
+
+    timings = measure(lambda: get_project_stats(project), repeat)
+    results.append(record("get_project_stats", size, timings))
+
+    for depth in DEPTHS:
+        deep = make_deep_directory(project, depth)
+        with working_directory(deep):
+            timings = measure(find_project_root, repeat, number=100)
+        results.append(record(f"find_project_root[depth={depth}]", size, timings))
+
+    # 'pyinit init' moves the root modules of an existing directory into src/.
+    modules = max(1, size // 10)
+    legacy = workdir / f"legacy_{size}"
+
+    def prepare_legacy():
+        shutil.rmtree(legacy, ignore_errors=True)
+        legacy.mkdir()
+        for index in range(modules):
+            (legacy / f"module_{index}.py").write_text(f"VALUE = {index}\n")
+
+    with offline_stand_ins():
+
+        def init_in_legacy():
+            with working_directory(legacy):
+                _ignore_exit(initialize_project)()
+
+        timings = measure(init_in_legacy, repeat, setup=prepare_legacy)
+    results.append(record("initialize_project", modules, timings))
+
+    shutil.rmtree(project)
+    shutil.rmtree(legacy, ignore_errors=True)
+    return results
+
+
+def bench_startup(workdir: Path, repeat: int) -> list[dict]:
+    """Times the start of a pyinit process, with and without the run fast path."""
+    project = make_project(
+        workdir / "startup", files=10, venv_packages=1, venv_files=1
+    )
+    env = {**os.environ, "PYTHONPATH": str(REPO_ROOT / "src")}
+
+    def spawn(*args):
+        subprocess.run(
+            [sys.executable, *args],
+            cwd=project,
+            env=env,
+            check=True,
+            stdout=subprocess.DEVNULL,
+        )
+
+    launch_record = project / ".pyinit" / "launch.json"
+    results = [
+        record("startup[python]", 0, measure(lambda: spawn("-c", "pass"), repeat)),
+        record(
+            "startup[--version]",
+            0,
+            measure(lambda: spawn("-m", "pyinit.main", "--version"), repeat),
+        ),
+        record(
+            "startup[run]",
+            0,
+            measure(
+                lambda: spawn("-m", "pyinit.main", "run"),
+                repeat,
+                setup=lambda: launch_record.unlink(missing_ok=True),
+            ),
+        ),
+    ]
+    spawn("-m", "pyinit.main", "run")
+    results.append(
+        record(
+            "startup[run, cached]",
+            0,
+            measure(lambda: spawn("-m", "pyinit.main", "run"), repeat),
+        )
+    )
+    return results
+
+
+def record(name: str, size: int, timings: list[float]) -> dict:
+    return {
+        "name": name,
+        "size": size,
+        "min": min(timings),
+        "median": statistics.median(timings),
+        "mean": statistics.fmean(timings),
+        "timings": timings,
+    }
+
+
+def compare(results: list[dict], baseline_path: Path, threshold: float) -> bool:
+    """
+    Prints the change of every median against a baseline file.
+
+    :return: True if any benchmark slowed down past the threshold.
+    :rtype: bool
+    """
+    baseline = {
+        (entry["name"], entry["size"]): entry
+        for entry in json.loads(baseline_path.read_text())["results"]
+    }
+    regressed = False
+    print(f"\nCompared with {baseline_path} (threshold {threshold:g}% slower)")
+    for entry in results:
+        old = baseline.get((entry["name"], entry["size"]))
+        if old is None or not old["median"]:
+            continue
+        change = (entry["median"] / old["median"] - 1) * 100
+        flag = "  REGRESSION" if change > threshold else ""
+        print(f"  {entry['name']:<32} {entry['size']:>7}  {change:>+7.1f}%{flag}")
+        regressed |= change > threshold
+    return regressed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument(
+        "--sizes", default="10000,100000", help="Comma-separated module counts"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Measurements per benchmark"
+    )
+    parser.add_argument(
+        "--output", type=Path, help="Write the results as JSON to this file"
+    )
+    parser.add_argument(
+        "--compare", type=Path, help="A previous JSON output to compare with"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=20.0,
+        help="Slowdown in percent that fails --compare",
+    )
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory(prefix="pyinit-bench-") as temp_dir:
+        workdir = Path(temp_dir)
+        for size in (int(size) for size in args.sizes.split(",")):
+            results += bench_project_commands(workdir, size, args.repeat)
+        results += bench_startup(workdir, args.repeat)
+
+    for entry in results:
+        print(
+            f"{entry['name']:<32} {entry['size']:>7}  "
+            f"median {entry['median'] * 1000:>10.3f} ms  "
+            f"min {entry['min'] * 1000:>10.3f} ms"
+        )
+
+    output = {
+        "pyinit": pyinit.__version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "results": results,
+    }
+    if args.output:
+        args.output.write_text(json.dumps(output, indent=2) + "\n")
+
+    if args.compare and compare(results, args.compare, args.threshold):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
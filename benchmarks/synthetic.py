@@ -0,0 +1,201 @@
+# Copyright (c) 2025 mrbooo895.
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""
+Generators of synthetic pyinit projects for the benchmark suite.
+
+The projects are shaped like real ones at scale: a `src/` package tree of
+nested directories, a `__pycache__` next to every source directory, test
+and build artifacts, and a virtual environment whose site-packages holds
+many distributions. Only the file layout is real; the venv's interpreter is
+a symlink to the running one, so nothing is ever installed.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+MODULE_SOURCE = '''"""Synthetic module {index}."""
+
+import os
+
+
+def function_{index}(value):
+    """Returns a value derived from its argument."""
+    if value > {index}:
+        return os.path.join(str(value), "{index}")
+    return None
+
+
+class Class{index}:
+    """A class with a couple of methods."""
+
+    def __init__(self):
+        self.value = {index}
+
+    def compute(self):
+        return function_{index}(self.value)
+'''
+
+PYC_BYTES = b"\x00" * 512
+
+
+def iter_directories(base: Path, depth: int, fanout: int):
+    """
+    Yields the leaf directories of a tree `depth` levels deep.
+
+    :param Path base: The root of the tree.
+    :param int depth: The number of nested levels.
+    :param int fanout: The number of subdirectories per directory.
+    """
+    if depth == 0:
+        yield base
+        return
+    for index in range(fanout):
+        yield from iter_directories(base / f"pkg_{index}", depth - 1, fanout)
+
+
+def write_package_tree(
+    base: Path, files: int, depth: int, fanout: int, pycache: bool, cache_tag: str
+) -> int:
+    """
+    Writes `files` modules spread over a nested package tree.
+
+    :param Path base: The top-level package directory.
+    :param int files: The number of modules to write.
+    :param int depth: The nesting depth of the tree.
+    :param int fanout: The number of subpackages per package.
+    :param bool pycache: If True, writes a fake `.pyc` for every module.
+    :param str cache_tag: The interpreter's cache tag, e.g. 'cpython-311'.
+    :return: The number of files written.
+    :rtype: int
+    """
+    leaves = list(iter_directories(base, depth, fanout))
+    per_leaf = max(1, -(-files // len(leaves)))
+    written = 0
+    for leaf in leaves:
+        if written >= files:
+            break
+        leaf.mkdir(parents=True, exist_ok=True)
+        # Every package level gets its __init__.py, like a real tree.
+        directory = leaf
+        while directory != base.parent and not (directory / "__init__.py").exists():
+            (directory / "__init__.py").write_text("")
+            directory = directory.parent
+        if pycache:
+            (leaf / "__pycache__").mkdir(exist_ok=True)
+        for _ in range(min(per_leaf, files - written)):
+            name = f"module_{written}"
+            (leaf / f"{name}.py").write_text(MODULE_SOURCE.format(index=written))
+            if pycache:
+                (leaf / "__pycache__" / f"{name}.{cache_tag}.pyc").write_bytes(PYC_BYTES)
+            written += 1
+    return written
+
+
+def make_project(
+    root: Path,
+    name: str = "synthetic",
+    files: int = 10_000,
+    depth: int = 3,
+    fanout: int = 10,
+    venv_packages: int = 100,
+    venv_files: int = 50,
+) -> Path:
+    """
+    Creates a synthetic pyinit project.
+
+    :param Path root: The directory to create the project in.
+    :param str name: The project and package name.
+    :param int files: The number of modules under `src/`.
+    :param int depth: The nesting depth of the package tree.
+    :param int fanout: The number of subpackages per package.
+    :param int venv_packages: The number of distributions in site-packages.
+    :param int venv_files: The number of modules per distribution.
+    :return: The project root.
+    :rtype: Path
+    """
+    cache_tag = sys.implementation.cache_tag
+    root.mkdir(parents=True, exist_ok=True)
+    (root / "pyproject.toml").write_text(
+        f'[project]\nname = "{name}"\nversion = "0.1.0"\ndependencies = []\n'
+    )
+    package = root / "src" / name
+    write_package_tree(package, files, depth, fanout, True, cache_tag)
+    (package / "main.py").write_text("")
+
+    # --- Test and Build Artifacts ---
+    write_package_tree(root / "tests", max(1, files // 10), 1, fanout, True, cache_tag)
+    (root / ".pytest_cache" / "v" / "cache").mkdir(parents=True)
+    (root / ".pytest_cache" / "v" / "cache" / "nodeids").write_text("[]")
+    (root / "dist").mkdir()
+    (root / "dist" / f"{name}-0.1.0-py3-none-any.whl").write_bytes(b"PK")
+
+    make_venv(root / "venv", venv_packages, venv_files)
+    return root
+
+
+def make_venv(venv_dir: Path, packages: int, files: int):
+    """
+    Creates a stand-in virtual environment with a populated site-packages.
+
+    `bin/python` links to the running interpreter, so commands that execute
+    the venv's interpreter work without creating a real environment.
+
+    :param Path venv_dir: The venv directory to create.
+    :param int packages: The number of distributions.
+    :param int files: The number of modules per distribution.
+    """
+    version = f"python{sys.version_info[0]}.{sys.version_info[1]}"
+    site_packages = venv_dir / "lib" / version / "site-packages"
+    site_packages.mkdir(parents=True)
+    (venv_dir / "pyvenv.cfg").write_text(
+        f"home = {Path(sys.executable).parent}\n"
+        f"version = {sys.version_info[0]}.{sys.version_info[1]}.{sys.version_info[2]}\n"
+    )
+    (venv_dir / "bin").mkdir()
+    os.symlink(sys.executable, venv_dir / "bin" / "python")
+
+    cache_tag = sys.implementation.cache_tag
+    for index in range(packages):
+        write_package_tree(site_packages / f"dist_{index}", files, 1, 5, True, cache_tag)
+        dist_info = site_packages / f"dist_{index}-1.0.dist-info"
+        dist_info.mkdir()
+        (dist_info / "METADATA").write_text(
+            f"Metadata-Version: 2.1\nName: dist-{index}\nVersion: 1.0\n"
+        )
+
+
+def make_deep_directory(root: Path, depth: int) -> Path:
+    """
+    Creates a chain of nested directories below a project root.
+
+    :param Path root: The project root.
+    :param int depth: The number of nested levels.
+    :return: The innermost directory.
+    :rtype: Path
+    """
+    path = root.joinpath(*(["d"] * depth))
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def restore_pycache(root: Path):
+    """
+    Recreates the artifacts 'pyinit clean' removes, without rewriting sources.
+
+    :param Path root: The project root.
+    """
+    cache_tag = sys.implementation.cache_tag
+    for directory, _, filenames in os.walk(root):
+        sources = [name for name in filenames if name.endswith(".py")]
+        if not sources or "__pycache__" in directory:
+            continue
+        pycache = Path(directory) / "__pycache__"
+        pycache.mkdir(exist_ok=True)
+        for source in sources:
+            (pycache / f"{source[:-3]}.{cache_tag}.pyc").write_bytes(PYC_BYTES)
+    (root / ".pytest_cache").mkdir(exist_ok=True)
+    (root / "dist").mkdir(exist_ok=True)
@@ -4,22 +4,35 @@ pyinit - Your All-in-One Python Project Manager
 """
 
 __version__ = "1.0.13"
-from .build import build_project
-from .check import check_project
-from .clean import clean_project
-from .create import create_project
-from .format import format_project
-from .graph import show_dependency_graph
-from .info import project_info
-from .init import initialize_project
-from .install import install_modules
-from .release import increase_version
-from .run import run_project
-from .test import run_tests
-from .uninstall import uninstall_modules
-from .update import update_modules
-from .venv import manage_venv
-from .wrappers import error_handling
+
+# The public functions are imported on first access (PEP 562), so that
+# importing the package for the 'pyinit run' fast path loads nothing else.
+_LAZY_EXPORTS = {
+    "build_project": "build",
+    "run_benchmarks": "bench",
+    "bundle_project": "bundle",
+    "compile_project": "bytecode",
+    "check_project": "check",
+    "clean_project": "clean",
+    "create_project": "create",
+    "format_project": "format",
+    "show_dependency_graph": "graph",
+    "project_info": "info",
+    "initialize_project": "init",
+    "install_modules": "install",
+    "lock_project": "lock",
+    "sync_project": "lock",
+    "increase_version": "release",
+    "run_project": "run",
+    "run_tests": "test",
+    "uninstall_modules": "uninstall",
+    "update_modules": "update",
+    "manage_venv": "venv",
+    "manage_wheelhouse": "wheelhouse",
+    "run_workspace": "workspace",
+    "main": "main",
+    "error_handling": "wrappers",
+}
 
 __all__ = [
     "create_project",
@@ -27,16 +40,36 @@ __all__ = [
     "run_project",
     "install_modules",
     "update_modules",
+    "lock_project",
+    "sync_project",
     "uninstall_modules",
     "build_project",
+    "bundle_project",
+    "compile_project",
     "run_tests",
+    "run_benchmarks",
     "check_project",
     "format_project",
     "show_dependency_graph",
     "clean_project",
     "increase_version",
     "manage_venv",
+    "manage_wheelhouse",
     "project_info",
+    "run_workspace",
     "main",
     "error_handling",
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        from importlib import import_module
+
+        module = import_module(f".{_LAZY_EXPORTS[name]}", __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
@@ -0,0 +1,79 @@
+# Copyright (c) 2025 mrbooo895.
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""
+Bootstrap of 'pyinit bench'.
+
+Run by the project's venv interpreter as `python pyinit_bench.py FILE
+FUNCTION`, in a fresh process for every benchmark: imports FILE, calls
+FUNCTION repeatedly for `PYINIT_BENCH_WARMUP` seconds, calibrates how many
+calls make one timed round last at least `PYINIT_BENCH_MIN_TIME` seconds,
+then times `PYINIT_BENCH_REPEAT` rounds. The seconds per call of each round
+are written as JSON to `PYINIT_BENCH_OUTPUT`. The venv does not have pyinit
+installed, so this file must only use the standard library.
+"""
+
+import gc
+import importlib.util
+import json
+import os
+import sys
+import time
+
+
+def time_loops(func, loops):
+    """Returns the seconds taken by `loops` calls, with the GC paused like timeit."""
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        return time.perf_counter() - start
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+def main():
+    path, name = sys.argv[1], sys.argv[2]
+    warmup = float(os.environ.get("PYINIT_BENCH_WARMUP", "0.1"))
+    min_time = float(os.environ.get("PYINIT_BENCH_MIN_TIME", "0.05"))
+    repeat = int(os.environ.get("PYINIT_BENCH_REPEAT", "20"))
+
+    sys.path[0] = os.path.dirname(os.path.abspath(path))
+    for extra in filter(None, os.environ.get("PYINIT_BENCH_PATH", "").split(os.pathsep)):
+        sys.path.insert(1, extra)
+    module_name = os.path.splitext(os.path.basename(path))[0]
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    func = getattr(module, name)
+
+    # --- Warmup ---
+    deadline = time.perf_counter() + warmup
+    while True:
+        func()
+        if time.perf_counter() >= deadline:
+            break
+
+    # --- Calibration ---
+    loops = 1
+    while True:
+        elapsed = time_loops(func, loops)
+        if elapsed >= min_time or loops >= 1 << 30:
+            break
+        # Jump close to the target, but never by more than 10x at once.
+        loops *= max(2, min(10, int(min_time / max(elapsed, 1e-9)) + 1))
+
+    # --- Measurement ---
+    timings = [time_loops(func, loops) / loops for _ in range(repeat)]
+    with open(os.environ["PYINIT_BENCH_OUTPUT"], "w", encoding="utf-8") as f:
+        json.dump({"loops": loops, "timings": timings}, f)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+# Copyright (c) 2025 mrbooo895.
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""
+Bootstrap of 'pyinit run --mem'.
+
+Run by the project's venv interpreter as `python pyinit_mem.py SCRIPT
+[ARGS...]`: starts tracemalloc with `PYINIT_MEM_FRAMES` frames per
+traceback, then executes SCRIPT as `__main__`. Snapshots are written to the
+`PYINIT_MEM_OUTPUT` directory at start, every `PYINIT_MEM_INTERVAL` seconds
+(if set), whenever the process receives SIGUSR1, and on exit. Alongside them,
+`rss.csv` logs the resident and peak resident set size and the traced memory
+every `PYINIT_MEM_RSS_INTERVAL` seconds and at each snapshot. The venv does
+not have pyinit installed, so this file must only use the standard library.
+"""
+
+import atexit
+import os
+import signal
+import sys
+import threading
+import time
+import tracemalloc
+import types
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def read_memory():
+    """
+    Returns the current and peak resident set size in bytes, where available.
+
+    On Linux both come from /proc: ru_maxrss is inherited across fork and
+    exec, so it would start at the peak of the pyinit process that spawned
+    the script.
+    """
+    try:
+        with open("/proc/self/status", encoding="ascii") as f:
+            fields = dict(line.split(":", 1) for line in f if ":" in line)
+        return (
+            int(fields["VmRSS"].split()[0]) * 1024,
+            int(fields["VmHWM"].split()[0]) * 1024,
+        )
+    except (OSError, KeyError, ValueError):
+        pass
+    if resource is None:
+        return "", ""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux, but in bytes on macOS.
+    return "", peak if sys.platform == "darwin" else peak * 1024
+
+
+class MemoryMonitor(threading.Thread):
+    """Writes tracemalloc snapshots and logs memory usage at fixed intervals."""
+
+    def __init__(self, output, interval, rss_interval):
+        super().__init__(name="pyinit-mem", daemon=True)
+        self.output = output
+        self.interval = interval
+        self.rss_interval = rss_interval
+        self.started = time.monotonic()
+        self.count = 0
+        self.lock = threading.RLock()
+        self.stopped = threading.Event()
+        with open(os.path.join(output, "rss.csv"), "w", encoding="ascii") as f:
+            f.write("seconds,event,rss,peak_rss,traced,traced_peak\n")
+
+    def log(self, event):
+        traced, traced_peak = tracemalloc.get_traced_memory()
+        rss, peak_rss = read_memory()
+        seconds = time.monotonic() - self.started
+        line = f"{seconds:.3f},{event},{rss},{peak_rss},{traced},{traced_peak}\n"
+        with self.lock:
+            with open(os.path.join(self.output, "rss.csv"), "a", encoding="ascii") as f:
+                f.write(line)
+
+    def snapshot(self, event):
+        with self.lock:
+            self.count += 1
+            path = os.path.join(self.output, f"{self.count:04d}-{event}.tracemalloc")
+            tracemalloc.take_snapshot().dump(path + ".tmp")
+            os.replace(path + ".tmp", path)
+            self.log(event)
+
+    def run(self):
+        last_snapshot = time.monotonic()
+        while not self.stopped.wait(self.rss_interval):
+            if self.interval and time.monotonic() - last_snapshot >= self.interval:
+                self.snapshot("interval")
+                last_snapshot = time.monotonic()
+            else:
+                self.log("sample")
+
+    def stop(self):
+        if not self.stopped.is_set():
+            self.stopped.set()
+            self.snapshot("exit")
+
+
+def _terminate(signum, frame):
+    # Unwinds the script like Ctrl+C does, so the exit snapshot is still taken.
+    sys.exit(128 + signum)
+
+
+def main():
+    output = os.environ["PYINIT_MEM_OUTPUT"]
+    interval = float(os.environ.get("PYINIT_MEM_INTERVAL", "0"))
+    rss_interval = float(os.environ.get("PYINIT_MEM_RSS_INTERVAL", "1"))
+    if interval:
+        rss_interval = min(rss_interval, interval)
+
+    script = sys.argv[1]
+    sys.argv = sys.argv[1:]
+    sys.path[0] = os.path.dirname(os.path.abspath(script))
+
+    tracemalloc.start(int(os.environ.get("PYINIT_MEM_FRAMES", "1")))
+    monitor = MemoryMonitor(output, interval, rss_interval)
+    if signal.getsignal(signal.SIGTERM) is signal.SIG_DFL:
+        signal.signal(signal.SIGTERM, _terminate)
+    if hasattr(signal, "SIGUSR1"):
+        signal.signal(signal.SIGUSR1, lambda signum, frame: monitor.snapshot("signal"))
+
+    # Exit handlers run once non-daemon threads have finished, so the exit
+    # snapshot sees everything they allocated.
+    atexit.register(monitor.stop)
+    monitor.snapshot("start")
+    monitor.start()
+
+    # Unlike runpy.run_path, a real '__main__' module keeps the script's
+    # globals alive until shutdown, so the exit snapshot still sees them.
+    module = types.ModuleType("__main__")
+    module.__file__ = script
+    sys.modules["__main__"] = module
+    with open(script, "rb") as f:
+        code = compile(f.read(), script, "exec")
+    exec(code, module.__dict__)
+
+
+if __name__ == "__main__":
+    main()
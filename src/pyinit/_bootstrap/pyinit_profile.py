@@ -0,0 +1,44 @@
+# Copyright (c) 2025 mrbooo895.
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""
+Bootstrap of 'pyinit run --profile'.
+
+Run by the project's venv interpreter as `python pyinit_profile.py SCRIPT
+[ARGS...]`: executes SCRIPT as `__main__` under cProfile and dumps the
+statistics to the file named by `PYINIT_PROFILE_OUTPUT` when the script
+exits, including through `sys.exit`, Ctrl+C or SIGTERM. The venv does not
+have pyinit installed, so this file must only use the standard library.
+"""
+
+import cProfile
+import os
+import runpy
+import signal
+import sys
+
+
+def _terminate(signum, frame):
+    # Unwinds the script like Ctrl+C does, so the profile is still written.
+    sys.exit(128 + signum)
+
+
+def main():
+    output = os.environ["PYINIT_PROFILE_OUTPUT"]
+    script = sys.argv[1]
+    sys.argv = sys.argv[1:]
+    sys.path[0] = os.path.dirname(os.path.abspath(script))
+    if signal.getsignal(signal.SIGTERM) is signal.SIG_DFL:
+        signal.signal(signal.SIGTERM, _terminate)
+
+    profiler = cProfile.Profile()
+    try:
+        profiler.runcall(runpy.run_path, script, run_name="__main__")
+    finally:
+        profiler.dump_stats(output)
+
+
+if __name__ == "__main__":
+    main()
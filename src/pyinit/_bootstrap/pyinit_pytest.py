@@ -0,0 +1,84 @@
+# Copyright (c) 2025 mrbooo895.
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""
+Pytest plugin of 'pyinit test'.
+
+Loaded into the venv's pytest with `-p pyinit_pytest`, this directory being
+put on `PYTHONPATH`. Each behaviour is switched on by an environment
+variable holding a file path:
+
+- `PYINIT_TEST_COLLECT`: the collected test IDs are written there as JSON.
+- `PYINIT_TEST_SELECT`: only the test IDs listed there (one per line) run,
+  in that order; the others are reported as deselected.
+- `PYINIT_TEST_PRIORITY`: a JSON object of the test IDs that `failed` last
+  time and the test files whose code `changed`. The failed tests run first,
+  then those of the changed files, then the others, each in their collection
+  order. `--collect-only` ignores it, so the collected order stays stable.
+- `PYINIT_TEST_REPORT`: the outcome and duration (setup, call and teardown)
+  of every test that ran are written there as JSON at the end of the session.
+
+The venv does not have pyinit installed, so this file must only use the
+standard library and pytest's hooks.
+"""
+
+import json
+import os
+
+
+def pytest_collection_modifyitems(session, config, items):
+    select_path = os.environ.get("PYINIT_TEST_SELECT")
+    if select_path:
+        with open(select_path, encoding="utf-8") as f:
+            nodeids = f.read().splitlines()
+        order = {nodeid: index for index, nodeid in enumerate(nodeids)}
+        selected = [item for item in items if item.nodeid in order]
+        deselected = [item for item in items if item.nodeid not in order]
+        selected.sort(key=lambda item: order[item.nodeid])
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+    priority_path = os.environ.get("PYINIT_TEST_PRIORITY")
+    if priority_path and not config.option.collectonly:
+        with open(priority_path, encoding="utf-8") as f:
+            priority = json.load(f)
+        failed = set(priority["failed"])
+        changed = set(priority["changed"])
+
+        def rank(item):
+            if item.nodeid in failed:
+                return 0
+            return 1 if item.nodeid.split("::")[0] in changed else 2
+
+        # A stable sort keeps the collection (or selection) order within ranks.
+        items.sort(key=rank)
+
+
+def pytest_collection_finish(session):
+    collect_path = os.environ.get("PYINIT_TEST_COLLECT")
+    if collect_path:
+        with open(collect_path, "w", encoding="utf-8") as f:
+            json.dump([item.nodeid for item in session.items], f)
+
+
+RESULTS = {}
+
+
+def pytest_runtest_logreport(report):
+    result = RESULTS.setdefault(report.nodeid, {"outcome": "passed", "duration": 0.0})
+    result["duration"] += report.duration
+    if report.failed:
+        # A failing setup or teardown is an error of the test, as pytest reports it.
+        result["outcome"] = "failed" if report.when == "call" else "error"
+    elif report.skipped and result["outcome"] == "passed":
+        result["outcome"] = "skipped"
+
+
+def pytest_sessionfinish(session, exitstatus):
+    report_path = os.environ.get("PYINIT_TEST_REPORT")
+    if report_path:
+        with open(report_path, "w", encoding="utf-8") as f:
+            json.dump(RESULTS, f)
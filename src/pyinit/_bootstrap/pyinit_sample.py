@@ -0,0 +1,121 @@
+# Copyright (c) 2025 mrbooo895.
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""
+Bootstrap of 'pyinit run --sample'.
+
+Run by the project's venv interpreter as `python pyinit_sample.py SCRIPT
+[ARGS...]`: executes SCRIPT as `__main__` while a daemon thread samples the
+stacks of all threads every `PYINIT_SAMPLE_INTERVAL` milliseconds (wall
+clock, so threads blocked on I/O are seen too). Identical stacks are
+aggregated in memory and written as collapsed stacks to
+`PYINIT_SAMPLE_OUTPUT` on exit and whenever the process receives SIGUSR2.
+The venv does not have pyinit installed, so this file must only use the
+standard library.
+"""
+
+import atexit
+import os
+import re
+import runpy
+import signal
+import sys
+import threading
+
+STDLIB_PATTERN = re.compile(r"[\\/]lib[\\/]python\d+\.\d+[\\/]")
+SKIPPED_FILES = {os.path.abspath(__file__), "<frozen runpy>", runpy.__file__}
+
+
+class Sampler(threading.Thread):
+    """Aggregates the stacks of every other thread at a fixed interval."""
+
+    def __init__(self, interval, output, project_root):
+        super().__init__(name="pyinit-sampler", daemon=True)
+        self.interval = interval
+        self.output = output
+        self.project_root = project_root + os.sep
+        self.counts = {}
+        self.labels = {}
+        self.lock = threading.RLock()
+        self.stopped = threading.Event()
+
+    def label(self, code):
+        label = self.labels.get(code)
+        if label is None:
+            filename = code.co_filename
+            if filename.startswith(self.project_root):
+                filename = filename[len(self.project_root) :]
+            elif "site-packages" + os.sep in filename:
+                filename = filename.split("site-packages" + os.sep, 1)[1]
+            else:
+                filename = STDLIB_PATTERN.split(filename)[-1]
+            label = f"{code.co_name} ({filename}:{code.co_firstlineno})".replace(";", ",")
+            self.labels[code] = label
+        return label
+
+    def sample(self):
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        own = threading.get_ident()
+        for ident, frame in sys._current_frames().items():
+            if ident == own:
+                continue
+            frames = []
+            while frame is not None:
+                if frame.f_code.co_filename not in SKIPPED_FILES:
+                    frames.append(self.label(frame.f_code))
+                frame = frame.f_back
+            frames.append(f"thread ({names.get(ident, ident)})".replace(";", ","))
+            stack = ";".join(reversed(frames))
+            with self.lock:
+                self.counts[stack] = self.counts.get(stack, 0) + 1
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            self.sample()
+
+    def dump(self):
+        with self.lock:
+            lines = [f"{stack} {count}" for stack, count in sorted(self.counts.items())]
+        temp_path = f"{self.output}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+        os.replace(temp_path, self.output)
+
+    def stop(self):
+        if not self.stopped.is_set():
+            self.stopped.set()
+            self.dump()
+
+
+def _terminate(signum, frame):
+    # Unwinds the script like Ctrl+C does, so the samples are still written.
+    sys.exit(128 + signum)
+
+
+def main():
+    interval = float(os.environ.get("PYINIT_SAMPLE_INTERVAL", "10")) / 1000
+    sampler = Sampler(
+        interval,
+        os.environ["PYINIT_SAMPLE_OUTPUT"],
+        os.environ.get("PYINIT_PROJECT_ROOT", os.getcwd()),
+    )
+    script = sys.argv[1]
+    sys.argv = sys.argv[1:]
+    sys.path[0] = os.path.dirname(os.path.abspath(script))
+
+    if signal.getsignal(signal.SIGTERM) is signal.SIG_DFL:
+        signal.signal(signal.SIGTERM, _terminate)
+    if hasattr(signal, "SIGUSR2"):
+        signal.signal(signal.SIGUSR2, lambda signum, frame: sampler.dump())
+
+    # Exit handlers run once non-daemon threads have finished, so their
+    # samples are included.
+    atexit.register(sampler.stop)
+    sampler.start()
+    runpy.run_path(script, run_name="__main__")
+
+
+if __name__ == "__main__":
+    main()
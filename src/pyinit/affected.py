@@ -0,0 +1,255 @@
+# Copyright (c) 2025 mrbooo895.
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""
+Test impact analysis for 'pyinit test --affected'.
+
+A static import graph of the Python files in `src/` and `tests/` is built
+with `ast` and cached in `.pyinit/import-graph.json`, keyed by each file's
+content hash, so only the files that changed since the last run are parsed
+again. The files changed against a base git ref (committed, staged, unstaged
+and untracked) are then followed backwards through the graph: a test file is
+affected if it is one of them or transitively imports one of them. Changes
+that can affect any test, such as to `pyproject.toml`, `requirements.txt`,
+the lockfile or a `conftest.py`, call for a full run instead.
+
+The same graph gives every test file a fingerprint of the code it depends
+on, which the test history uses to tell flaky tests from changed code.
+"""
+
+import ast
+import hashlib
+import json
+from pathlib import Path
+
+from .info import run_command
+from .lock import LOCK_FILE_NAME
+from .utils import write_atomic
+
+IMPORT_GRAPH_FILE = Path(".pyinit") / "import-graph.json"
+IMPORT_GRAPH_VERSION = 1
+SOURCE_DIRS = ("src", "tests")
+FULL_RUN_FILES = {"pyproject.toml", "requirements.txt", LOCK_FILE_NAME, "conftest.py"}
+
+
+def module_names(path: str) -> list[str]:
+    """
+    Returns the names a Python file can be imported as.
+
+    Files under `src/` are named relative to it. Other files are named
+    relative to the project root ('tests.helpers') and, since pytest puts the
+    directory of test modules on `sys.path`, relative to their own directory
+    too ('helpers').
+
+    :param str path: The file's POSIX path, relative to the project root.
+    :rtype: list[str]
+    """
+    parts = path[: -len(".py")].split("/")
+    if parts[-1] == "__init__":
+        parts.pop()
+    if parts[0] == "src":
+        return [".".join(parts[1:])] if len(parts) > 1 else []
+    names = [".".join(parts)]
+    if len(parts) > 1 and not path.endswith("__init__.py"):
+        names.append(parts[-1])
+    return names
+
+
+def parse_imports(source: bytes, path: str) -> list[str]:
+    """
+    Returns the absolute names of the modules a Python file imports.
+
+    Relative imports are resolved against the file's package, and
+    `from package import name` yields both 'package' and 'package.name',
+    since 'name' may be a submodule.
+
+    :param bytes source: The file's content.
+    :param str path: The file's POSIX path, relative to the project root.
+    :return: The imported names, or an empty list if the file does not parse.
+    :rtype: list[str]
+    """
+    try:
+        tree = ast.parse(source, filename=path)
+    except (SyntaxError, ValueError):
+        return []
+    names = module_names(path)
+    package = names[0].split(".") if names else []
+    if not path.endswith("__init__.py"):
+        package = package[:-1]
+
+    imports = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            imports.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                base = package[: len(package) - node.level + 1]
+                module = ".".join(base + ([node.module] if node.module else []))
+            else:
+                module = node.module or ""
+            if module:
+                imports.add(module)
+            imports.update(
+                f"{module}.{alias.name}" if module else alias.name
+                for alias in node.names
+                if alias.name != "*"
+            )
+    return sorted(imports)
+
+
+def scan_sources(project_root: Path) -> dict[str, dict]:
+    """
+    Hashes and parses every Python file in `src/` and `tests/`.
+
+    Unchanged files are taken from the cache; the others are parsed, and the
+    cache is rewritten if anything changed.
+
+    :param Path project_root: The root directory of the project.
+    :return: `{"hash": ..., "imports": [...]}`, by POSIX path relative to the
+             root.
+    :rtype: dict[str, dict]
+    """
+    cache_path = project_root / IMPORT_GRAPH_FILE
+    try:
+        cache = json.loads(cache_path.read_text(encoding="utf-8"))
+        if cache.get("version") != IMPORT_GRAPH_VERSION:
+            cache = {}
+    except (FileNotFoundError, json.JSONDecodeError):
+        cache = {}
+    cached_files = cache.get("files", {})
+
+    files = {}
+    for directory in SOURCE_DIRS:
+        for file in sorted((project_root / directory).rglob("*.py")):
+            path = file.relative_to(project_root).as_posix()
+            source = file.read_bytes()
+            digest = hashlib.sha256(source).hexdigest()
+            entry = cached_files.get(path)
+            if entry is None or entry["hash"] != digest:
+                entry = {"hash": digest, "imports": parse_imports(source, path)}
+            files[path] = entry
+
+    if files != cached_files:
+        data = {"version": IMPORT_GRAPH_VERSION, "files": files}
+        write_atomic(cache_path, json.dumps(data).encode("utf-8"))
+    return files
+
+
+def code_fingerprints(project_root: Path, sources: dict[str, dict]) -> dict[str, str]:
+    """
+    Fingerprints the code every test file depends on.
+
+    The fingerprint of a test file hashes its own content, that of every file
+    it transitively imports, of every `conftest.py`, and of the files listing
+    the project's dependencies. It changes whenever anything that can change
+    the file's test results does, short of the environment itself.
+
+    :param Path project_root: The root directory of the project.
+    :param dict sources: The scanned files, from `scan_sources`.
+    :return: The fingerprint of every test file.
+    :rtype: dict[str, str]
+    """
+    files_by_name = {}
+    for path in sources:
+        for name in module_names(path):
+            files_by_name.setdefault(name, []).append(path)
+
+    shared = hashlib.sha256()
+    for name in sorted(FULL_RUN_FILES - {"conftest.py"}):
+        if (project_root / name).is_file():
+            shared.update((project_root / name).read_bytes())
+    for path in sorted(sources):
+        if path.endswith("conftest.py"):
+            shared.update(sources[path]["hash"].encode())
+
+    fingerprints = {}
+    for test_file in filter(is_test_file, sources):
+        seen = {test_file}
+        pending = [test_file]
+        while pending:
+            for name in sources[pending.pop()]["imports"]:
+                parts = name.split(".")
+                for end in range(1, len(parts) + 1):
+                    for path in files_by_name.get(".".join(parts[:end]), ()):
+                        if path not in seen:
+                            seen.add(path)
+                            pending.append(path)
+        digest = shared.copy()
+        for path in sorted(seen):
+            digest.update(sources[path]["hash"].encode())
+        fingerprints[test_file] = digest.hexdigest()[:16]
+    return fingerprints
+
+
+def get_changed_files(project_root: Path, base: str) -> list[str]:
+    """
+    Lists the files changed since the merge base of a git ref and HEAD.
+
+    Includes uncommitted and untracked files, so that work in progress is
+    covered as well.
+
+    :param Path project_root: The root directory of the project.
+    :param str base: The git ref to compare with, e.g. 'origin/main'.
+    :return: POSIX paths relative to the project root.
+    :rtype: list[str]
+    :raises RuntimeError: If the project is not in a git repository or the
+                          ref does not exist.
+    """
+    merge_base = run_command(["git", "merge-base", base, "HEAD"], project_root)
+    if merge_base is None:
+        raise RuntimeError(f"Could not find the git ref '{base}'.")
+    changed = run_command(
+        ["git", "diff", "--name-only", "--relative", merge_base], project_root
+    )
+    untracked = run_command(
+        ["git", "ls-files", "--others", "--exclude-standard"], project_root
+    )
+    return sorted(set(filter(None, f"{changed}\n{untracked}".splitlines())))
+
+
+def is_test_file(path: str) -> bool:
+    """
+    Tells whether a path is a test module by pytest's default naming.
+
+    :param str path: A POSIX path relative to the project root.
+    :rtype: bool
+    """
+    name = path.rsplit("/", 1)[-1]
+    return path.startswith("tests/") and (
+        (name.startswith("test_") and name.endswith(".py")) or name.endswith("_test.py")
+    )
+
+
+def find_affected_tests(
+    sources: dict[str, dict], changed: list[str]
+) -> set[str] | None:
+    """
+    Finds the test files that are or transitively import a changed file.
+
+    :param dict sources: The scanned files, from `scan_sources`.
+    :param list changed: The changed files, relative to the project root.
+    :return: The affected test files, or None if a full run is needed.
+    :rtype: set[str] or None
+    """
+    if any(path.rsplit("/", 1)[-1] in FULL_RUN_FILES for path in changed):
+        return None
+
+    # Importing 'a.b.c' also runs 'a' and 'a.b', so it depends on them too.
+    importers = {}
+    for path, entry in sources.items():
+        for name in entry["imports"]:
+            parts = name.split(".")
+            for end in range(1, len(parts) + 1):
+                importers.setdefault(".".join(parts[:end]), set()).add(path)
+
+    # Deleted files are still followed by name, so their importers run too.
+    affected = {path for path in changed if path.endswith(".py")}
+    pending = [name for path in affected for name in module_names(path)]
+    while pending:
+        for path in importers.get(pending.pop(), ()):
+            if path not in affected:
+                affected.add(path)
+                pending.extend(module_names(path))
+    return {path for path in affected if is_test_file(path)}
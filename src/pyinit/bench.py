@@ -0,0 +1,407 @@
+# Copyright (c) 2025 mrbooo895.
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""
+Implements the 'bench' command for the pyinit command-line tool.
+
+'pyinit bench' discovers the `bench_*` functions in `benchmarks/bench_*.py`
+and times each of them in a fresh process of the venv's interpreter, through
+a bootstrap shipped in `pyinit/_bootstrap`: a warmup, a calibration of how
+many calls make one round long enough to time reliably, then a series of
+timed rounds. The mean, standard deviation, percentiles and operations per
+second of every benchmark are appended to `.pyinit/bench/history.jsonl`
+under the current git commit, and `--compare <ref>` checks the new results
+against those recorded for another commit, exiting non-zero when a benchmark
+slowed down past the configured threshold.
+"""
+
+import ast
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from fnmatch import fnmatch
+from pathlib import Path
+
+from rich.console import Console
+
+from .info import run_command
+from .metadata import get_venv_python_version
+from .profiling import get_bootstrap
+from .utils import (
+    check_platform,
+    check_project_root,
+    check_venv_exists,
+    find_project_root,
+    get_pyinit_config,
+)
+from .wrappers import error_handling
+
+BENCH_DIR = Path(".pyinit") / "bench"
+HISTORY_FILE = "history.jsonl"
+
+
+def get_bench_config(project_root: Path) -> dict:
+    """
+    Reads the `[tool.pyinit.bench]` settings, filling in the defaults.
+
+    :param Path project_root: The root directory of the project.
+    :rtype: dict
+    :raises ValueError: If `repeat` is not a positive integer or `min-time`
+                        is not a positive number.
+    """
+    config = {"warmup": 0.1, "min-time": 0.05, "repeat": 20, "threshold": 10.0}
+    config.update(get_pyinit_config(project_root).get("bench", {}))
+    # Booleans are ints to Python, but never a sensible setting here.
+    repeat, min_time = config["repeat"], config["min-time"]
+    if type(repeat) is not int or repeat < 1:
+        raise ValueError(
+            "The bench setting 'repeat' in pyproject.toml must be an integer "
+            f"of at least 1 (got {repeat!r})"
+        )
+    if type(min_time) not in (int, float) or min_time <= 0:
+        raise ValueError(
+            "The bench setting 'min-time' in pyproject.toml must be a positive "
+            f"number of seconds (got {min_time!r})"
+        )
+    return config
+
+
+def discover_benchmarks(
+    benchmarks_dir: Path, pattern: str | None = None
+) -> list[tuple]:
+    """
+    Finds the benchmark functions without importing anything.
+
+    A benchmark is a top-level function named `bench_*`, taking no required
+    arguments, in a file named `bench_*.py`.
+
+    :param Path benchmarks_dir: The project's `benchmarks/` directory.
+    :param str, optional pattern: A glob matched against 'file.py::function'
+                                  or the bare function name.
+    :return: (file, function name) pairs in file and definition order.
+    :rtype: list[tuple]
+    """
+    found = []
+    for path in sorted(benchmarks_dir.rglob("bench_*.py")):
+        tree = ast.parse(path.read_bytes(), filename=str(path))
+        for node in tree.body:
+            if not isinstance(node, ast.FunctionDef):
+                continue
+            if not node.name.startswith("bench_"):
+                continue
+            arguments = node.args
+            if len(arguments.args) > len(arguments.defaults) or any(
+                default is None for default in arguments.kw_defaults
+            ):
+                continue
+            key = f"{path.relative_to(benchmarks_dir).as_posix()}::{node.name}"
+            if pattern and not (fnmatch(key, pattern) or fnmatch(node.name, pattern)):
+                continue
+            found.append((path, node.name))
+    return found
+
+
+def summarize(timings: list[float], loops: int) -> dict:
+    """
+    Computes the statistics recorded for one benchmark.
+
+    :param list timings: Seconds per call of each timed round.
+    :param int loops: Calls per round.
+    :rtype: dict
+    """
+    quantiles = (
+        statistics.quantiles(timings, n=100, method="inclusive")
+        if len(timings) > 1
+        else [timings[0]] * 99
+    )
+    mean = statistics.fmean(timings)
+    return {
+        "mean": mean,
+        "stdev": statistics.stdev(timings) if len(timings) > 1 else 0.0,
+        "min": min(timings),
+        "median": statistics.median(timings),
+        "p95": quantiles[94],
+        "p99": quantiles[98],
+        "ops": 1 / mean if mean else 0.0,
+        "rounds": len(timings),
+        "loops": loops,
+    }
+
+
+def run_benchmark(
+    python_executable: Path, path: Path, name: str, config: dict, extra_path: list[Path]
+) -> dict | str:
+    """
+    Times one benchmark in a fresh interpreter process.
+
+    :param Path python_executable: The venv's Python interpreter.
+    :param Path path: The benchmark file.
+    :param str name: The benchmark function.
+    :param dict config: The bench settings.
+    :param list extra_path: Directories the benchmark can import from.
+    :return: The summarized results, or the error output if the run failed.
+    :rtype: dict or str
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        output = Path(temp_dir) / "result.json"
+        env = {
+            **os.environ,
+            "PYINIT_BENCH_OUTPUT": str(output),
+            "PYINIT_BENCH_WARMUP": str(config["warmup"]),
+            "PYINIT_BENCH_MIN_TIME": str(config["min-time"]),
+            "PYINIT_BENCH_REPEAT": str(config["repeat"]),
+            "PYINIT_BENCH_PATH": os.pathsep.join(str(p) for p in extra_path),
+        }
+        result = subprocess.run(
+            [
+                str(python_executable),
+                str(get_bootstrap("pyinit_bench")),
+                str(path),
+                name,
+            ],
+            env=env,
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode != 0 or not output.exists():
+            return result.stderr.strip() or f"exited with code {result.returncode}"
+        data = json.loads(output.read_text(encoding="utf-8"))
+    return summarize(data["timings"], data["loops"])
+
+
+def get_git_revision(project_root: Path) -> tuple[str | None, bool]:
+    """
+    Returns the current git commit and whether tracked files have changes.
+
+    :param Path project_root: The root directory of the project.
+    :rtype: tuple[str | None, bool]
+    """
+    commit = run_command(["git", "rev-parse", "HEAD"], project_root)
+    status = run_command(
+        ["git", "status", "--porcelain", "--untracked-files=no"], project_root
+    )
+    return commit, bool(status)
+
+
+def read_history(project_root: Path) -> list[dict]:
+    """
+    Reads every recorded benchmark run, oldest first.
+
+    :param Path project_root: The root directory of the project.
+    :rtype: list[dict]
+    """
+    history_path = project_root / BENCH_DIR / HISTORY_FILE
+    if not history_path.exists():
+        return []
+    entries = []
+    for line in history_path.read_text(encoding="utf-8").splitlines():
+        try:
+            entries.append(json.loads(line))
+        except json.JSONDecodeError:
+            continue
+    return entries
+
+
+def append_history(project_root: Path, entry: dict):
+    """
+    Appends one benchmark run to the history file.
+
+    :param Path project_root: The root directory of the project.
+    :param dict entry: The run's metadata and results.
+    """
+    history_path = project_root / BENCH_DIR / HISTORY_FILE
+    history_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(history_path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(entry, sort_keys=True) + "\n")
+
+
+def find_baseline(history: list[dict], commit: str) -> dict | None:
+    """
+    Returns the latest results recorded for a commit.
+
+    Runs made with uncommitted changes are only used when there is no clean
+    run of the commit.
+
+    :param list history: The recorded runs, oldest first.
+    :param str commit: The full commit hash.
+    :rtype: dict or None
+    """
+    runs = [entry for entry in history if entry.get("commit") == commit]
+    clean = [entry for entry in runs if not entry.get("dirty")]
+    return (clean or runs or [None])[-1]
+
+
+def compare_results(results: dict, baseline: dict, threshold: float) -> list[tuple]:
+    """
+    Compares the mean time of each benchmark with a baseline.
+
+    :param dict results: The new results, keyed by benchmark.
+    :param dict baseline: The baseline results, keyed by benchmark.
+    :param float threshold: The allowed slowdown, in percent.
+    :return: (benchmark, baseline mean, new mean, change in percent,
+             regressed) for every benchmark present in both.
+    :rtype: list[tuple]
+    """
+    rows = []
+    for key, stats in results.items():
+        if key not in baseline or not baseline[key]["mean"]:
+            continue
+        change = (stats["mean"] / baseline[key]["mean"] - 1) * 100
+        old = baseline[key]["mean"]
+        rows.append((key, old, stats["mean"], change, change > threshold))
+    return rows
+
+
+def _format_seconds(seconds: float) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
+
+
+@error_handling
+def run_benchmarks(
+    pattern: str | None = None,
+    compare: str | None = None,
+    threshold: float | None = None,
+    save: bool = True,
+):
+    """
+    Runs the project's benchmarks and records the results.
+
+    This function serves as the entry point for the 'pyinit bench' command.
+
+    :param str, optional pattern: Runs only the benchmarks matching this glob.
+    :param str, optional compare: A git ref whose recorded results the new
+                                  ones are compared with.
+    :param float, optional threshold: The allowed slowdown in percent,
+                                      overriding the `threshold` setting.
+    :param bool save: If False, the results are not added to the history.
+    :raises SystemExit: If not run within a valid project, if the venv is
+                        missing, if a benchmark fails, or if a benchmark
+                        slowed down past the threshold.
+    """
+    console = Console()
+    project_root = find_project_root()
+
+    # --- Pre-flight Checks ---
+    check_project_root(project_root)
+    venv_dir = project_root / "venv"
+    check_venv_exists(venv_dir)
+    _, python_executable = check_platform(venv_dir)
+
+    benchmarks_dir = project_root / "benchmarks"
+    benchmarks = []
+    if benchmarks_dir.is_dir():
+        benchmarks = discover_benchmarks(benchmarks_dir, pattern)
+    if not benchmarks:
+        console.print(
+            "[bold yellow][INFO][/bold yellow] No benchmarks found in "
+            "'benchmarks/bench_*.py'. Nothing to run."
+        )
+        sys.exit(0)
+
+    config = get_bench_config(project_root)
+    if threshold is not None:
+        config["threshold"] = threshold
+
+    # The baseline is resolved first, so a bad ref fails before the long part.
+    baseline = None
+    if compare:
+        baseline_commit = run_command(
+            ["git", "rev-parse", "--verify", f"{compare}^{{commit}}"], project_root
+        )
+        if baseline_commit is None:
+            console.print(f"[bold red][ERROR][/bold red] Unknown git ref '{compare}'.")
+            sys.exit(1)
+        baseline = find_baseline(read_history(project_root), baseline_commit)
+        if baseline is None:
+            console.print(
+                f"[bold red][ERROR][/bold red] No benchmark results recorded for "
+                f"'{compare}' ({baseline_commit[:12]}). Check it out and run "
+                "'pyinit bench' first."
+            )
+            sys.exit(1)
+
+    # --- Run the Benchmarks ---
+    console.print(
+        f"[bold green] Benchmarking[/bold green] {len(benchmarks)} function(s)"
+    )
+    extra_path = [path for path in [project_root / "src"] if path.is_dir()]
+    keys = [
+        f"{path.relative_to(benchmarks_dir).as_posix()}::{name}"
+        for path, name in benchmarks
+    ]
+    width = max(len(key) for key in keys)
+    results = {}
+    failed = False
+    for (path, name), key in zip(benchmarks, keys):
+        outcome = run_benchmark(python_executable, path, name, config, extra_path)
+        if isinstance(outcome, str):
+            failed = True
+            console.print(
+                f"[bold red]FAILED[/bold red] {key}\n{outcome}", highlight=False
+            )
+            continue
+        results[key] = outcome
+        console.print(
+            f"  {key:<{width}}  {_format_seconds(outcome['mean']):>10} "
+            f"± {_format_seconds(outcome['stdev']):>10}  "
+            f"p95 {_format_seconds(outcome['p95']):>10}  "
+            f"{outcome['ops']:>12,.0f} ops/s",
+            highlight=False,
+            soft_wrap=True,
+        )
+
+    # --- Record the Results ---
+    commit, dirty = get_git_revision(project_root)
+    if save and results:
+        append_history(
+            project_root,
+            {
+                "commit": commit,
+                "dirty": dirty,
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+                "python": get_venv_python_version(venv_dir),
+                "results": results,
+            },
+        )
+        label = f"commit {commit[:12]}" if commit else "no commit"
+        if dirty:
+            label += ", with uncommitted changes"
+        console.print(
+            f"[bold green]Recorded[/bold green] results in "
+            f"'{(BENCH_DIR / HISTORY_FILE).as_posix()}' ({label})."
+        )
+
+    # --- Compare with the Baseline ---
+    regressed = False
+    if baseline is not None:
+        rows = compare_results(results, baseline["results"], config["threshold"])
+        console.print(
+            f"\n[bold]Compared with '{compare}'[/bold] "
+            f"(threshold {config['threshold']:g}% slower)"
+        )
+        for key, old, new, change, is_regression in rows:
+            color = "red" if is_regression else "green" if change < 0 else "default"
+            console.print(
+                f"  {key:<{width}}  {_format_seconds(old):>10} -> "
+                f"{_format_seconds(new):>10}  [{color}]{change:>+7.1f}%[/{color}]",
+                highlight=False,
+                soft_wrap=True,
+            )
+            regressed |= is_regression
+        if regressed:
+            console.print(
+                "[bold red][ERROR][/bold red] Some benchmarks slowed down "
+                "past the threshold."
+            )
+
+    if failed or regressed:
+        sys.exit(1)
@@ -16,6 +16,7 @@ import subprocess
 
 from rich.console import Console
 
+from .bytecode import compile_after_change
 from .utils import (
     check_platform,
     check_project_root,
@@ -37,6 +38,7 @@ def build_project():
        virtual environment to ensure a consistent build environment.
     3. Executes the build process using `python -m build`, which creates the
        packages in the `dist/` directory.
+    4. Byte-compiles `src/` with the configured settings (see 'pyinit compile').
 
     :raises SystemExit: If the command is not run within a valid project,
                         or if any of the build steps fail.
@@ -83,6 +85,9 @@ def build_project():
         capture_output=True,
     )
 
+    # --- Step 3: Precompile the Sources ---
+    compile_after_change(project_root, console)
+
     console.print(
         f"[bold green]\nSuccessfully[/bold green] built package '{project_name}'"
     )
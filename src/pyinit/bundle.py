@@ -0,0 +1,265 @@
+# Copyright (c) 2025 mrbooo895.
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""
+Implements the 'bundle' command for the pyinit command-line tool.
+
+'pyinit bundle' packages the project and its pinned dependencies into a
+single executable zipapp, `dist/<name>.pyz`. The dependencies (the 'main'
+group of `pyinit.lock`, or the pins of `requirements.txt`) are installed
+into a staging directory with `pip install --target`, everything is
+byte-compiled ahead of time, and a generated `__main__.py` runs the
+project's `main.py` the same way 'pyinit run' does. Because zipimport cannot
+load native extensions, an extract-to-cache mode unpacks the bundle once
+into a per-user cache directory and runs it from there.
+"""
+
+import hashlib
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import zipapp
+from pathlib import Path
+
+from packaging.markers import Marker
+from rich.console import Console
+
+from .bytecode import compile_paths
+from .lock import read_lock
+from .metadata import get_marker_environment
+from .utils import (
+    check_platform,
+    check_project_root,
+    check_venv_exists,
+    find_project_root,
+    get_project_name,
+    normalize_name,
+)
+from .wheelhouse import get_wheelhouse_dir, has_wheels, read_requirements
+from .wrappers import error_handling
+
+NATIVE_SUFFIXES = (".so", ".pyd", ".dylib")
+
+MAIN_TEMPLATE = '''\
+# Generated by 'pyinit bundle'. Do not edit.
+import os
+import runpy
+import sys
+
+BUNDLE_ID = {bundle_id!r}
+PACKAGE = {package!r}
+EXTRACT = {extract!r}
+
+
+def extract(archive):
+    """Unpacks the bundle once into the user cache and returns its path."""
+    import shutil
+    import tempfile
+    import zipfile
+
+    if os.environ.get("PYINIT_BUNDLE_CACHE"):
+        base = os.environ["PYINIT_BUNDLE_CACHE"]
+    elif sys.platform == "win32" and os.environ.get("LOCALAPPDATA"):
+        base = os.path.join(os.environ["LOCALAPPDATA"], "pyinit", "Cache", "bundles")
+    else:
+        cache = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+            os.path.expanduser("~"), ".cache"
+        )
+        base = os.path.join(cache, "pyinit", "bundles")
+
+    target = os.path.join(base, PACKAGE + "-" + BUNDLE_ID)
+    if not os.path.isdir(target):
+        os.makedirs(base, exist_ok=True)
+        temp = tempfile.mkdtemp(dir=base, prefix=".tmp-")
+        with zipfile.ZipFile(archive) as bundle:
+            members = [n for n in bundle.namelist() if not n.startswith("__main__.")]
+            bundle.extractall(temp, members)
+        try:
+            os.rename(temp, target)
+        except OSError:
+            # Another process extracted the same bundle first.
+            shutil.rmtree(temp, ignore_errors=True)
+    return target
+
+
+root = os.path.dirname(os.path.abspath(__file__))
+if EXTRACT:
+    root = extract(root)
+    sys.path[0] = root
+sys.path.insert(0, os.path.join(root, PACKAGE))
+runpy.run_module("main", run_name="__main__", alter_sys=True)
+'''
+
+
+def has_native_extensions(directory: Path) -> bool:
+    """
+    Tells whether a directory contains compiled extension modules.
+
+    :param Path directory: The directory to scan.
+    :rtype: bool
+    """
+    return any(
+        path.suffix in NATIVE_SUFFIXES or ".so." in path.name
+        for path in directory.rglob("*")
+        if path.is_file()
+    )
+
+
+def write_bundle(
+    staging: Path,
+    target: Path,
+    package: str,
+    python_executable: Path,
+    extract: bool = False,
+    interpreter: str = "/usr/bin/env python3",
+) -> Path:
+    """
+    Compiles a staging directory and writes it as an executable zipapp.
+
+    Bytecode is written with unchecked hashes, since a bundle never changes
+    after it is built. Without extraction it uses the legacy layout (next to
+    each source) which zipimport can load; extracted bundles keep the
+    `__pycache__` layout used by the regular import system.
+
+    :param Path staging: The directory holding the project and its dependencies.
+    :param Path target: The path of the archive to write.
+    :param str package: The project's package name (the directory holding main.py).
+    :param Path python_executable: The interpreter the bundle is compiled for.
+    :param bool extract: If True, the bundle unpacks itself into a cache on first run.
+    :param str interpreter: The shebang interpreter of the archive.
+    :return: The path of the written archive.
+    :rtype: Path
+    """
+    # The content of the bundle identifies its extraction directory.
+    digest = hashlib.sha256()
+    for path in sorted(p for p in staging.rglob("*") if p.is_file()):
+        digest.update(path.relative_to(staging).as_posix().encode("utf-8") + b"\0")
+        digest.update(path.read_bytes())
+    main_source = MAIN_TEMPLATE.format(
+        bundle_id=digest.hexdigest()[:16], package=package, extract=extract
+    )
+    (staging / "__main__.py").write_text(main_source, encoding="utf-8")
+
+    config = {"optimize": [0], "invalidation-mode": "unchecked-hash", "jobs": 0}
+    compile_paths(python_executable, [staging], {**config, "legacy": not extract})
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    zipapp.create_archive(staging, target, interpreter=interpreter, compressed=True)
+    return target
+
+
+@error_handling
+def bundle_project(extract: bool | None = None, interpreter: str | None = None):
+    """
+    Packages the project and its dependencies into a single zipapp.
+
+    This function serves as the entry point for the 'pyinit bundle' command.
+
+    :param bool, optional extract: Forces the extract-to-cache mode on or off.
+                                   By default it is enabled only when a
+                                   dependency ships native extensions.
+    :param str, optional interpreter: The shebang interpreter of the archive.
+    :raises SystemExit: If not run within a valid project, if the venv or the
+                        main file is missing, or if installing fails.
+    """
+    console = Console()
+    project_root = find_project_root()
+
+    # --- Pre-flight Checks ---
+    check_project_root(project_root)
+    venv_dir = project_root / "venv"
+    check_venv_exists(venv_dir)
+    pip_executable, python_executable = check_platform(venv_dir)
+
+    project_name = get_project_name(project_root) or project_root.name
+    package_dir = project_root / "src" / project_name
+    if not (package_dir / "main.py").exists():
+        console.print(
+            f"[bold red][ERROR][/bold red] Main file '{package_dir / 'main.py'}' was not found."
+        )
+        sys.exit(1)
+
+    # The runtime dependencies come from the lockfile's 'main' group when
+    # there is one, otherwise from the pins in requirements.txt.
+    packages = read_lock(project_root)
+    if packages is not None:
+        environment = get_marker_environment(venv_dir)
+        requirements = [
+            f"{package['name']}=={package['version']}"
+            for package in packages
+            if "main" in package.get("groups", [])
+            and (not package.get("markers") or Marker(package["markers"]).evaluate(environment))
+        ]
+    else:
+        requirements = read_requirements(project_root / "requirements.txt")
+    requirements = [
+        line
+        for line in requirements
+        if normalize_name(re.split(r"[\s\[<>=!~;@]", line, maxsplit=1)[0])
+        != normalize_name(project_name)
+    ]
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        staging = Path(temp_dir) / "bundle"
+        shutil.copytree(
+            package_dir, staging / project_name, ignore=shutil.ignore_patterns("__pycache__")
+        )
+
+        # --- Vendor the Dependencies ---
+        if requirements:
+            console.print(
+                f"[bold green]    Vendoring[/bold green] {len(requirements)} dependencies"
+            )
+            requirements_file = Path(temp_dir) / "requirements.txt"
+            requirements_file.write_text("\n".join(requirements) + "\n", encoding="utf-8")
+            source_args = []
+            wheelhouse = get_wheelhouse_dir(project_root)
+            if has_wheels(wheelhouse):
+                source_args = ["--find-links", str(wheelhouse)]
+            subprocess.run(
+                [
+                    str(pip_executable),
+                    "install",
+                    "--no-compile",
+                    "--no-deps",
+                    "--target",
+                    str(staging),
+                    "-r",
+                    str(requirements_file),
+                ]
+                + source_args,
+                check=True,
+                capture_output=True,
+            )
+            # Console scripts point at the staging interpreter and are useless here.
+            shutil.rmtree(staging / "bin", ignore_errors=True)
+
+        if extract is None:
+            extract = has_native_extensions(staging)
+            if extract:
+                console.print(
+                    "[bold yellow][INFO][/] Native extensions found, the bundle "
+                    "will extract itself to a cache directory on first run."
+                )
+
+        # --- Write the Archive ---
+        target = project_root / "dist" / f"{project_name}.pyz"
+        console.print(f"[bold green]     Bundling[/bold green] package '{project_name}'")
+        write_bundle(
+            staging,
+            target,
+            project_name,
+            python_executable,
+            extract,
+            interpreter or "/usr/bin/env python3",
+        )
+
+    size = target.stat().st_size / (1024 * 1024)
+    console.print(
+        f"[bold green]Successfully[/bold green] bundled '{project_name}' into "
+        f"'dist/{target.name}' ({size:.1f} MiB)."
+    )
@@ -0,0 +1,187 @@
+# Copyright (c) 2025 mrbooo895.
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""
+Implements the 'compile' command for the pyinit command-line tool.
+
+This module byte-compiles the project's `src/` directory and the venv's
+site-packages ahead of time with the venv's own interpreter, so the first
+start after an install or a deploy does not pay for `.pyc` generation. The
+work is spread over a pool of worker processes by `compileall`, and the
+optimization levels and invalidation mode (timestamp, or checked/unchecked
+hashes for reproducible images) are configurable in the
+`[tool.pyinit.compile]` table of `pyproject.toml`. The same helpers run
+automatically after 'install', 'sync' and 'build'.
+"""
+
+import subprocess
+from importlib.metadata import Distribution
+from pathlib import Path, PurePosixPath
+
+from rich.console import Console
+
+from .metadata import get_installed_distributions, get_site_packages
+from .utils import (
+    check_platform,
+    check_project_root,
+    check_venv_exists,
+    find_project_root,
+    get_pyinit_config,
+)
+from .wrappers import error_handling
+
+INVALIDATION_MODES = ("timestamp", "checked-hash", "unchecked-hash")
+
+
+def get_compile_config(project_root: Path) -> dict:
+    """
+    Reads the `[tool.pyinit.compile]` settings, filling in the defaults.
+
+    :param Path project_root: The root directory of the project.
+    :rtype: dict
+    """
+    config = {"optimize": [0], "invalidation-mode": "timestamp", "jobs": 0, "auto": True}
+    config.update(get_pyinit_config(project_root).get("compile", {}))
+    if isinstance(config["optimize"], int):
+        config["optimize"] = [config["optimize"]]
+    return config
+
+
+def compile_paths(python_executable: Path, paths: list[Path], config: dict) -> bool:
+    """
+    Byte-compiles files and directories with the venv's interpreter.
+
+    :param Path python_executable: The venv's Python interpreter.
+    :param list paths: The files and directories to compile.
+    :param dict config: The compile settings.
+    :return: True if every file compiled successfully.
+    :rtype: bool
+    """
+    if not paths:
+        return True
+
+    cmd = [str(python_executable), "-m", "compileall", "-q", "-j", str(config["jobs"])]
+    for level in sorted(set(config["optimize"])):
+        cmd += ["-o", str(level)]
+    cmd += ["--invalidation-mode", config["invalidation-mode"]]
+    if config.get("legacy"):
+        # Writes 'module.pyc' next to each source, as zipimport expects.
+        cmd.append("-b")
+    result = subprocess.run(
+        cmd + [str(path) for path in sorted(paths)], capture_output=True
+    )
+    return result.returncode == 0
+
+
+def get_distribution_paths(dist: Distribution, site_packages: Path) -> set[Path]:
+    """
+    Lists the top-level paths a distribution installed into site-packages.
+
+    :param Distribution dist: The installed distribution.
+    :param Path site_packages: The venv's site-packages directory.
+    :rtype: set[Path]
+    """
+    paths = set()
+    for file in dist.files or []:
+        parts = PurePosixPath(str(file)).parts
+        if not parts or parts[0] == ".." or parts[0].endswith((".dist-info", ".data")):
+            continue
+        if len(parts) == 1 and not parts[0].endswith(".py"):
+            continue
+        paths.add(site_packages / parts[0])
+    return paths
+
+
+def compile_after_change(
+    project_root: Path,
+    console: Console,
+    before: dict[str, str] | None = None,
+    include_src: bool = True,
+):
+    """
+    Precompiles what a command just changed, unless disabled by `auto = false`.
+
+    :param Path project_root: The root directory of the project.
+    :param Console console: The rich Console instance for printing messages.
+    :param dict, optional before: Normalized name to installed version, taken
+                                  before the change. Only distributions added
+                                  or changed since are compiled.
+    :param bool include_src: If True, also compiles the project's `src/`.
+    """
+    config = get_compile_config(project_root)
+    if not config["auto"]:
+        return
+
+    venv_dir = project_root / "venv"
+    _, python_executable = check_platform(venv_dir)
+    paths = set()
+    site_packages = get_site_packages(venv_dir)
+    if before is not None and site_packages is not None:
+        for name, dist in get_installed_distributions(venv_dir).items():
+            if before.get(name) != dist.version:
+                paths |= get_distribution_paths(dist, site_packages)
+    if include_src and (project_root / "src").is_dir():
+        paths.add(project_root / "src")
+
+    paths = {path for path in paths if path.exists()}
+    if paths:
+        console.print(
+            f"[bold green]    Compiling[/bold green] {len(paths)} path(s) to bytecode"
+        )
+        compile_paths(python_executable, sorted(paths), config)
+
+
+@error_handling
+def compile_project(
+    optimize: list[int] | None = None,
+    invalidation_mode: str | None = None,
+    src_only: bool = False,
+):
+    """
+    Byte-compiles the project's sources and its venv's site-packages.
+
+    This function serves as the entry point for the 'pyinit compile' command.
+    Command-line options override the `[tool.pyinit.compile]` settings.
+
+    :param list, optional optimize: The optimization levels to compile for.
+    :param str, optional invalidation_mode: 'timestamp', 'checked-hash' or
+                                            'unchecked-hash'.
+    :param bool src_only: If True, leaves site-packages alone.
+    :raises SystemExit: If not run within a valid project or if the virtual
+                        environment is not found.
+    """
+    console = Console()
+    project_root = find_project_root()
+
+    # --- Pre-flight Checks ---
+    check_project_root(project_root)
+    venv_dir = project_root / "venv"
+    check_venv_exists(venv_dir)
+    _, python_executable = check_platform(venv_dir)
+
+    config = get_compile_config(project_root)
+    if optimize:
+        config["optimize"] = optimize
+    if invalidation_mode:
+        config["invalidation-mode"] = invalidation_mode
+
+    paths = []
+    if (project_root / "src").is_dir():
+        paths.append(project_root / "src")
+    site_packages = get_site_packages(venv_dir)
+    if not src_only and site_packages is not None:
+        paths.append(site_packages)
+
+    levels = ", ".join(str(level) for level in sorted(set(config["optimize"])))
+    console.print(
+        f"[bold green]    Compiling[/bold green] {len(paths)} tree(s) "
+        f"(optimization {levels}, {config['invalidation-mode']})"
+    )
+    if not compile_paths(python_executable, paths, config):
+        console.print(
+            "[bold yellow][WARNING][/bold yellow] Some files could not be compiled "
+            "(often test data with intentionally invalid syntax)."
+        )
+    console.print("[bold green]Successfully[/bold green] compiled project bytecode.")
@@ -0,0 +1,173 @@
+# Copyright (c) 2025 mrbooo895.
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""
+Provides a user-level, on-disk cache of package index responses.
+
+Index responses (Simple API project pages and JSON metadata) are stored in
+the user's cache directory keyed by URL, so that every project on the machine
+shares them. Entries younger than the configured TTL are answered without any
+network access; older entries are revalidated with their ETag and
+Last-Modified headers. In offline mode every lookup is answered purely from
+the cache.
+"""
+
+import hashlib
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+from .utils import get_pyinit_config, write_atomic
+
+DEFAULT_INDEX_CACHE_TTL = 600
+
+
+class OfflineCacheMiss(Exception):
+    """Raised when a URL is requested in offline mode but is not cached."""
+
+
+def get_cache_dir() -> Path:
+    """
+    Determines pyinit's user-level cache directory.
+
+    The `PYINIT_CACHE_DIR` environment variable takes precedence, followed by
+    the platform's conventional cache location.
+
+    :return: The path of the cache directory (it may not exist yet).
+    :rtype: Path
+    """
+    if os.environ.get("PYINIT_CACHE_DIR"):
+        return Path(os.environ["PYINIT_CACHE_DIR"])
+    if sys.platform == "win32" and os.environ.get("LOCALAPPDATA"):
+        return Path(os.environ["LOCALAPPDATA"]) / "pyinit" / "Cache"
+    if sys.platform == "darwin":
+        return Path.home() / "Library" / "Caches" / "pyinit"
+    xdg_cache = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(xdg_cache) / "pyinit"
+
+
+def get_index_cache_ttl(project_root: Path | None) -> int:
+    """
+    Determines how long cached index responses are used without revalidation.
+
+    The `index-cache-ttl` setting in `[tool.pyinit]` takes precedence, followed
+    by the `PYINIT_INDEX_CACHE_TTL` environment variable.
+
+    :param Path project_root: The root directory of the project, if any.
+    :return: The time-to-live of cached responses, in seconds.
+    :rtype: int
+    """
+    config = get_pyinit_config(project_root) if project_root else {}
+    ttl = config.get("index-cache-ttl", os.environ.get("PYINIT_INDEX_CACHE_TTL"))
+    return int(ttl) if ttl is not None else DEFAULT_INDEX_CACHE_TTL
+
+
+class IndexCache:
+    """
+    An on-disk cache of index responses, keyed by URL.
+
+    Each entry is stored as a JSON metadata file (status, validators and
+    fetch time) next to a file holding the raw response body.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path | None = None,
+        ttl: int = DEFAULT_INDEX_CACHE_TTL,
+        offline: bool = False,
+    ):
+        """
+        :param Path, optional cache_dir: The cache root. Defaults to `get_cache_dir()`.
+        :param int ttl: Seconds during which an entry is used without revalidation.
+        :param bool offline: If True, never touch the network.
+        """
+        self.directory = (cache_dir or get_cache_dir()) / "index"
+        self.ttl = ttl
+        self.offline = offline
+
+    def _paths(self, url: str) -> tuple[Path, Path]:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        base = self.directory / key[:2] / key
+        return base.with_suffix(".json"), base.with_suffix(".body")
+
+    def get(self, url: str) -> dict | None:
+        """
+        Looks up the cached response for a URL.
+
+        :param str url: The URL of the response.
+        :return: The entry's metadata with its `body` as bytes, or None.
+        :rtype: dict or None
+        """
+        meta_path, body_path = self._paths(url)
+        try:
+            entry = json.loads(meta_path.read_bytes())
+            entry["body"] = body_path.read_bytes() if entry["status"] == 200 else b""
+        except (OSError, ValueError, KeyError):
+            return None
+        return entry
+
+    def is_fresh(self, entry: dict) -> bool:
+        """
+        Tells whether an entry can be used without revalidation.
+
+        :param dict entry: An entry returned by `get`.
+        :rtype: bool
+        """
+        return self.offline or time.time() - entry["fetched_at"] < self.ttl
+
+    def store(
+        self,
+        url: str,
+        status: int,
+        body: bytes = b"",
+        content_type: str = "",
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ):
+        """
+        Stores a response for a URL, replacing any previous entry.
+
+        :param str url: The URL of the response.
+        :param int status: The HTTP status (200, or 404 for unknown projects).
+        :param bytes body: The response body.
+        :param str content_type: The response's Content-Type header.
+        :param str, optional etag: The response's ETag header.
+        :param str, optional last_modified: The response's Last-Modified header.
+        """
+        meta_path, body_path = self._paths(url)
+        entry = {
+            "url": url,
+            "status": status,
+            "content_type": content_type,
+            "etag": etag,
+            "last_modified": last_modified,
+            "fetched_at": time.time(),
+        }
+        try:
+            # The body is written first so a metadata file never points to
+            # a missing or stale body.
+            if status == 200:
+                write_atomic(body_path, body)
+            write_atomic(meta_path, json.dumps(entry).encode("utf-8"))
+        except OSError:
+            pass
+
+    def touch(self, url: str, entry: dict):
+        """
+        Marks a revalidated entry as fresh again.
+
+        :param str url: The URL of the response.
+        :param dict entry: The entry returned by `get`.
+        """
+        self.store(
+            url,
+            entry["status"],
+            entry["body"],
+            entry["content_type"],
+            entry.get("etag"),
+            entry.get("last_modified"),
+        )
@@ -122,6 +122,9 @@ build/
 # Test artifacts
 .pytest_cache/
 .coverage
+
+# pyinit caches
+.pyinit/
 """
         (project_root / ".gitignore").write_text(gitignore_content.strip())
 
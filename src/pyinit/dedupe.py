@@ -0,0 +1,271 @@
+# Copyright (c) 2025 mrbooo895.
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""
+Implements the 'venv dedupe' and 'venv du' commands.
+
+'pyinit venv dedupe' hashes the files under a venv's site-packages into a
+content-addressed store in the user cache directory and replaces duplicates
+with hardlinks to the stored copy, so identical packages installed in many
+projects share a single copy on disk and in the page cache. Stored files are
+made read-only so that an accidental in-place edit cannot silently change
+every venv at once, and files that were modified after being linked anyway
+are detected on the next run and dropped from the store. 'pyinit venv du'
+reports the logical size of a venv against the space it actually uses.
+"""
+
+import errno
+import hashlib
+import json
+import os
+import stat
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from rich.console import Console
+
+from .cache import get_cache_dir
+from .metadata import get_site_packages
+from .utils import write_atomic
+
+DEDUPE_INDEX = Path(".pyinit") / "dedupe.json"
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass
+class DedupeResult:
+    """Summary of a deduplication run."""
+
+    linked: int = 0
+    saved: int = 0
+    stored: int = 0
+    modified: list[str] = field(default_factory=list)
+    cross_device: bool = False
+
+
+def get_store_dir() -> Path:
+    """
+    Determines the content-addressed store shared by all venvs.
+
+    :rtype: Path
+    """
+    return get_cache_dir() / "store"
+
+
+def hash_file(path: Path) -> str:
+    """
+    Computes the SHA-256 digest of a file.
+
+    :param Path path: The file to hash.
+    :rtype: str
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _replace_with_link(source: Path, target: Path):
+    # The link is created next to the target and renamed over it, so the
+    # target is never missing, even if the process is interrupted.
+    temp = target.with_name(f".pyinit-dedupe-{target.name}")
+    temp.unlink(missing_ok=True)
+    os.link(source, temp)
+    try:
+        os.replace(temp, target)
+    except BaseException:
+        temp.unlink(missing_ok=True)
+        raise
+
+
+def dedupe_directory(directory: Path, store_dir: Path, index_path: Path) -> DedupeResult:
+    """
+    Replaces the files of a directory with hardlinks into the store.
+
+    The index records the digest, size, modification time and inode of every
+    file linked on the previous run, so unchanged files are not hashed again
+    and linked files that changed in place are detected.
+
+    :param Path directory: The directory to deduplicate (usually site-packages).
+    :param Path store_dir: The content-addressed store.
+    :param Path index_path: The per-venv index of linked files.
+    :return: A summary of the run.
+    :rtype: DedupeResult
+    """
+    try:
+        index = json.loads(index_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        index = {}
+
+    result = DedupeResult()
+    new_index = {}
+    to_hash = []
+    for root, _, files in os.walk(directory):
+        for name in files:
+            path = Path(root) / name
+            st = path.lstat()
+            if not stat.S_ISREG(st.st_mode) or st.st_size == 0:
+                continue
+            relative = path.relative_to(directory).as_posix()
+            record = index.get(relative)
+            if record and record[3] == st.st_ino:
+                stored = store_dir / record[0][:2] / record[0]
+                if (record[1], record[2]) == (st.st_size, st.st_mtime_ns):
+                    new_index[relative] = record
+                    continue
+                # The shared copy was written to in place: every venv linked
+                # to it now sees the change, so it must not be handed out again.
+                result.modified.append(relative)
+                if stored.exists() and stored.stat().st_ino == st.st_ino:
+                    stored.unlink()
+            to_hash.append((path, relative))
+
+    with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+        digests = executor.map(lambda item: hash_file(item[0]), to_hash)
+        for (path, relative), digest in zip(to_hash, digests):
+            if result.cross_device:
+                break
+            stored = store_dir / digest[:2] / digest
+            try:
+                try:
+                    stored_st = stored.stat()
+                except FileNotFoundError:
+                    stored.parent.mkdir(parents=True, exist_ok=True)
+                    os.link(path, stored)
+                    stored_st = stored.stat()
+                    os.chmod(stored, stat.S_IMODE(stored_st.st_mode) & ~0o222)
+                    result.stored += 1
+                else:
+                    if stored_st.st_ino != path.lstat().st_ino:
+                        _replace_with_link(stored, path)
+                        result.linked += 1
+                        result.saved += stored_st.st_size
+            except FileExistsError:
+                # Another venv stored the same content concurrently.
+                continue
+            except OSError as e:
+                if e.errno == errno.EXDEV:
+                    result.cross_device = True
+                    break
+                if e.errno == errno.EMLINK:
+                    continue
+                raise
+            st = path.lstat()
+            new_index[relative] = [digest, st.st_size, st.st_mtime_ns, st.st_ino]
+
+    write_atomic(index_path, json.dumps(new_index).encode("utf-8"))
+    return result
+
+
+def prune_store(store_dir: Path) -> int:
+    """
+    Removes stored files that no venv links to anymore.
+
+    :param Path store_dir: The content-addressed store.
+    :return: The number of bytes freed.
+    :rtype: int
+    """
+    freed = 0
+    if not store_dir.is_dir():
+        return freed
+    for shard in store_dir.iterdir():
+        if not shard.is_dir():
+            continue
+        for entry in os.scandir(shard):
+            st = entry.stat(follow_symlinks=False)
+            if st.st_nlink == 1:
+                os.unlink(entry.path)
+                freed += st.st_size
+    return freed
+
+
+def measure_directory(directory: Path) -> tuple[int, int, int, int]:
+    """
+    Measures the disk usage of a directory, counting hardlinks once.
+
+    :param Path directory: The directory to measure.
+    :return: The number of files, their logical size, the size of the
+             distinct inodes, and the part of it shared with other paths
+             outside the directory.
+    :rtype: tuple[int, int, int, int]
+    """
+    files = logical = actual = shared = 0
+    seen = {}
+    for root, _, names in os.walk(directory):
+        for name in names:
+            st = os.lstat(os.path.join(root, name))
+            if not stat.S_ISREG(st.st_mode):
+                continue
+            files += 1
+            logical += st.st_size
+            key = (st.st_dev, st.st_ino)
+            seen[key] = seen.get(key, 0) + 1
+            if seen[key] == 1:
+                actual += st.st_size
+                if st.st_nlink > 1:
+                    shared += st.st_size
+    return files, logical, actual, shared
+
+
+def _format_size(size: int) -> str:
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if size < 1024 or unit == "GiB":
+            return f"{size:.1f} {unit}" if unit != "B" else f"{size} B"
+        size /= 1024
+
+
+def dedupe_virtual_env(console: Console, venv_dir: Path):
+    """
+    Handles the 'pyinit venv dedupe' command.
+
+    :param Console console: The rich Console instance for output.
+    :param Path venv_dir: The project's virtual environment.
+    """
+    site_packages = get_site_packages(venv_dir)
+    if site_packages is None:
+        console.print("[bold red][ERROR][/bold red] No site-packages found in 'venv'.")
+        return
+
+    store_dir = get_store_dir()
+    console.print(f"[bold green]  Deduplicating[/bold green] site-packages into '{store_dir}'")
+    result = dedupe_directory(site_packages, store_dir, venv_dir.parent / DEDUPE_INDEX)
+    freed = prune_store(store_dir)
+
+    for relative in result.modified:
+        console.print(
+            f"[bold yellow][WARNING][/bold yellow] '{relative}' was modified after "
+            "deduplication; the change is visible in every venv sharing it."
+        )
+    if result.cross_device:
+        console.print(
+            "[bold yellow][WARNING][/bold yellow] The store is on a different filesystem "
+            "than the venv, so files cannot be hardlinked.\n"
+            "[green]->[/] Set PYINIT_CACHE_DIR to a directory on the same filesystem."
+        )
+    console.print(
+        f"[bold green]Successfully[/bold green] linked {result.linked} file(s), "
+        f"saving {_format_size(result.saved)} ({result.stored} new file(s) stored, "
+        f"{_format_size(freed)} pruned from the store)."
+    )
+
+
+def report_disk_usage(console: Console, venv_dir: Path):
+    """
+    Handles the 'pyinit venv du' command.
+
+    :param Console console: The rich Console instance for output.
+    :param Path venv_dir: The project's virtual environment.
+    """
+    files, logical, actual, shared = measure_directory(venv_dir)
+    console.print(f"{'Files':<10}  {files}", highlight=False)
+    console.print(f"{'Logical':<10}  {_format_size(logical)}", highlight=False)
+    console.print(f"{'Actual':<10}  {_format_size(actual)}", highlight=False)
+    console.print(
+        f"{'Shared':<10}  {_format_size(shared)} (hardlinked with other venvs or the store)",
+        highlight=False,
+    )
+    console.print(f"{'Exclusive':<10}  {_format_size(actual - shared)}", highlight=False)
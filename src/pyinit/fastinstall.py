@@ -0,0 +1,539 @@
+# Copyright (c) 2025 mrbooo895.
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""
+Implements the direct wheel installer behind 'pyinit install --fast'.
+
+For requirements that are already resolved in `requirements.txt` and whose
+wheels are present in the local wheelhouse, pyinit installs the wheels itself
+instead of running pip: wheels are unpacked in parallel on a thread pool
+straight into the venv's site-packages, with their `RECORD`, `INSTALLER` and
+console-script entry points written the same way pip would, and the installed
+sources are byte-compiled in parallel afterwards. Anything that cannot be
+served this way is handed back to the caller so it can fall back to pip.
+"""
+
+import base64
+import configparser
+import email
+import hashlib
+import os
+import shutil
+import sys
+import tempfile
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from importlib.metadata import Distribution
+from itertools import takewhile
+from pathlib import Path
+
+from packaging.requirements import InvalidRequirement, Requirement
+from packaging.tags import Tag
+from packaging.utils import parse_wheel_filename
+from packaging.version import Version
+from rich.console import Console
+
+from .bytecode import compile_paths, get_compile_config
+from .metadata import (
+    get_installed_distributions,
+    get_marker_environment,
+    get_site_packages,
+    get_supported_tags,
+    get_venv_python_version,
+)
+from .utils import check_platform, normalize_name
+from .wheelhouse import get_wheelhouse_dir, get_wheelhouse_index, read_requirements
+
+INSTALLER_NAME = "pyinit"
+SCHEMES = ("purelib", "platlib", "scripts", "headers", "data")
+
+SCRIPT_TEMPLATE = """#!{python}
+# -*- coding: utf-8 -*-
+import re
+import sys
+from {module} import {import_name}
+if __name__ == "__main__":
+    sys.argv[0] = re.sub(r"(-script\\.pyw|\\.exe)?$", "", sys.argv[0])
+    sys.exit({call})
+"""
+
+
+@dataclass
+class PlannedWheel:
+    """A wheel selected for direct installation."""
+
+    name: str
+    version: str
+    wheel: Path
+    requested: bool
+
+
+def read_pins(requirements_file: Path) -> dict[str, str]:
+    """
+    Reads the exact `name==version` pins of a requirements file.
+
+    :param Path requirements_file: The path of the requirements file.
+    :return: A mapping of normalized name to pinned version.
+    :rtype: dict[str, str]
+    """
+    pins = {}
+    for line in read_requirements(requirements_file):
+        try:
+            requirement = Requirement(line)
+        except InvalidRequirement:
+            continue
+        specifiers = list(requirement.specifier)
+        if len(specifiers) == 1 and specifiers[0].operator == "==":
+            pins[normalize_name(requirement.name)] = str(Version(specifiers[0].version))
+    return pins
+
+
+def select_wheel(wheels: list[Path], supported: list[Tag]) -> Path | None:
+    """
+    Picks the most specific wheel compatible with the target interpreter.
+
+    :param list wheels: Candidate wheels of a single project version.
+    :param list supported: The supported tags, most specific first.
+    :return: The best wheel, or None if none is compatible.
+    :rtype: Path or None
+    """
+    priority = {tag: rank for rank, tag in enumerate(supported)}
+    best, best_rank = None, len(priority)
+    for wheel in wheels:
+        ranks = [priority[tag] for tag in parse_wheel_filename(wheel.name)[3] if tag in priority]
+        if ranks and min(ranks) < best_rank:
+            best, best_rank = wheel, min(ranks)
+    return best
+
+
+def find_dist_info(archive: zipfile.ZipFile) -> str:
+    """
+    Finds the name of the `.dist-info` directory inside a wheel.
+
+    :param zipfile.ZipFile archive: The opened wheel.
+    :return: The directory name, e.g. 'rich-14.2.0.dist-info'.
+    :rtype: str
+    """
+    for name in archive.namelist():
+        top = name.split("/", 1)[0]
+        if top.endswith(".dist-info"):
+            return top
+    raise ValueError(f"'{archive.filename}' has no .dist-info directory")
+
+
+def split_member(filename: str, data_dir: str) -> tuple[str, list[str]]:
+    """
+    Maps a wheel member to its install scheme and path within that scheme.
+
+    Members outside the `.data` directory go to 'purelib'. Absolute names and
+    `..` segments are refused, as pip does, so that a wheel cannot write
+    outside of the venv.
+
+    :param str filename: The member's name in the archive.
+    :param str data_dir: The wheel's `.data` directory name.
+    :return: The scheme and the path segments relative to its root.
+    :rtype: tuple[str, list[str]]
+    :raises ValueError: If the name is unsafe or uses an unknown scheme.
+    """
+    parts = filename.split("/")
+    if os.path.isabs(filename) or ".." in parts or ":" in parts[0]:
+        raise ValueError(f"Wheel member '{filename}' points outside of its install scheme.")
+    if parts[0] != data_dir:
+        return "purelib", parts
+    scheme = parts[1] if len(parts) > 2 else ""
+    if scheme not in SCHEMES:
+        raise ValueError(
+            f"Wheel member '{filename}' uses an unknown install scheme '{scheme}'."
+        )
+    return parts[1], parts[2:]
+
+
+def check_wheel_members(wheel: Path):
+    """
+    Checks that every member of a wheel can be installed safely.
+
+    :param Path wheel: The path of the wheel.
+    :raises ValueError: If a member is unsafe or uses an unknown scheme.
+    """
+    with zipfile.ZipFile(wheel) as archive:
+        data_dir = find_dist_info(archive)[: -len(".dist-info")] + ".data"
+        for name in archive.namelist():
+            if not name.endswith("/"):
+                split_member(name, data_dir)
+
+
+def read_wheel_requirements(wheel: Path) -> list[Requirement]:
+    """
+    Reads the `Requires-Dist` entries from a wheel's metadata.
+
+    :param Path wheel: The path of the wheel.
+    :return: The declared requirements.
+    :rtype: list[Requirement]
+    """
+    with zipfile.ZipFile(wheel) as archive:
+        metadata = email.message_from_bytes(
+            archive.read(f"{find_dist_info(archive)}/METADATA")
+        )
+    return [Requirement(line) for line in metadata.get_all("Requires-Dist") or []]
+
+
+def plan_fast_install(
+    requirement: str,
+    pins: dict[str, str],
+    wheel_index: dict,
+    supported: list[Tag],
+    environment: dict[str, str],
+    installed: dict[str, Distribution],
+) -> list[PlannedWheel] | None:
+    """
+    Resolves a requirement and its dependencies against the pins and wheelhouse.
+
+    Every distribution reached from the requirement must be pinned in
+    `requirements.txt` and have a compatible wheel in the wheelhouse.
+    Distributions already installed at their pinned version are not planned.
+
+    :param str requirement: The requirement requested by the user.
+    :param dict pins: A mapping of normalized name to pinned version.
+    :param dict wheel_index: The wheelhouse index from `get_wheelhouse_index`.
+    :param list supported: The supported wheel tags, most specific first.
+    :param dict environment: The PEP 508 marker environment of the venv.
+    :param dict installed: The distributions currently installed in the venv.
+    :return: The wheels to install, or None if the requirement cannot be
+             served from the wheelhouse.
+    :rtype: list[PlannedWheel] or None
+    :raises ValueError: If a wheel has members that cannot be installed safely.
+    """
+    planned: dict[str, PlannedWheel] = {}
+    visited: set[tuple[str, str]] = set()
+    queue = [(Requirement(requirement), True)]
+
+    while queue:
+        req, requested = queue.pop()
+        name = normalize_name(req.name)
+        version = pins.get(name)
+        if version is None or not req.specifier.contains(version, prereleases=True):
+            return None
+        wheel = select_wheel(wheel_index.get(name, {}).get(version, []), supported)
+        if wheel is None:
+            return None
+        # Wheels pip would refuse are left to pip, which reports the error.
+        check_wheel_members(wheel)
+
+        current = installed.get(name)
+        if current is None or Version(current.version) != Version(version):
+            if name in planned:
+                planned[name].requested |= requested
+            else:
+                planned[name] = PlannedWheel(name, version, wheel, requested)
+
+        # Walk the dependencies once per (project, extra) combination.
+        for extra in ["", *sorted(req.extras)]:
+            if (name, extra) in visited:
+                continue
+            visited.add((name, extra))
+            for dep in read_wheel_requirements(wheel):
+                if dep.marker is None or dep.marker.evaluate({**environment, "extra": extra}):
+                    queue.append((dep, False))
+
+    return list(planned.values())
+
+
+def record_hash(data: bytes) -> str:
+    """
+    Computes a `RECORD` hash entry for file contents.
+
+    :param bytes data: The file contents.
+    :return: The hash in 'sha256=<urlsafe-base64>' form.
+    :rtype: str
+    """
+    digest = base64.urlsafe_b64encode(hashlib.sha256(data).digest()).rstrip(b"=")
+    return f"sha256={digest.decode('ascii')}"
+
+
+def remove_distribution(
+    dist: Distribution, backup_dir: Path | None = None
+) -> list[tuple[Path, Path]]:
+    """
+    Removes an installed distribution using the files listed in its `RECORD`.
+
+    With `backup_dir`, the files are moved there instead of being deleted, so
+    that `restore_distribution` can put them back.
+
+    :param Distribution dist: The installed distribution to remove.
+    :param Path, optional backup_dir: Where to move the files, on the same
+                                      filesystem as the venv.
+    :return: The original and backup path of every moved file or directory.
+    :rtype: list[tuple[Path, Path]]
+    """
+    # RECORD and METADATA are removed with the other files, so read them first.
+    files = dist.files or []
+    dist_info_dirs = {
+        file.parts[0] for file in files if file.parts[0].endswith(".dist-info")
+    }
+    if not dist_info_dirs:
+        # Without a RECORD, fall back to the standard directory name.
+        name = dist.metadata["Name"].replace("-", "_")
+        dist_info_dirs = {f"{name}-{dist.version}.dist-info"}
+
+    moved = []
+
+    def discard(path: Path):
+        if backup_dir is None:
+            if path.is_dir() and not path.is_symlink():
+                shutil.rmtree(path, ignore_errors=True)
+            else:
+                path.unlink()
+            return
+        backup = backup_dir / str(len(moved))
+        os.replace(path, backup)
+        moved.append((path, backup))
+
+    directories = set()
+    for file in files:
+        path = Path(dist.locate_file(file))
+        if path.is_file() or path.is_symlink():
+            discard(path)
+            directories.add(path.parent)
+            if path.suffix == ".py":
+                shutil.rmtree(path.parent / "__pycache__", ignore_errors=True)
+    # Remove directories left empty, deepest first.
+    for directory in sorted(directories, key=lambda d: len(d.parts), reverse=True):
+        try:
+            directory.rmdir()
+        except OSError:
+            pass
+    for dist_info_dir in dist_info_dirs:
+        path = Path(dist.locate_file(dist_info_dir))
+        if path.exists():
+            discard(path)
+    return moved
+
+
+def restore_distribution(moved: list[tuple[Path, Path]]):
+    """
+    Puts back the files of a distribution removed with a backup directory.
+
+    :param list moved: The paths returned by `remove_distribution`.
+    """
+    # Reversed, so that a directory is restored before the files moved out
+    # of it earlier.
+    for original, backup in reversed(moved):
+        original.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(backup, original)
+
+
+def install_wheel(
+    planned: PlannedWheel,
+    venv_dir: Path,
+    site_packages: Path,
+    python_executable: Path,
+    written: list[Path] | None = None,
+) -> list[Path]:
+    """
+    Unpacks a single wheel into a virtual environment.
+
+    Files under the wheel's `.data` directory are routed to their install
+    scheme, console-script entry points are generated, and `INSTALLER`,
+    `REQUESTED` and a complete `RECORD` are written to the `.dist-info`.
+
+    :param PlannedWheel planned: The wheel to install.
+    :param Path venv_dir: The root directory of the virtual environment.
+    :param Path site_packages: The venv's site-packages directory.
+    :param Path python_executable: The venv's python executable, for shebangs.
+    :param list, optional written: Every file and directory is appended to it
+                                   before it is created, so that a failed
+                                   install can be cleaned up.
+    :return: The installed files.
+    :rtype: list[Path]
+    :raises ValueError: If a member would be written outside of its scheme.
+    """
+    bin_dir = python_executable.parent
+    python_version = ".".join(get_venv_python_version(venv_dir).split(".")[:2])
+    schemes = {
+        "purelib": site_packages,
+        "platlib": site_packages,
+        "scripts": bin_dir,
+        "headers": venv_dir / "include" / "site" / f"python{python_version}" / planned.name,
+        "data": venv_dir,
+    }
+    records: list[tuple[Path, str, int]] = []
+
+    written = [] if written is None else written
+
+    def write_file(target: Path, data: bytes, executable: bool):
+        written.extend(takewhile(lambda parent: not parent.exists(), target.parents))
+        target.parent.mkdir(parents=True, exist_ok=True)
+        written.append(target)
+        target.write_bytes(data)
+        if executable:
+            target.chmod(0o755)
+        records.append((target, record_hash(data), len(data)))
+
+    with zipfile.ZipFile(planned.wheel) as archive:
+        dist_info = find_dist_info(archive)
+        data_dir = dist_info[: -len(".dist-info")] + ".data"
+
+        for info in archive.infolist():
+            if info.is_dir() or info.filename == f"{dist_info}/RECORD":
+                continue
+            data = archive.read(info)
+            executable = bool((info.external_attr >> 16) & 0o111)
+            scheme, parts = split_member(info.filename, data_dir)
+            root = os.path.abspath(schemes[scheme])
+            target = os.path.abspath(os.path.join(root, *parts))
+            if os.path.commonpath([root, target]) != root:
+                raise ValueError(
+                    f"Wheel member '{info.filename}' points outside of its install scheme."
+                )
+            if scheme == "scripts":
+                executable = True
+                if data.startswith(b"#!python"):
+                    data = b"#!" + str(python_executable).encode() + data[len(b"#!python") :]
+            write_file(Path(target), data, executable)
+
+        entry_points = configparser.ConfigParser(delimiters=("=",))
+        entry_points.optionxform = str
+        if f"{dist_info}/entry_points.txt" in archive.namelist():
+            entry_points.read_string(archive.read(f"{dist_info}/entry_points.txt").decode("utf-8"))
+
+    # --- Console Scripts ---
+    for section in ("console_scripts", "gui_scripts"):
+        if not entry_points.has_section(section):
+            continue
+        for script_name, value in entry_points.items(section):
+            module, _, attribute = value.partition(":")
+            attribute = attribute.split("[")[0].strip()
+            import_name = attribute.split(".")[0]
+            script = SCRIPT_TEMPLATE.format(
+                python=python_executable,
+                module=module.strip(),
+                import_name=import_name,
+                call=f"{attribute}()",
+            )
+            write_file(bin_dir / script_name, script.encode("utf-8"), True)
+
+    # --- Installation Metadata ---
+    dist_info_dir = site_packages / dist_info
+    write_file(dist_info_dir / "INSTALLER", f"{INSTALLER_NAME}\n".encode(), False)
+    if planned.requested:
+        write_file(dist_info_dir / "REQUESTED", b"", False)
+
+    record_lines = [
+        f"{os.path.relpath(path, site_packages).replace(os.sep, '/')},{digest},{size}"
+        for path, digest, size in records
+    ]
+    record_lines.append(f"{dist_info}/RECORD,,")
+    written.append(dist_info_dir / "RECORD")
+    (dist_info_dir / "RECORD").write_text("\n".join(record_lines) + "\n", encoding="utf-8")
+
+    return [path for path, _, _ in records]
+
+
+def fast_install(
+    project_root: Path, venv_dir: Path, requirements: list[str], console: Console
+) -> list[str]:
+    """
+    Installs requirements directly from the wheelhouse, bypassing pip.
+
+    Each requirement is planned independently; requirements that cannot be
+    fully served from the pins and the wheelhouse are returned so the caller
+    can hand them to pip. Not supported on Windows, where console scripts
+    need pip's executable launchers.
+
+    :param Path project_root: The root directory of the project.
+    :param Path venv_dir: The root directory of the virtual environment.
+    :param list requirements: The requirements to install.
+    :param Console console: The rich Console instance for printing messages.
+    :return: The requirements that were not installed.
+    :rtype: list[str]
+    """
+    site_packages = get_site_packages(venv_dir)
+    wheel_index = get_wheelhouse_index(get_wheelhouse_dir(project_root))
+    if sys.platform == "win32" or site_packages is None or not wheel_index:
+        return requirements
+
+    pins = read_pins(project_root / "requirements.txt")
+    supported = get_supported_tags(venv_dir)
+    environment = get_marker_environment(venv_dir)
+    installed = get_installed_distributions(venv_dir)
+
+    # --- Planning ---
+    plan: dict[str, PlannedWheel] = {}
+    remaining = []
+    for requirement in requirements:
+        try:
+            planned = plan_fast_install(
+                requirement, pins, wheel_index, supported, environment, installed
+            )
+        except (InvalidRequirement, ValueError, zipfile.BadZipFile):
+            planned = None
+        if planned is None:
+            remaining.append(requirement)
+            continue
+        for item in planned:
+            if item.name in plan:
+                plan[item.name].requested |= item.requested
+            else:
+                plan[item.name] = item
+
+    if not plan:
+        return remaining
+
+    # --- Installation ---
+    # Replaced versions are moved aside first, then all wheels are unpacked
+    # in parallel: decompression and file writes release the GIL. If any
+    # wheel fails, the new files are removed and the old versions restored.
+    _, python_executable = check_platform(venv_dir)
+    console.print(
+        f"[bold green]    Unpacking[/bold green] {len(plan)} wheel(s) from the wheelhouse"
+    )
+    backup_dir = Path(tempfile.mkdtemp(dir=venv_dir, prefix=".pyinit-replaced-"))
+    moved: list[tuple[Path, Path]] = []
+    written: list[Path] = []
+    try:
+        for name in plan:
+            if name in installed:
+                moved += remove_distribution(installed[name], backup_dir)
+
+        workers = min(len(plan), (os.cpu_count() or 1) * 2)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            installed_files = list(
+                executor.map(
+                    lambda item: install_wheel(
+                        item, venv_dir, site_packages, python_executable, written
+                    ),
+                    plan.values(),
+                )
+            )
+    except BaseException:
+        # Deepest first, so directories are empty by the time they are reached.
+        for path in sorted(set(written), key=lambda p: len(p.parts), reverse=True):
+            try:
+                path.rmdir() if path.is_dir() and not path.is_symlink() else path.unlink()
+            except OSError:
+                pass
+        restore_distribution(moved)
+        raise
+    finally:
+        shutil.rmtree(backup_dir, ignore_errors=True)
+
+    top_levels = {
+        site_packages / path.relative_to(site_packages).parts[0]
+        for files in installed_files
+        for path in files
+        if path.is_relative_to(site_packages)
+        and not path.relative_to(site_packages).parts[0].endswith(".dist-info")
+    }
+
+    # --- Byte-compilation ---
+    # Compiled with the venv's own interpreter so the bytecode matches it,
+    # using the project's '[tool.pyinit.compile]' settings.
+    compile_paths(python_executable, sorted(top_levels), get_compile_config(project_root))
+
+    console.print(
+        f"[bold green]Successfully[/bold green] Installed {len(plan)} package(s) without pip."
+    )
+    return remaining
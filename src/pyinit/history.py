@@ -0,0 +1,217 @@
+# Copyright (c) 2025 mrbooo895.
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""
+Test history of 'pyinit test'.
+
+The outcome and duration of every test, reported by the `pyinit_pytest`
+plugin, are kept for the last runs in `.pyinit/test-history`, along with a
+fingerprint of the code the test's file depends on (see
+`affected.code_fingerprints`). The history is used to:
+
+- run the tests that failed last time first, then those whose code changed
+  since they last ran, so that failures show up early;
+- report the slowest tests, with the change of their duration against their
+  median over the previous runs;
+- flag flaky tests, whose result flipped between passing and failing while
+  their fingerprint stayed the same.
+"""
+
+import json
+import statistics
+import time
+from pathlib import Path
+
+from rich.console import Console
+from rich.markup import escape
+
+from .utils import write_atomic
+
+HISTORY_DIR = Path(".pyinit") / "test-history"
+HISTORY_FILE = "history.json"
+PRIORITY_FILE = "priority.json"
+HISTORY_VERSION = 1
+
+# A run is stored as [timestamp, outcome, duration, fingerprint].
+TIMESTAMP, OUTCOME, DURATION, FINGERPRINT = range(4)
+FAILED_OUTCOMES = ("failed", "error")
+
+
+def read_history(project_root: Path) -> dict[str, list]:
+    """
+    Reads the recorded runs of every test, oldest first.
+
+    :param Path project_root: The root directory of the project.
+    :rtype: dict[str, list]
+    """
+    path = project_root / HISTORY_DIR / HISTORY_FILE
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+    return data.get("tests", {}) if data.get("version") == HISTORY_VERSION else {}
+
+
+def write_history(project_root: Path, history: dict[str, list]):
+    """
+    Writes the test history.
+
+    :param Path project_root: The root directory of the project.
+    :param dict history: The recorded runs of every test.
+    """
+    data = {"version": HISTORY_VERSION, "tests": history}
+    write_atomic(
+        project_root / HISTORY_DIR / HISTORY_FILE,
+        json.dumps(data, separators=(",", ":")).encode("utf-8"),
+    )
+
+
+def record_results(
+    history: dict[str, list],
+    results: dict[str, dict],
+    fingerprints: dict[str, str],
+    size: int,
+):
+    """
+    Appends the results of a run to the history, keeping `size` runs per test.
+
+    :param dict history: The recorded runs of every test, updated in place.
+    :param dict results: The plugin's report, by test ID.
+    :param dict fingerprints: The code fingerprint of every test file.
+    :param int size: The number of runs to keep per test.
+    """
+    timestamp = int(time.time())
+    for nodeid, result in results.items():
+        runs = history.setdefault(nodeid, [])
+        runs.append(
+            [
+                timestamp,
+                result["outcome"],
+                round(result["duration"], 6),
+                fingerprints.get(nodeid.split("::")[0], ""),
+            ]
+        )
+        del runs[:-size]
+
+
+def write_priority(
+    project_root: Path, history: dict[str, list], fingerprints: dict[str, str]
+) -> tuple[Path, int, int]:
+    """
+    Writes the plugin's priority file: the tests to run first.
+
+    These are the tests whose last run failed, then the test files whose
+    fingerprint differs from that of their last run, or that never ran.
+
+    :param Path project_root: The root directory of the project.
+    :param dict history: The recorded runs of every test.
+    :param dict fingerprints: The current code fingerprint of every test file.
+    :return: The file, the number of failed tests and of changed files.
+    :rtype: tuple[Path, int, int]
+    """
+    failed = sorted(
+        nodeid
+        for nodeid, runs in history.items()
+        if runs[-1][OUTCOME] in FAILED_OUTCOMES
+    )
+    last_runs = {}
+    for nodeid, runs in history.items():
+        file = nodeid.split("::")[0]
+        if runs[-1][TIMESTAMP] >= last_runs.get(file, [-1])[TIMESTAMP]:
+            last_runs[file] = runs[-1]
+    changed = sorted(
+        file
+        for file, fingerprint in fingerprints.items()
+        if file not in last_runs or last_runs[file][FINGERPRINT] != fingerprint
+    )
+    path = project_root / HISTORY_DIR / PRIORITY_FILE
+    data = {"failed": failed, "changed": changed}
+    write_atomic(path, json.dumps(data).encode("utf-8"))
+    return path, len(failed), len(changed)
+
+
+def count_flips(runs: list) -> int:
+    """
+    Counts the times a test's result flipped while its code stayed the same.
+
+    Only passing and failing runs count; skipped runs are ignored.
+
+    :param list runs: The recorded runs of one test, oldest first.
+    :rtype: int
+    """
+    flips = 0
+    previous = None
+    for run in runs:
+        if run[OUTCOME] == "skipped":
+            continue
+        if (
+            previous is not None
+            and previous[FINGERPRINT] == run[FINGERPRINT]
+            and (previous[OUTCOME] == "passed") != (run[OUTCOME] == "passed")
+        ):
+            flips += 1
+        previous = run
+    return flips
+
+
+def duration_trend(runs: list) -> float | None:
+    """
+    Returns the last duration's change against the median of the previous
+    passing runs, in percent.
+
+    :param list runs: The recorded runs of one test, oldest first.
+    :return: The change, or None without previous passing runs.
+    :rtype: float or None
+    """
+    previous = [
+        run[DURATION] for run in runs[:-1] if run[OUTCOME] == "passed" and run[DURATION]
+    ]
+    if not previous:
+        return None
+    return (runs[-1][DURATION] / statistics.median(previous) - 1) * 100
+
+
+def print_history_report(
+    console: Console, history: dict[str, list], results: dict[str, dict], top: int
+):
+    """
+    Prints the slowest tests of the run and the flaky ones.
+
+    :param Console console: The rich Console instance for output.
+    :param dict history: The recorded runs of every test, including this run.
+    :param dict results: The plugin's report of this run, by test ID.
+    :param int top: The number of slowest tests to print, 0 for none.
+    """
+    ran = [
+        nodeid for nodeid, result in results.items() if result["outcome"] != "skipped"
+    ]
+    slowest = sorted(ran, key=lambda nodeid: -results[nodeid]["duration"])[:top]
+    if slowest:
+        console.print(f"\n[bold green]    Slowest[/bold green] {len(slowest)} tests")
+    for nodeid in slowest:
+        trend = duration_trend(history[nodeid])
+        if trend is None:
+            change = f"{'new':>7}"
+        else:
+            style = "red" if trend > 10 else "green" if trend < -10 else "dim"
+            change = f"[{style}]{trend:>+6.0f}%[/]"
+        console.print(
+            f"  {results[nodeid]['duration']:>8.3f}s {change}  {escape(nodeid)}",
+            highlight=False,
+        )
+
+    flaky = {nodeid: count_flips(history[nodeid]) for nodeid in results}
+    flaky = {nodeid: flips for nodeid, flips in flaky.items() if flips}
+    if flaky:
+        console.print(
+            f"\n[bold yellow]      Flaky[/bold yellow] {len(flaky)} tests changed "
+            "results without code changes"
+        )
+    for nodeid, flips in sorted(flaky.items(), key=lambda item: -item[1]):
+        console.print(
+            f"  {escape(nodeid)} ({flips} flips in the last "
+            f"{len(history[nodeid])} runs)",
+            highlight=False,
+        )
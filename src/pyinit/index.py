@@ -0,0 +1,359 @@
+# Copyright (c) 2025 mrbooo895.
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""
+Provides a concurrent client for the package index's Simple API.
+
+This module queries the configured package index for the available versions
+of many packages at once. Requests are issued from an asyncio event loop with
+a bounded number of concurrent connections, prefer the JSON form of the
+Simple API (PEP 691) and fall back to the HTML form (PEP 503). Responses are
+cached on disk and shared between projects (see `cache.py`).
+"""
+
+import asyncio
+import json
+import os
+import re
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from html import unescape
+from pathlib import Path
+
+from packaging.specifiers import InvalidSpecifier, SpecifierSet
+from packaging.tags import Tag
+from packaging.utils import (
+    InvalidSdistFilename,
+    InvalidWheelFilename,
+    parse_sdist_filename,
+    parse_wheel_filename,
+)
+from packaging.version import InvalidVersion, Version
+
+from .cache import IndexCache, OfflineCacheMiss
+from .utils import get_pyinit_config, normalize_name
+
+DEFAULT_INDEX_URL = "https://pypi.org/simple"
+DEFAULT_MAX_CONNECTIONS = 16
+REQUEST_TIMEOUT = 30
+
+SIMPLE_ACCEPT = (
+    "application/vnd.pypi.simple.v1+json, "
+    "application/vnd.pypi.simple.v1+html;q=0.2, "
+    "text/html;q=0.1"
+)
+ANCHOR_PATTERN = re.compile(r"<a\s+([^>]*)>([^<]*)</a>", re.IGNORECASE)
+REQUIRES_PYTHON_PATTERN = re.compile(
+    r"data-requires-python\s*=\s*([\"'])(.*?)\1", re.IGNORECASE
+)
+
+
+@dataclass
+class OutdatedPackage:
+    """An installed package for which the index offers a newer version."""
+
+    name: str
+    installed: str
+    latest: str
+
+
+def get_index_url(project_root: Path) -> str:
+    """
+    Determines the package index URL to query.
+
+    The `index-url` setting in `[tool.pyinit]` takes precedence, followed by
+    the `PIP_INDEX_URL` environment variable and finally the public PyPI.
+
+    :param Path project_root: The root directory of the project.
+    :return: The base URL of the index's Simple API, without a trailing slash.
+    :rtype: str
+    """
+    index_url = (
+        get_pyinit_config(project_root).get("index-url")
+        or os.environ.get("PIP_INDEX_URL")
+        or DEFAULT_INDEX_URL
+    )
+    return index_url.rstrip("/")
+
+
+def version_from_filename(filename: str) -> Version | None:
+    """
+    Extracts the version from a wheel or sdist filename.
+
+    :param str filename: The distribution filename (e.g. 'rich-14.2.0-py3-none-any.whl').
+    :return: The parsed version, or None if the filename is not recognized.
+    :rtype: Version or None
+    """
+    try:
+        if filename.endswith(".whl"):
+            return parse_wheel_filename(filename)[1]
+        for suffix in (".tar.bz2", ".tgz", ".zip"):
+            if filename.endswith(suffix):
+                filename = filename[: -len(suffix)] + ".tar.gz"
+        return parse_sdist_filename(filename)[1]
+    except (InvalidWheelFilename, InvalidSdistFilename, InvalidVersion):
+        return None
+
+
+def is_compatible_file(
+    filename: str,
+    requires_python: str | None,
+    python_version: str | None = None,
+    supported: list[Tag] | None = None,
+) -> bool:
+    """
+    Tells whether a distribution file can be installed into a venv.
+
+    The file's Requires-Python must accept the venv's Python version, and a
+    wheel must have one of the venv's supported tags. Sdists can be built for
+    any platform, and unreadable specifiers are given the benefit of the doubt.
+
+    :param str filename: The distribution filename.
+    :param str requires_python: The file's Requires-Python, if the index gives one.
+    :param str, optional python_version: The venv's Python version. If None,
+                                         Requires-Python is not checked.
+    :param list, optional supported: The venv's supported wheel tags. If None,
+                                     wheel tags are not checked.
+    :rtype: bool
+    """
+    if requires_python and python_version:
+        try:
+            specifier = SpecifierSet(requires_python)
+        except InvalidSpecifier:
+            specifier = SpecifierSet()
+        if not specifier.contains(python_version, prereleases=True):
+            return False
+    if supported is not None and filename.endswith(".whl"):
+        try:
+            tags = parse_wheel_filename(filename)[3]
+        except InvalidWheelFilename:
+            return False
+        return not tags.isdisjoint(supported)
+    return True
+
+
+def parse_project_page(
+    body: bytes,
+    content_type: str,
+    python_version: str | None = None,
+    supported: list[Tag] | None = None,
+) -> list[Version]:
+    """
+    Parses a Simple API project page into the versions it offers.
+
+    Files marked as yanked, and files that cannot be installed into the venv
+    (see `is_compatible_file`), are ignored.
+
+    :param bytes body: The raw response body.
+    :param str content_type: The response's Content-Type header.
+    :param str, optional python_version: The venv's Python version.
+    :param list, optional supported: The venv's supported wheel tags.
+    :return: The distinct versions available on the index.
+    :rtype: list[Version]
+    """
+    files = []
+    if "json" in content_type:
+        data = json.loads(body)
+        files = [
+            (f["filename"], f.get("requires-python"))
+            for f in data.get("files", [])
+            if not f.get("yanked")
+        ]
+    else:
+        for attributes, text in ANCHOR_PATTERN.findall(body.decode("utf-8", "replace")):
+            if "data-yanked" not in attributes:
+                match = REQUIRES_PYTHON_PATTERN.search(attributes)
+                files.append(
+                    (unescape(text).strip(), unescape(match.group(2)) if match else None)
+                )
+
+    versions = {
+        version_from_filename(filename)
+        for filename, requires_python in files
+        if is_compatible_file(filename, requires_python, python_version, supported)
+    }
+    versions.discard(None)
+    return sorted(versions)
+
+
+def latest_version(versions: list[Version], installed: Version) -> Version | None:
+    """
+    Picks the newest version, ignoring pre-releases unless one is installed.
+
+    :param list versions: The versions available on the index.
+    :param Version installed: The currently installed version.
+    :return: The newest candidate version, or None if there is none.
+    :rtype: Version or None
+    """
+    candidates = [
+        v for v in versions if not v.is_prerelease or installed.is_prerelease
+    ]
+    return max(candidates, default=None)
+
+
+def fetch_url(url: str, cache: IndexCache) -> tuple[bytes, str] | None:
+    """
+    Fetches a URL through the on-disk index cache.
+
+    Fresh cache entries are returned without network access; stale ones are
+    revalidated with their ETag and Last-Modified validators.
+
+    :param str url: The URL to fetch.
+    :param IndexCache cache: The cache of index responses.
+    :return: A tuple of the response body and its Content-Type, or None if
+             the project does not exist on the index.
+    :rtype: tuple[bytes, str] or None
+    :raises OfflineCacheMiss: If offline and the URL is not cached.
+    """
+    cached = cache.get(url)
+    if cached and cache.is_fresh(cached):
+        return (cached["body"], cached["content_type"]) if cached["status"] == 200 else None
+    if cache.offline:
+        raise OfflineCacheMiss(url)
+
+    headers = {"Accept": SIMPLE_ACCEPT}
+    if cached and cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+    if cached and cached.get("last_modified"):
+        headers["If-Modified-Since"] = cached["last_modified"]
+
+    request = urllib.request.Request(url, headers=headers)
+    try:
+        with urllib.request.urlopen(request, timeout=REQUEST_TIMEOUT) as response:
+            body = response.read()
+            content_type = response.headers.get("Content-Type", "")
+            cache.store(
+                url,
+                200,
+                body,
+                content_type,
+                response.headers.get("ETag"),
+                response.headers.get("Last-Modified"),
+            )
+            return body, content_type
+    except urllib.error.HTTPError as e:
+        if e.code == 304 and cached:
+            cache.touch(url, cached)
+            return (cached["body"], cached["content_type"]) if cached["status"] == 200 else None
+        if e.code == 404:
+            cache.store(url, 404)
+            return None
+        raise
+
+
+async def fetch_project_pages(
+    names: list[str],
+    index_url: str,
+    cache: IndexCache,
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+) -> dict[str, tuple[bytes, str] | None | Exception]:
+    """
+    Fetches the Simple API project pages of many projects concurrently.
+
+    :param list names: The project names to look up.
+    :param str index_url: The base URL of the index's Simple API.
+    :param IndexCache cache: The cache of index responses.
+    :param int max_connections: The maximum number of concurrent requests.
+    :return: A mapping of project name to its page, None if the project does
+             not exist, or the exception raised while fetching it.
+    :rtype: dict
+    """
+    loop = asyncio.get_running_loop()
+
+    # The executor's size is the connection limit: blocking HTTP requests run
+    # on its threads while the event loop gathers the results.
+    with ThreadPoolExecutor(max_workers=max_connections) as executor:
+        pages = await asyncio.gather(
+            *(
+                loop.run_in_executor(
+                    executor, fetch_url, f"{index_url}/{normalize_name(name)}/", cache
+                )
+                for name in names
+            ),
+            return_exceptions=True,
+        )
+    return dict(zip(names, pages))
+
+
+def find_outdated(
+    installed: dict[str, str],
+    index_url: str,
+    cache: IndexCache | None = None,
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    python_version: str | None = None,
+    supported: list[Tag] | None = None,
+) -> tuple[list[OutdatedPackage], dict[str, Exception]]:
+    """
+    Queries the index for all installed packages concurrently.
+
+    Only the versions that can be installed into the venv are considered:
+    see `is_compatible_file`.
+
+    Packages that are unknown to the index are left out of the result. Those
+    whose page could not be fetched (e.g. the index is unreachable, or the
+    page is not in the offline cache) are returned separately, so that
+    callers do not take them for up to date.
+
+    :param dict installed: A mapping of distribution name to installed version.
+    :param str index_url: The base URL of the index's Simple API.
+    :param IndexCache, optional cache: The cache of index responses. Defaults
+                                       to the user-level cache.
+    :param int max_connections: The maximum number of concurrent requests.
+    :param str, optional python_version: The venv's Python version.
+    :param list, optional supported: The venv's supported wheel tags.
+    :return: The outdated packages, sorted by name, and the exception raised
+             while fetching the page of each package that failed.
+    :rtype: tuple[list[OutdatedPackage], dict[str, Exception]]
+    """
+    cache = cache or IndexCache()
+    pages = asyncio.run(
+        fetch_project_pages(list(installed), index_url, cache, max_connections)
+    )
+
+    outdated = []
+    errors = {}
+    for name, page in pages.items():
+        if isinstance(page, Exception):
+            errors[name] = page
+            continue
+        if page is None:
+            continue
+        try:
+            installed_version = Version(installed[name])
+        except InvalidVersion:
+            continue
+        latest = latest_version(
+            parse_project_page(*page, python_version, supported), installed_version
+        )
+        if latest is not None and latest > installed_version:
+            outdated.append(OutdatedPackage(name, installed[name], str(latest)))
+
+    return sorted(outdated, key=lambda package: package.name), errors
+
+
+def find_missing_projects(
+    names: list[str],
+    index_url: str,
+    cache: IndexCache | None = None,
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+) -> list[str]:
+    """
+    Finds which of the given projects do not exist on the index.
+
+    Projects whose page could not be fetched (e.g. the index is unreachable)
+    are not reported, so callers can fall back to letting pip decide.
+
+    :param list names: The project names to look up.
+    :param str index_url: The base URL of the index's Simple API.
+    :param IndexCache, optional cache: The cache of index responses.
+    :param int max_connections: The maximum number of concurrent requests.
+    :return: The names that the index reported as unknown.
+    :rtype: list[str]
+    """
+    cache = cache or IndexCache()
+    pages = asyncio.run(fetch_project_pages(names, index_url, cache, max_connections))
+    return [name for name, page in pages.items() if page is None]
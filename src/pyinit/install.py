@@ -7,29 +7,54 @@
 Implements the 'install' command for the pyinit command-line tool.
 
 This module contains the logic for intelligently installing one or more Python
-packages. It checks if packages are already installed before attempting to
-install them. After a successful installation, it automatically updates the
+packages. It checks whether the requested requirements are already satisfied
+before attempting to install them. After a successful installation, it automatically updates the
 `requirements.txt` file to lock the new dependency state.
 """
 
+import re
 import subprocess
 import sys
 from pathlib import Path
 
+from packaging.requirements import InvalidRequirement, Requirement
 from rich.console import Console
 
+from .bytecode import compile_after_change
+from .cache import IndexCache, get_index_cache_ttl
+from .fastinstall import fast_install
+from .index import DEFAULT_MAX_CONNECTIONS, find_missing_projects, get_index_url
+from .metadata import (
+    get_installed_distributions,
+    get_marker_environment,
+    is_requirement_satisfied,
+)
+from .requirements import patch_requirements
 from .utils import (
     check_platform,
     check_project_root,
     check_venv_exists,
     find_project_root,
+    get_pyinit_config,
+    write_atomic,
 )
+from .wheelhouse import get_wheelhouse_dir, has_wheels, wheelhouse_pip_args
 from .wrappers import error_handling
 
 
-def update_requirements(project_root: Path, pip_executable: Path, console: Console):
+def update_requirements(
+    project_root: Path,
+    pip_executable: Path,
+    console: Console,
+    before: dict[str, str] | None = None,
+):
     """
-    Updates the requirements.txt file by running 'pip freeze'.
+    Updates the requirements.txt file after a change to the venv.
+
+    When a snapshot of the installed versions taken before the change is
+    given, only the lines of distributions that were added, removed or
+    changed are patched, using metadata read in-process. Otherwise, or when
+    the file does not exist yet, it is regenerated with 'pip freeze'.
 
     This function is called after a successful package installation or
     uninstallation to ensure the lock file is synchronized with the
@@ -38,9 +63,21 @@ def update_requirements(project_root: Path, pip_executable: Path, console: Conso
     :param Path project_root: The root directory of the project.
     :param Path pip_executable: The path to the venv's pip executable.
     :param Console console: The rich Console instance for printing messages.
+    :param dict, optional before: Normalized name to installed version, as
+                                  returned by `get_installed_versions` before
+                                  the change.
     """
     requirements_file = project_root / "requirements.txt"
     try:
+        if before is not None and requirements_file.exists():
+            lines = requirements_file.read_text(encoding="utf-8").splitlines()
+            after = get_installed_distributions(project_root / "venv")
+            lines, changed = patch_requirements(lines, before, after)
+            if changed:
+                content = "".join(f"{line}\n" for line in lines)
+                write_atomic(requirements_file, content.encode("utf-8"))
+            return
+
         # Run 'pip freeze' to get an exact list of installed packages.
         result = subprocess.run(
             [str(pip_executable), "freeze"], check=True, capture_output=True, text=True
@@ -57,15 +94,22 @@ def update_requirements(project_root: Path, pip_executable: Path, console: Conso
 
 
 @error_handling
-def install_modules(modules_to_install: list):
+def install_modules(modules_to_install: list, offline: bool = False, fast: bool = False):
     """
     Installs one or more Python modules if not already present, and updates requirements.txt.
 
     This function serves as the primary entry point for the 'pyinit install' command.
-    It checks which requested packages are already installed, attempts to install
-    only the missing ones, and then regenerates the `requirements.txt` file.
-
-    :param list modules_to_install: A list of package names to install.
+    It checks which requested requirements are already satisfied, installs
+    only the unsatisfied ones in a single pip call, and then updates the
+    `requirements.txt` file.
+
+    :param list modules_to_install: A list of requirements (PEP 508 strings,
+                                    paths or URLs) to install.
+    :param bool offline: If True, installs only from the project's wheelhouse
+                         without network access. Defaults to False.
+    :param bool fast: If True, installs wheels that are pinned in
+                      `requirements.txt` and present in the wheelhouse
+                      directly, without running pip. Defaults to False.
     :raises SystemExit: If not run within a valid project, if the venv is not
                         found, or if the installation fails.
     """
@@ -80,46 +124,98 @@ def install_modules(modules_to_install: list):
     # --- Determine Platform-specific Executables ---
     pip_executable, _ = check_platform(venv_dir)
 
-    # --- Verify which packages are already installed ---
-
-    freeze_result = subprocess.run(
-        [str(pip_executable), "freeze"], check=True, capture_output=True, text=True
-    )
-    installed_packages = {
-        line.split("==")[0].lower().replace("-", "_")
-        for line in freeze_result.stdout.strip().split("\n")
+    # --- Verify which requirements are already satisfied ---
+    # Requirements are parsed as PEP 508 and checked against the installed
+    # distributions in-process (versions, extras and markers), so the common
+    # "already satisfied" case never reaches pip. The snapshot is also used
+    # to patch requirements.txt afterwards.
+    installed_distributions = get_installed_distributions(venv_dir)
+    installed_before = {
+        name: dist.version for name, dist in installed_distributions.items()
     }
+    environment = get_marker_environment(venv_dir)
 
-    # Filter the user's list to only include packages that are not already installed.
+    # Filter the user's list to only include requirements that are not satisfied.
+    # Anything that is not a valid requirement (paths, URLs) is left for pip.
     packages_to_actually_install = []
     for module in modules_to_install:
-        # We only check the base name, ignoring version specifiers for this check.
-        base_module_name = (
-            module.split("==")[0]
-            .split(">")[0]
-            .split("<")[0]
-            .split("~")[0]
-            .split("!=")[0]
-        )
-        normalized_module = base_module_name.lower().replace("-", "_")
-        if normalized_module not in installed_packages:
+        try:
+            requirement = Requirement(module)
+        except InvalidRequirement:
             packages_to_actually_install.append(module)
-        else:
+            continue
+        if is_requirement_satisfied(requirement, installed_distributions, environment):
             console.print(
-                f"[bold yellow][INFO][/] Requirement already installed: '{module}'"
+                f"[bold yellow][INFO][/] Requirement already satisfied: '{module}'"
             )
+        else:
+            packages_to_actually_install.append(module)
 
     if not packages_to_actually_install:
         console.print(
-            "[bold green]\n->[/] All specified packages are already installed, nothing to do."
+            "[bold green]\n->[/] All specified requirements are already satisfied, nothing to do."
         )
         sys.exit(0)
 
+    # --- Offline Installation from the Wheelhouse ---
+    pip_source_args = []
+    if offline:
+        wheelhouse = get_wheelhouse_dir(project_root)
+        if not has_wheels(wheelhouse):
+            console.print(
+                f"[bold red][ERROR][/bold red] No wheelhouse found at '{wheelhouse}'. Run 'pyinit wheelhouse sync' first."
+            )
+            sys.exit(1)
+        pip_source_args = wheelhouse_pip_args(wheelhouse)
+
+    # --- Direct Installation from the Wheelhouse ---
+    # Whatever cannot be served from the pins and the wheelhouse falls
+    # through to the regular pip installation below.
+    if fast:
+        packages_to_actually_install = fast_install(
+            project_root, venv_dir, packages_to_actually_install, console
+        )
+        if not packages_to_actually_install:
+            update_requirements(project_root, pip_executable, console, installed_before)
+            return
+
+    # --- Check that the packages exist on the index ---
+    # Project pages are shared with 'pyinit update' through the index cache,
+    # so unknown names are reported without waiting for pip's resolver. This
+    # is only a warning: pip may still find them through sources configured
+    # outside pyinit (pip.conf, extra index URLs, find-links).
+    # Paths, URLs and VCS references are left for pip to handle.
+    config = get_pyinit_config(project_root)
+    index_names = [] if offline else [
+        name
+        for name in (
+            re.split(r"[\s\[<>=!~;@]", m, maxsplit=1)[0]
+            for m in packages_to_actually_install
+        )
+        if re.fullmatch(r"[A-Za-z0-9]([A-Za-z0-9._-]*[A-Za-z0-9])?", name)
+        and not Path(name).exists()
+    ]
+    missing_packages = find_missing_projects(
+        index_names,
+        get_index_url(project_root),
+        IndexCache(ttl=get_index_cache_ttl(project_root)),
+        config.get("max-connections", DEFAULT_MAX_CONNECTIONS),
+    )
+    if missing_packages:
+        missing_str = ", ".join(f"'{m}'" for m in missing_packages)
+        console.print(
+            f"[bold yellow][WARNING][/bold yellow] Package(s) not found on the index: {missing_str}"
+        )
+
     # --- Installation Process ---
     modules_str = ", ".join(f"'{m}'" for m in packages_to_actually_install)
     console.print(f"[bold green]    Installing[/bold green] module(s) {modules_str}")
 
-    install_cmd = [str(pip_executable), "install"] + packages_to_actually_install
+    install_cmd = (
+        [str(pip_executable), "install"]
+        + packages_to_actually_install
+        + pip_source_args
+    )
     subprocess.run(
         install_cmd,
         check=True,
@@ -130,4 +226,7 @@ def install_modules(modules_to_install: list):
     )
 
     # --- Update Lock File ---
-    update_requirements(project_root, pip_executable, console)
+    update_requirements(project_root, pip_executable, console, installed_before)
+
+    # --- Precompile the New Packages ---
+    compile_after_change(project_root, console, installed_before, include_src=False)
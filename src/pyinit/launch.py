@@ -0,0 +1,224 @@
+# Copyright (c) 2025 mrbooo895.
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""
+Implements the fast path of 'pyinit run'.
+
+The first 'pyinit run' in a project resolves the launch command (the venv's
+interpreter and the project's main file) and records it in
+`.pyinit/launch.json`, along with the (mtime, size) of every file it was
+derived from: `pyproject.toml`, the venv's `pyvenv.cfg` and interpreter and,
+with `auto-sync`, the lockfile and site-packages. Later runs only stat those
+files and, if nothing changed, replace the pyinit process with the project's
+interpreter via `exec`, so no parent process stays resident and signals reach
+the script directly.
+
+This module is imported before anything else on every invocation, so it
+must only use the standard library modules the interpreter loads anyway.
+"""
+
+import json
+import os
+import sys
+
+LAUNCH_FILE = os.path.join(".pyinit", "launch.json")
+LAUNCH_RECORD_VERSION = 1
+
+# Options of 'pyinit run' itself. They must come before the script's own
+# arguments; '--' ends them explicitly. RUN_OPTIONS take a value, given
+# either as '--option value' or '--option=value'.
+RUN_FLAGS = {"--watch", "--profile", "--profile-own", "--sample", "--mem"}
+RUN_OPTIONS = {
+    "--profile-sort",
+    "--profile-top",
+    "--profile-compare",
+    "--sample-interval",
+    "--mem-interval",
+    "--mem-group",
+    "--mem-top",
+    "--mem-frames",
+}
+
+
+def parse_run_options(
+    args: list[str], flags: set = RUN_FLAGS, valued: set = RUN_OPTIONS
+) -> tuple[dict, list[str]]:
+    """
+    Splits the leading 'pyinit run' options from the script's arguments.
+
+    :param list args: Everything after 'run' on the command line.
+    :param set, optional flags: The options that take no value.
+    :param set, optional valued: The options that take a value.
+    :return: The run options given (True for flags), and the arguments for
+             the script.
+    :rtype: tuple[dict, list[str]]
+    :raises ValueError: If an option that takes a value is the last argument.
+    """
+    options = {}
+    index = 0
+    while index < len(args):
+        arg = args[index]
+        if arg == "--":
+            return options, args[index + 1 :]
+        name, separator, value = arg.partition("=")
+        if name in valued:
+            if not separator:
+                index += 1
+                if index == len(args):
+                    raise ValueError(f"Option '{name}' expects a value.")
+                value = args[index]
+            options[name] = value
+        elif arg in flags:
+            options[arg] = True
+        else:
+            return options, args[index:]
+        index += 1
+    return options, []
+
+
+def find_root(start: str) -> str | None:
+    """
+    Finds the nearest directory holding a `pyproject.toml`, using only `os`.
+
+    :param str start: The directory to start searching from.
+    :return: The project root, or None if not found.
+    :rtype: str or None
+    """
+    current = os.path.realpath(start)
+    while True:
+        if os.path.isfile(os.path.join(current, "pyproject.toml")):
+            return current
+        parent = os.path.dirname(current)
+        if parent == current:
+            return None
+        current = parent
+
+
+def get_stamp(path: str) -> list[int] | None:
+    """
+    Returns the (mtime_ns, size) a launch record remembers for a file.
+
+    :param str path: The file or directory to stat (symlinks are followed).
+    :return: The stamp, or None if the path does not exist.
+    :rtype: list[int] or None
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def write_launch_record(
+    project_root: str, argv: list[str], banner: str, stamped_paths: list[str]
+):
+    """
+    Records a resolved launch command for the fast path of 'pyinit run'.
+
+    Failing to write the record (e.g. on a read-only checkout) is not an
+    error; the next run simply resolves the command again.
+
+    :param str project_root: The root directory of the project.
+    :param list argv: The interpreter and main file to execute.
+    :param str banner: The project name shown in the 'Running' line.
+    :param list stamped_paths: The files whose change invalidates the record.
+    """
+    record = {
+        "version": LAUNCH_RECORD_VERSION,
+        "argv": [str(arg) for arg in argv],
+        "banner": banner,
+        "stamps": {str(path): get_stamp(str(path)) for path in stamped_paths},
+    }
+    record_path = os.path.join(project_root, LAUNCH_FILE)
+    temp_path = f"{record_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(record_path), exist_ok=True)
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(record, f)
+        os.replace(temp_path, record_path)
+    except OSError:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+
+
+def read_launch_record(project_root: str) -> dict | None:
+    """
+    Loads the launch record of a project if it is still valid.
+
+    :param str project_root: The root directory of the project.
+    :return: The record, or None if it is missing, unreadable or stale.
+    :rtype: dict or None
+    """
+    try:
+        with open(os.path.join(project_root, LAUNCH_FILE), encoding="utf-8") as f:
+            record = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(record, dict) or record.get("version") != LAUNCH_RECORD_VERSION:
+        return None
+    for path, stamp in record.get("stamps", {}).items():
+        if get_stamp(path) != stamp:
+            return None
+    if not all(os.path.isfile(arg) for arg in record.get("argv", [])) or not record["argv"]:
+        return None
+    return record
+
+
+def print_banner(name: str):
+    """
+    Prints the 'Running' line the way rich renders it, without importing rich.
+
+    :param str name: The project name.
+    """
+    label = "    Running"
+    if sys.stdout.isatty() and "NO_COLOR" not in os.environ:
+        label = f"\x1b[1;32m{label}\x1b[0m"
+    sys.stdout.write(f"{label} package '{name}'\n")
+    sys.stdout.flush()
+
+
+def exec_launch(argv: list[str]):
+    """
+    Replaces the current process with the project's interpreter.
+
+    :param list argv: The interpreter, the main file and the script arguments.
+    """
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os.execv(argv[0], argv)
+
+
+def exec_cached_launch(cli_args: list[str]):
+    """
+    Executes 'pyinit run' from its launch record, if it applies.
+
+    Returns without doing anything unless the command line is a plain
+    'pyinit run' (no run options), the platform supports `exec`, and a valid
+    launch record exists. Otherwise it never returns.
+
+    :param list cli_args: The command-line arguments, without the program name.
+    """
+    if os.name != "posix" or not cli_args or cli_args[0] != "run":
+        return
+    try:
+        options, app_args = parse_run_options(cli_args[1:])
+    except ValueError:
+        # Reported by the full command line.
+        return
+    if options:
+        return
+
+    project_root = find_root(os.getcwd())
+    if project_root is None:
+        return
+    record = read_launch_record(project_root)
+    if record is None:
+        return
+
+    print_banner(record.get("banner", ""))
+    exec_launch(record["argv"] + app_args)
@@ -0,0 +1,434 @@
+# Copyright (c) 2025 mrbooo895.
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""
+Implements the 'lock' and 'sync' commands for the pyinit command-line tool.
+
+'pyinit lock' resolves the dependencies declared in `pyproject.toml` (the
+`[project]` dependencies and every optional-dependency group) and records the
+result in a TOML lockfile, `pyinit.lock`, with versions, hashes, markers and
+the direct/transitive split. 'pyinit sync' applies that lockfile to the
+virtual environment: it diffs the lock against the installed distributions
+read in-process and installs or removes only the delta, so a no-op sync
+costs milliseconds.
+"""
+
+import json
+import subprocess
+import sys
+import tempfile
+from importlib.metadata import Distribution
+from pathlib import Path
+
+import tomli_w
+from packaging.markers import Marker
+from packaging.requirements import InvalidRequirement, Requirement
+from packaging.version import Version
+from rich.console import Console
+
+from .bytecode import compile_after_change
+from .install import update_requirements
+from .metadata import (
+    get_installed_distributions,
+    get_marker_environment,
+    get_requirements,
+)
+from .utils import (
+    check_platform,
+    check_project_root,
+    check_venv_exists,
+    find_project_root,
+    get_project_name,
+    normalize_name,
+)
+from .wheelhouse import get_wheelhouse_dir, has_wheels, wheelhouse_pip_args
+from .wrappers import error_handling
+
+# Conditional import of TOML library for Python version compatibility.
+if sys.version_info >= (3, 11):
+    import tomllib
+else:
+    import tomli as tomllib
+
+LOCK_FILE_NAME = "pyinit.lock"
+LOCK_VERSION = 1
+LOCK_HEADER = "# This file is generated by 'pyinit lock'. Do not edit it by hand.\n"
+
+# Installer tooling is managed by the venv itself, never by the lockfile.
+UNMANAGED_PACKAGES = {"pip", "setuptools", "wheel"}
+
+# Tools installed on demand by pyinit's commands (see `ensure_tool_installed`
+# and 'pyinit build'), which a sync keeps along with their dependencies.
+TOOL_PACKAGES = {"black", "build", "isort", "pipdeptree", "pytest", "ruff"}
+
+
+def get_dependency_groups(project_root: Path) -> dict[str, list[str]]:
+    """
+    Reads the declared dependencies of a project, grouped by origin.
+
+    :param Path project_root: The root directory of the project.
+    :return: A mapping of group name ('main' for `[project].dependencies`,
+             otherwise the optional-dependency group) to requirement strings.
+    :rtype: dict[str, list[str]]
+    """
+    with open(project_root / "pyproject.toml", "rb") as f:
+        project = tomllib.load(f).get("project", {})
+
+    groups = {"main": list(project.get("dependencies", []))}
+    groups.update(project.get("optional-dependencies", {}))
+    return groups
+
+
+def parse_declared_requirement(line: str, group: str) -> Requirement:
+    """
+    Parses a requirement declared in `pyproject.toml`.
+
+    :param str line: The requirement string.
+    :param str group: The dependency group it is declared in.
+    :rtype: Requirement
+    :raises ValueError: If the requirement is not valid PEP 508.
+    """
+    try:
+        return Requirement(line)
+    except InvalidRequirement as e:
+        raise ValueError(
+            f"Invalid requirement '{line}' in the '{group}' dependencies: {e}"
+        ) from e
+
+
+def resolve_dependencies(pip_executable: Path, requirements: list[str]) -> dict:
+    """
+    Resolves requirements with pip without installing anything.
+
+    :param Path pip_executable: The path to the venv's pip executable.
+    :param list requirements: The requirement strings to resolve.
+    :return: pip's installation report (see `pip install --report`).
+    :rtype: dict
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        report_file = Path(temp_dir) / "report.json"
+        subprocess.run(
+            [
+                str(pip_executable),
+                "install",
+                "--dry-run",
+                "--ignore-installed",
+                "--quiet",
+                "--report",
+                str(report_file),
+            ]
+            + requirements,
+            check=True,
+            capture_output=True,
+        )
+        return json.loads(report_file.read_text(encoding="utf-8"))
+
+
+def build_lock(
+    groups: dict[str, list[str]], report: dict, environment: dict[str, str]
+) -> list[dict]:
+    """
+    Builds the lockfile's package entries from a pip resolution report.
+
+    :param dict groups: The declared requirements, grouped by origin.
+    :param dict report: pip's installation report for all the groups.
+    :param dict environment: The marker environment the report was made for.
+    :return: The package entries, sorted by name.
+    :rtype: list[dict]
+    :raises ValueError: If a declared requirement is not valid PEP 508.
+    """
+    resolved = {}
+    for item in report.get("install", []):
+        metadata = item["metadata"]
+        name = normalize_name(metadata["name"])
+        dependencies = set()
+        for line in metadata.get("requires_dist") or []:
+            try:
+                dep = Requirement(line)
+            except InvalidRequirement:
+                continue
+            if dep.marker is None or dep.marker.evaluate({**environment, "extra": ""}):
+                dependencies.add(normalize_name(dep.name))
+        hashes = item.get("download_info", {}).get("archive_info", {}).get("hashes", {})
+        resolved[name] = {
+            "name": name,
+            "version": metadata["version"],
+            "direct": False,
+            "groups": set(),
+            "dependencies": dependencies,
+            "hashes": [f"{algo}:{digest}" for algo, digest in sorted(hashes.items())],
+        }
+
+    # Direct requirements keep their declared markers; every resolved
+    # package is tagged with the groups it is reachable from.
+    for group, requirements in groups.items():
+        stack = []
+        for line in requirements:
+            requirement = parse_declared_requirement(line, group)
+            name = normalize_name(requirement.name)
+            if name not in resolved:
+                continue
+            resolved[name]["direct"] = True
+            if requirement.marker is not None:
+                resolved[name]["markers"] = str(requirement.marker)
+            stack.append(name)
+        while stack:
+            name = stack.pop()
+            if group in resolved[name]["groups"]:
+                continue
+            resolved[name]["groups"].add(group)
+            stack.extend(dep for dep in resolved[name]["dependencies"] if dep in resolved)
+
+    packages = []
+    for entry in sorted(resolved.values(), key=lambda e: e["name"]):
+        entry["groups"] = sorted(entry["groups"])
+        entry["dependencies"] = sorted(d for d in entry["dependencies"] if d in resolved)
+        packages.append(entry)
+    return packages
+
+
+def read_lock(project_root: Path) -> list[dict] | None:
+    """
+    Reads the package entries of a project's lockfile.
+
+    :param Path project_root: The root directory of the project.
+    :return: The package entries, or None if there is no readable lockfile.
+    :rtype: list[dict] or None
+    """
+    try:
+        with open(project_root / LOCK_FILE_NAME, "rb") as f:
+            return tomllib.load(f).get("package", [])
+    except (tomllib.TOMLDecodeError, FileNotFoundError):
+        return None
+
+
+def compute_sync_delta(
+    packages: list[dict],
+    installed: dict[str, str],
+    environment: dict[str, str],
+    keep: set[str],
+) -> tuple[list[dict], list[str]]:
+    """
+    Computes the changes needed to make a venv match a lockfile.
+
+    :param list packages: The lockfile's package entries.
+    :param dict installed: A mapping of normalized name to installed version.
+    :param dict environment: The venv's PEP 508 marker environment.
+    :param set keep: Normalized names that must never be removed.
+    :return: A tuple of the package entries to install and the names to remove.
+    :rtype: tuple[list[dict], list[str]]
+    """
+    locked = {
+        package["name"]: package
+        for package in packages
+        if not package.get("markers") or Marker(package["markers"]).evaluate(environment)
+    }
+    to_install = [
+        package
+        for name, package in locked.items()
+        if name not in installed or Version(installed[name]) != Version(package["version"])
+    ]
+    to_remove = sorted(
+        name for name in installed if name not in locked and name not in keep
+    )
+    return to_install, to_remove
+
+
+def find_dependency_closure(
+    installed: dict[str, Distribution], names: set[str], environment: dict[str, str]
+) -> set[str]:
+    """
+    Finds the installed distributions that some others depend on, transitively.
+
+    :param dict installed: A mapping of normalized name to installed distribution.
+    :param set names: The normalized names to start from.
+    :param dict environment: The venv's PEP 508 marker environment.
+    :return: The installed names among `names` and their dependencies.
+    :rtype: set[str]
+    """
+    closure = set()
+    stack = [name for name in names if name in installed]
+    while stack:
+        name = stack.pop()
+        if name in closure:
+            continue
+        closure.add(name)
+        for dep in get_requirements(installed[name], environment):
+            if normalize_name(dep.name) in installed:
+                stack.append(normalize_name(dep.name))
+    return closure
+
+
+def sync_environment(
+    project_root: Path, console: Console, offline: bool = False, quiet: bool = False
+) -> bool:
+    """
+    Makes the project's venv match its lockfile, touching only the delta.
+
+    All missing or mismatched packages are installed in a single pip call
+    (with `--no-deps` and the locked hashes) and all extraneous packages are
+    removed in a single uninstall. Installer tooling and the tools pyinit
+    installs for its own commands are never considered extraneous.
+
+    :param Path project_root: The root directory of the project.
+    :param Console console: The rich Console instance for printing messages.
+    :param bool offline: If True, installs only from the wheelhouse.
+    :param bool quiet: If True, prints nothing when already in sync.
+    :return: True if the environment was changed.
+    :rtype: bool
+    :raises SystemExit: If there is no lockfile or if pip fails.
+    """
+    packages = read_lock(project_root)
+    if packages is None:
+        console.print(
+            f"[bold red][ERROR][/bold red] No '{LOCK_FILE_NAME}' found. Run 'pyinit lock' first."
+        )
+        sys.exit(1)
+
+    venv_dir = project_root / "venv"
+    distributions = get_installed_distributions(venv_dir)
+    installed = {name: dist.version for name, dist in distributions.items()}
+    environment = get_marker_environment(venv_dir)
+    keep = (
+        UNMANAGED_PACKAGES
+        | {normalize_name(get_project_name(project_root) or "")}
+        | find_dependency_closure(distributions, TOOL_PACKAGES, environment)
+    )
+    to_install, to_remove = compute_sync_delta(packages, installed, environment, keep)
+
+    if not to_install and not to_remove:
+        if not quiet:
+            console.print("[bold green]->[/] Environment is in sync with the lockfile.")
+        return False
+
+    pip_executable, _ = check_platform(venv_dir)
+
+    # --- Install the Delta ---
+    if to_install:
+        console.print(
+            f"[bold green]    Installing[/bold green] {len(to_install)} locked package(s)"
+        )
+        # pip requires hashes on every line once any line has one.
+        use_hashes = all(package.get("hashes") for package in to_install)
+        lines = []
+        for package in to_install:
+            line = f"{package['name']}=={package['version']}"
+            if use_hashes:
+                line += "".join(f" --hash={h}" for h in package["hashes"])
+            lines.append(line)
+
+        source_args = []
+        wheelhouse = get_wheelhouse_dir(project_root)
+        if has_wheels(wheelhouse):
+            source_args = wheelhouse_pip_args(wheelhouse)
+            if not offline:
+                source_args.remove("--no-index")
+        elif offline:
+            console.print(
+                f"[bold red][ERROR][/bold red] No wheelhouse found at '{wheelhouse}'. Run 'pyinit wheelhouse sync' first."
+            )
+            sys.exit(1)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            requirements_file = Path(temp_dir) / "requirements.txt"
+            requirements_file.write_text("\n".join(lines) + "\n", encoding="utf-8")
+            subprocess.run(
+                [str(pip_executable), "install", "--no-deps", "-r", str(requirements_file)]
+                + source_args,
+                check=True,
+                capture_output=True,
+            )
+
+    # --- Remove Extraneous Packages ---
+    if to_remove:
+        console.print(
+            f"[bold green]      Removing[/bold green] {len(to_remove)} extraneous package(s)"
+        )
+        subprocess.run(
+            [str(pip_executable), "uninstall", "-y"] + to_remove,
+            check=True,
+            capture_output=True,
+        )
+
+    update_requirements(project_root, pip_executable, console, installed)
+    compile_after_change(project_root, console, installed, include_src=False)
+    console.print(
+        f"[bold green]Successfully[/bold green] synced environment "
+        f"({len(to_install)} installed, {len(to_remove)} removed)."
+    )
+    return True
+
+
+@error_handling
+def lock_project():
+    """
+    Resolves the project's declared dependencies into `pyinit.lock`.
+
+    This function serves as the entry point for the 'pyinit lock' command.
+    All dependency groups are resolved together with pip's resolver, without
+    installing anything, and the result is written as TOML.
+
+    :raises SystemExit: If not run within a valid project, if the virtual
+                        environment is not found, if a declared requirement
+                        is invalid, or if resolution fails.
+    """
+    console = Console()
+    project_root = find_project_root()
+
+    # --- Pre-flight Checks ---
+    check_project_root(project_root)
+    venv_dir = project_root / "venv"
+    check_venv_exists(venv_dir)
+    pip_executable, _ = check_platform(venv_dir)
+
+    groups = get_dependency_groups(project_root)
+    requirements = []
+    for group, lines in groups.items():
+        for line in lines:
+            # Invalid lines are reported here rather than as a pip failure.
+            parse_declared_requirement(line, group)
+            requirements.append(line)
+
+    console.print(
+        f"[bold green]    Resolving[/bold green] {len(requirements)} declared dependencies"
+    )
+    environment = get_marker_environment(venv_dir)
+    report = resolve_dependencies(pip_executable, requirements) if requirements else {}
+    packages = build_lock(groups, report, environment)
+
+    lock_data = {
+        "version": LOCK_VERSION,
+        "python": environment["python_full_version"],
+        "package": packages,
+    }
+    lock_file = project_root / LOCK_FILE_NAME
+    lock_file.write_text(LOCK_HEADER + tomli_w.dumps(lock_data), encoding="utf-8")
+
+    direct = sum(1 for package in packages if package["direct"])
+    console.print(
+        f"[bold green]Successfully[/bold green] locked {len(packages)} package(s) "
+        f"({direct} direct, {len(packages) - direct} transitive) in '{lock_file.name}'"
+    )
+
+
+@error_handling
+def sync_project(offline: bool = False):
+    """
+    Applies `pyinit.lock` to the project's virtual environment.
+
+    This function serves as the entry point for the 'pyinit sync' command.
+
+    :param bool offline: If True, installs only from the wheelhouse.
+    :raises SystemExit: If not run within a valid project, if the virtual
+                        environment or lockfile is not found, or if pip fails.
+    """
+    console = Console()
+    project_root = find_project_root()
+
+    # --- Pre-flight Checks ---
+    check_project_root(project_root)
+    check_venv_exists(project_root / "venv")
+
+    sync_environment(project_root, console, offline)
@@ -8,37 +8,61 @@ Main entry point for the pyinit command-line tool.
 
 This module is responsible for parsing command-line arguments, setting up the
 main parser and its subparsers for each command, and dispatching to the
-appropriate function based on the user's input.
+appropriate function based on the user's input. The command modules are only
+loaded once the fast path of 'pyinit run' (see `launch.py`) has declined.
 """
 
-import argparse
 import sys
 
-# Import handler functions for each command from their respective modules.
 from . import __version__
-from .build import build_project
-from .check import check_project
-from .clean import clean_project
-from .create import create_project
-from .format import format_project
-from .graph import show_dependency_graph
-from .info import project_info
-from .init import initialize_project
-from .install import install_modules
-from .release import increase_version
-from .run import run_project
-from .test import run_tests
-from .uninstall import uninstall_modules
-from .update import update_modules
-from .venv import manage_venv
-from .wrappers import error_handling
-
-
-@error_handling
+from .launch import exec_cached_launch
+
+
 def main():
+    """
+    Entry point of the pyinit command-line tool.
+
+    A plain 'pyinit run' with a valid cached launch record replaces this
+    process with the project's interpreter right away, before rich or any
+    command module is imported. Everything else goes through `run_cli`.
+    """
+    exec_cached_launch(sys.argv[1:])
+
+    from .wrappers import error_handling
+
+    error_handling(run_cli)()
+
+
+def run_cli():
     """
     Parses arguments and executes the corresponding pyinit command.
     """
+    # Command modules are imported here rather than at module level, so the
+    # fast path of 'pyinit run' in `main` never pays for loading them.
+    import argparse
+
+    from .bench import run_benchmarks
+    from .build import build_project
+    from .bundle import bundle_project
+    from .bytecode import INVALIDATION_MODES, compile_project
+    from .check import check_project
+    from .clean import clean_project
+    from .create import create_project
+    from .format import format_project
+    from .graph import show_dependency_graph
+    from .info import project_info
+    from .init import initialize_project
+    from .install import install_modules
+    from .lock import lock_project, sync_project
+    from .release import increase_version
+    from .run import run_project
+    from .test import run_tests
+    from .uninstall import uninstall_modules
+    from .update import update_modules
+    from .venv import manage_venv
+    from .wheelhouse import manage_wheelhouse
+    from .workspace import run_workspace
+
     # --- Main Parser Setup ---
     parser = argparse.ArgumentParser(
         description="Tool For Creating and Managing Python Projects"
@@ -65,8 +89,25 @@ def main():
         help="Show program's version number and exit",
     )
 
+    # '--workspace' mode
+    parser.add_argument(
+        "-w",
+        "--workspace",
+        action="store_true",
+        help="Run the command in every member of the current workspace",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        metavar="N",
+        help="Maximum number of workspace members to run at once",
+    )
+
     # 'run' command
-    subparsers.add_parser("run", help="Run Your Project's Main File")
+    subparsers.add_parser(
+        "run",
+        help="Run Your Project's Main File ('--watch' restarts it when src/ changes)",
+    )
 
     # 'install' command
     parser_install = subparsers.add_parser(
@@ -78,6 +119,16 @@ def main():
         metavar="PACKAGE",
         help="One or more packages to install",
     )
+    parser_install.add_argument(
+        "--offline",
+        action="store_true",
+        help="Install only from the project's wheelhouse, without network access",
+    )
+    parser_install.add_argument(
+        "--fast",
+        action="store_true",
+        help="Unpack pinned wheels from the wheelhouse directly, bypassing pip",
+    )
 
     # 'uninstall'
     parser_uninstall = subparsers.add_parser(
@@ -89,10 +140,52 @@ def main():
         metavar="PACKAGE",
         help="One or more packages to uninstall",
     )
+    parser_uninstall.add_argument(
+        "--autoremove",
+        action="store_true",
+        help="Also remove dependencies that are no longer needed",
+    )
 
     # 'build' command
     subparsers.add_parser("build", help="Build Your Project Using Wheel")
 
+    # 'bundle' command
+    parser_bundle = subparsers.add_parser(
+        "bundle", help="Package the project and its dependencies into a zipapp"
+    )
+    parser_bundle.add_argument(
+        "--extract",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help="Unpack to a cache directory on first run (default: only with native extensions)",
+    )
+    parser_bundle.add_argument(
+        "--python",
+        metavar="INTERPRETER",
+        help="Shebang interpreter of the archive (default: /usr/bin/env python3)",
+    )
+
+    # 'compile' command
+    parser_compile = subparsers.add_parser(
+        "compile", help="Byte-compile src/ and the venv's site-packages in parallel"
+    )
+    parser_compile.add_argument(
+        "-O",
+        "--optimize",
+        type=int,
+        choices=[0, 1, 2],
+        action="append",
+        help="Optimization level to compile for (repeatable)",
+    )
+    parser_compile.add_argument(
+        "--invalidation-mode",
+        choices=INVALIDATION_MODES,
+        help="How the interpreter decides whether a .pyc is up to date",
+    )
+    parser_compile.add_argument(
+        "--src-only", action="store_true", help="Compile only the project's src/"
+    )
+
     # 'init' command
     subparsers.add_parser(
         "init", help="Initialize a new project in an existing directory"
@@ -101,8 +194,48 @@ def main():
     # 'test' command
     subparsers.add_parser("test", help="Run tests with pytest")
 
-    # 'lock' command (Removed)
-    # The 'lock' functionality is now integrated into 'install' and 'uninstall'.
+    # 'bench' command
+    parser_bench = subparsers.add_parser(
+        "bench", help="Run benchmarks/bench_*.py and record the results"
+    )
+    parser_bench.add_argument(
+        "-k",
+        dest="pattern",
+        metavar="PATTERN",
+        help="Only run benchmarks matching this glob ('file.py::name' or 'name')",
+    )
+    parser_bench.add_argument(
+        "--compare",
+        metavar="REF",
+        help="Compare with the results recorded for a git ref",
+    )
+    parser_bench.add_argument(
+        "--threshold",
+        type=float,
+        metavar="PERCENT",
+        help="Slowdown that fails the comparison (default: 10)",
+    )
+    parser_bench.add_argument(
+        "--no-save",
+        dest="save",
+        action="store_false",
+        help="Do not add the results to .pyinit/bench/history.jsonl",
+    )
+
+    # 'lock' command
+    subparsers.add_parser(
+        "lock", help="Resolve declared dependencies into pyinit.lock"
+    )
+
+    # 'sync' command
+    parser_sync = subparsers.add_parser(
+        "sync", help="Install or remove packages so the venv matches pyinit.lock"
+    )
+    parser_sync.add_argument(
+        "--offline",
+        action="store_true",
+        help="Install only from the project's wheelhouse, without network access",
+    )
 
     # 'format' command
     subparsers.add_parser("format", help="Format the codebase with black and isort")
@@ -114,8 +247,57 @@ def main():
     venv_subparsers = parser_venv.add_subparsers(
         dest="venv_command", required=True, help="venv commands"
     )
-    venv_subparsers.add_parser("create", help="Create the virtual environment")
+    parser_venv_create = venv_subparsers.add_parser(
+        "create", help="Create the virtual environment"
+    )
+    parser_venv_create.add_argument(
+        "--offline",
+        action="store_true",
+        help="Install requirements.txt from the wheelhouse afterwards",
+    )
     venv_subparsers.add_parser("remove", help="Remove the virtual environment")
+    parser_venv_pack = venv_subparsers.add_parser(
+        "pack", help="Write a relocatable, compressed archive of the virtual environment"
+    )
+    parser_venv_pack.add_argument(
+        "archive",
+        nargs="?",
+        help="Archive path (defaults to .pyinit/venv-cache, keyed by requirements.txt)",
+    )
+    parser_venv_unpack = venv_subparsers.add_parser(
+        "unpack", help="Restore the virtual environment from a packed archive"
+    )
+    parser_venv_unpack.add_argument(
+        "archive",
+        nargs="?",
+        help="Archive path (defaults to the one matching requirements.txt)",
+    )
+    venv_subparsers.add_parser(
+        "dedupe",
+        help="Hardlink site-packages files into a store shared by all projects",
+    )
+    venv_subparsers.add_parser(
+        "du", help="Show the logical and actual disk usage of the virtual environment"
+    )
+    parser_venv_slim = venv_subparsers.add_parser(
+        "slim", help="Strip tests, docs and stale bytecode from installed packages"
+    )
+    parser_venv_slim.add_argument(
+        "--compile",
+        action="store_true",
+        help="Precompile the remaining sources afterwards",
+    )
+
+    # 'wheelhouse' command group
+    parser_wheelhouse = subparsers.add_parser(
+        "wheelhouse", help="Manage the project's local wheelhouse"
+    )
+    wheelhouse_subparsers = parser_wheelhouse.add_subparsers(
+        dest="wheelhouse_command", required=True, help="wheelhouse commands"
+    )
+    wheelhouse_subparsers.add_parser(
+        "sync", help="Download or build wheels for everything in requirements.txt"
+    )
 
     # 'check' command
     subparsers.add_parser("check", help="check the codebase with ruff")
@@ -143,6 +325,11 @@ def main():
     parser_update.add_argument(
         "--upgrade", action="store_true", help="Upgrade venv modules"
     )
+    parser_update.add_argument(
+        "--offline",
+        action="store_true",
+        help="Answer purely from the index cache and upgrade from the wheelhouse, without network access",
+    )
 
     # 'info' command
     subparsers.add_parser("info", help="Display information about the current project")
@@ -159,6 +346,15 @@ def main():
             break
 
     args = parser.parse_args(main_args)
+    if args.jobs is not None and not args.workspace:
+        parser.error("argument --jobs: only valid together with -w/--workspace")
+
+    # --- Workspace Mode ---
+    # Forward everything after the global options to each member unchanged.
+    if args.workspace and args.command:
+        command_index = main_args.index(args.command)
+        run_workspace(main_args[command_index:] + sub_args, args.jobs)
+        return
 
     # --- Command Dispatching ---
     match args.command:
@@ -167,19 +363,36 @@ def main():
         case "run":
             run_project(sub_args)
         case "install":
-            install_modules(args.modules)
+            install_modules(args.modules, args.offline, args.fast)
         case "uninstall":
-            uninstall_modules(args.modules)
+            uninstall_modules(args.modules, args.autoremove)
         case "build":
             build_project()
+        case "bundle":
+            bundle_project(args.extract, args.python)
+        case "compile":
+            compile_project(args.optimize, args.invalidation_mode, args.src_only)
         case "init":
             initialize_project()
         case "test":
             run_tests(sub_args)
+        case "bench":
+            run_benchmarks(args.pattern, args.compare, args.threshold, args.save)
+        case "lock":
+            lock_project()
+        case "sync":
+            sync_project(args.offline)
         case "format":
             format_project()
         case "venv":
-            manage_venv(args.venv_command)
+            manage_venv(
+                args.venv_command,
+                getattr(args, "archive", None),
+                getattr(args, "compile", False),
+                getattr(args, "offline", False),
+            )
+        case "wheelhouse":
+            manage_wheelhouse(args.wheelhouse_command)
         case "check":
             check_project(sub_args)
         case "graph":
@@ -189,7 +402,7 @@ def main():
         case "release":
             increase_version(args.part)
         case "update":
-            update_modules(args.upgrade)
+            update_modules(args.upgrade, args.offline)
         case "info":
             project_info()
         case None:
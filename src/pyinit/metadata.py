@@ -0,0 +1,207 @@
+# Copyright (c) 2025 mrbooo895.
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""
+Provides in-process access to the packages installed in a project's venv.
+
+Instead of spawning `pip freeze` or `pip list`, the helpers in this module
+read the `*.dist-info` metadata directly from the virtual environment's
+site-packages directory. This is much faster and returns structured data.
+"""
+
+import platform
+import sys
+from importlib.metadata import Distribution, distributions
+from pathlib import Path
+
+from packaging.markers import default_environment
+from packaging.requirements import InvalidRequirement, Requirement
+from packaging.tags import Tag, compatible_tags, cpython_tags, generic_tags
+
+from .utils import normalize_name
+
+
+def get_site_packages(venv_dir: Path) -> Path | None:
+    """
+    Locates the site-packages directory of a virtual environment.
+
+    :param Path venv_dir: The root directory of the virtual environment.
+    :return: The path to site-packages, or None if it could not be found.
+    :rtype: Path or None
+    """
+    if sys.platform == "win32":
+        site_packages = venv_dir / "Lib" / "site-packages"
+        return site_packages if site_packages.is_dir() else None
+
+    candidates = sorted((venv_dir / "lib").glob("python*/site-packages"))
+    return candidates[0] if candidates else None
+
+
+def get_installed_distributions(venv_dir: Path) -> dict[str, Distribution]:
+    """
+    Reads every distribution installed in a virtual environment.
+
+    :param Path venv_dir: The root directory of the virtual environment.
+    :return: A mapping of normalized distribution name to its metadata.
+    :rtype: dict[str, Distribution]
+    """
+    site_packages = get_site_packages(venv_dir)
+    if site_packages is None:
+        return {}
+
+    installed = {}
+    for dist in distributions(path=[str(site_packages)]):
+        name = dist.metadata["Name"]
+        if name:
+            installed.setdefault(normalize_name(name), dist)
+    return installed
+
+
+def get_installed_versions(venv_dir: Path) -> dict[str, str]:
+    """
+    Reads the name and version of every distribution installed in a venv.
+
+    :param Path venv_dir: The root directory of the virtual environment.
+    :return: A mapping of normalized distribution name to installed version.
+    :rtype: dict[str, str]
+    """
+    return {
+        name: dist.version
+        for name, dist in get_installed_distributions(venv_dir).items()
+    }
+
+
+def get_venv_python_version(venv_dir: Path) -> str:
+    """
+    Reads the full Python version of a virtual environment from `pyvenv.cfg`.
+
+    Falls back to the running interpreter's version if it cannot be read.
+
+    :param Path venv_dir: The root directory of the virtual environment.
+    :return: The version string, e.g. '3.11.7'.
+    :rtype: str
+    """
+    try:
+        for line in (venv_dir / "pyvenv.cfg").read_text(encoding="utf-8").splitlines():
+            key, _, value = line.partition("=")
+            if key.strip() in ("version", "version_info"):
+                # 'version_info' may look like '3.11.7.final.0'.
+                return ".".join(value.strip().split(".")[:3])
+    except OSError:
+        pass
+    return platform.python_version()
+
+
+def get_marker_environment(venv_dir: Path) -> dict[str, str]:
+    """
+    Builds the PEP 508 marker environment of a virtual environment.
+
+    The platform values come from the running interpreter, which shares the
+    host with the venv; the Python version comes from the venv itself.
+
+    :param Path venv_dir: The root directory of the virtual environment.
+    :return: The marker environment, suitable for `Marker.evaluate`.
+    :rtype: dict[str, str]
+    """
+    full_version = get_venv_python_version(venv_dir)
+    environment = default_environment()
+    environment["python_full_version"] = full_version
+    environment["python_version"] = ".".join(full_version.split(".")[:2])
+    return environment
+
+
+def get_supported_tags(venv_dir: Path) -> list[Tag]:
+    """
+    Lists the wheel tags a virtual environment's interpreter can install.
+
+    :param Path venv_dir: The root directory of the virtual environment.
+    :return: The supported tags, most specific first.
+    :rtype: list[Tag]
+    """
+    python_version = tuple(
+        int(part) for part in get_venv_python_version(venv_dir).split(".")[:2]
+    )
+    if platform.python_implementation() == "CPython":
+        tags = list(cpython_tags(python_version))
+    else:
+        tags = list(generic_tags())
+    return tags + list(compatible_tags(python_version))
+
+
+def get_requirements(
+    dist: Distribution, environment: dict[str, str], extras: tuple[str, ...] = ()
+) -> list[Requirement]:
+    """
+    Reads the dependencies of an installed distribution that apply to a venv.
+
+    :param Distribution dist: The installed distribution.
+    :param dict environment: The venv's PEP 508 marker environment.
+    :param tuple extras: The extras whose dependencies are included.
+    :return: The `Requires-Dist` requirements whose markers match.
+    :rtype: list[Requirement]
+    """
+    requirements = []
+    for line in dist.requires or []:
+        try:
+            requirement = Requirement(line)
+        except InvalidRequirement:
+            continue
+        if requirement.marker is None or any(
+            requirement.marker.evaluate({**environment, "extra": extra})
+            for extra in ("", *extras)
+        ):
+            requirements.append(requirement)
+    return requirements
+
+
+def is_requirement_satisfied(
+    requirement: Requirement,
+    installed: dict[str, Distribution],
+    environment: dict[str, str],
+) -> bool:
+    """
+    Tells whether a requirement is already met by the installed distributions.
+
+    The installed version must match the specifier (pre-releases included, as
+    an installed pre-release is a deliberate choice), and every dependency
+    added by the requested extras must be satisfied in turn. A requirement
+    whose marker does not apply to the venv is trivially satisfied.
+
+    :param Requirement requirement: The parsed PEP 508 requirement.
+    :param dict installed: A mapping of normalized name to installed distribution.
+    :param dict environment: The venv's PEP 508 marker environment.
+    :rtype: bool
+    """
+    if requirement.marker is not None and not requirement.marker.evaluate(
+        {**environment, "extra": ""}
+    ):
+        return True
+
+    # Requirements on the stack have had their markers evaluated already.
+    visited = set()
+    stack = [requirement]
+    while stack:
+        current = stack.pop()
+        if current.url:
+            return False
+
+        name = normalize_name(current.name)
+        dist = installed.get(name)
+        if dist is None or not current.specifier.contains(dist.version, prereleases=True):
+            return False
+
+        for extra in sorted(current.extras):
+            if (name, extra) in visited:
+                continue
+            visited.add((name, extra))
+            # Only the dependencies gated on this extra are new requirements.
+            stack.extend(
+                dep
+                for dep in get_requirements(dist, environment, (extra,))
+                if dep.marker is not None
+                and dep.marker.evaluate({**environment, "extra": extra})
+                and not dep.marker.evaluate({**environment, "extra": ""})
+            )
+    return True
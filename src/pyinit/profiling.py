@@ -0,0 +1,595 @@
+# Copyright (c) 2025 mrbooo895.
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""
+Implements the profiling modes of 'pyinit run'.
+
+'pyinit run --profile' runs the project's main file under cProfile in the
+venv's interpreter, through a small bootstrap script shipped in
+`pyinit/_bootstrap`. The statistics are written to `.pyinit/profiles` as a
+`.pstats` file (readable by `pstats`, snakeviz and friends) and as collapsed
+stacks (one `frame;frame;frame count` line per stack, the input format of
+flamegraph.pl and speedscope), and the top functions by cumulative and self
+time are printed once the script exits. cProfile only records caller/callee
+pairs, so the collapsed stacks apportion each function's time to its callers
+in proportion to the time spent in each call edge.
+
+'pyinit run --sample' is meant for long-running processes, where
+deterministic profiling distorts timings too much: another bootstrap samples
+the stacks of all threads at a fixed interval and writes aggregated collapsed
+stacks on exit or on SIGUSR2. Like a plain run, it replaces the pyinit
+process, so it can stay on under a process supervisor.
+
+'pyinit run --mem' chases memory growth: its bootstrap runs the script with
+tracemalloc enabled and writes snapshots at start, at an optional interval,
+on SIGUSR1 and on exit, plus an `rss.csv` log of resident and peak memory.
+When the script exits, the largest allocation sites of the last snapshot
+and their growth since the first are printed, grouped by file, line or
+traceback.
+"""
+
+import os
+import pstats
+import re
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+from pathlib import Path
+
+from rich.console import Console
+
+from .launch import exec_launch
+
+PROFILE_DIR = Path(".pyinit") / "profiles"
+BOOTSTRAP_DIR = Path(__file__).parent / "_bootstrap"
+
+STDLIB_PATTERN = re.compile(r"[\\/]lib[\\/]python\d+\.\d+[\\/]")
+
+SORT_KEYS = {"cumulative": 3, "tottime": 2, "calls": 1}
+DEFAULT_TOP = 15
+DEFAULT_SAMPLE_INTERVAL = 10
+MEM_GROUPS = ("filename", "lineno", "traceback")
+
+# Stacks carrying less than this share of the total time are dropped from
+# the collapsed output, which keeps it small for deep call graphs.
+MIN_STACK_FRACTION = 1e-4
+
+
+def get_bootstrap(name: str) -> Path:
+    """
+    Returns the path of a bootstrap script run by the venv's interpreter.
+
+    :param str name: The bootstrap's module name, e.g. 'pyinit_profile'.
+    :rtype: Path
+    """
+    return BOOTSTRAP_DIR / f"{name}.py"
+
+
+def new_output_path(project_root: Path, suffix: str) -> Path:
+    """
+    Returns a fresh, timestamped path under `.pyinit/profiles`.
+
+    :param Path project_root: The root directory of the project.
+    :param str suffix: The file suffix, e.g. '.pstats'.
+    :rtype: Path
+    """
+    directory = project_root / PROFILE_DIR
+    directory.mkdir(parents=True, exist_ok=True)
+    stem = time.strftime("%Y%m%d-%H%M%S")
+    path = directory / f"{stem}{suffix}"
+    counter = 1
+    while path.exists():
+        path = directory / f"{stem}-{counter}{suffix}"
+        counter += 1
+    return path
+
+
+def get_count_option(options: dict, name: str, default: int) -> int:
+    """
+    Reads a run option that must be a positive integer.
+
+    :param dict options: The run options.
+    :param str name: The option, e.g. '--profile-top'.
+    :param int default: The value when the option is not given.
+    :rtype: int
+    :raises ValueError: If the value is not a positive integer.
+    """
+    value = options.get(name, default)
+    try:
+        count = int(value)
+    except ValueError:
+        count = 0
+    if count <= 0:
+        raise ValueError(f"'{name}' must be a positive integer (got '{value}')")
+    return count
+
+
+def get_number_option(
+    options: dict, name: str, default: float, allow_zero: bool = False
+) -> float:
+    """
+    Reads a run option that must be a positive number.
+
+    :param dict options: The run options.
+    :param str name: The option, e.g. '--sample-interval'.
+    :param float default: The value when the option is not given.
+    :param bool allow_zero: If True, zero is accepted too.
+    :rtype: float
+    :raises ValueError: If the value is not a (positive) number.
+    """
+    value = options.get(name, default)
+    try:
+        number = float(value)
+    except ValueError:
+        number = float("nan")
+    if not (number >= 0 if allow_zero else number > 0):
+        kind = "non-negative" if allow_zero else "positive"
+        raise ValueError(f"'{name}' must be a {kind} number (got '{value}')")
+    return number
+
+
+def shorten_path(filename: str, project_root: Path | None = None) -> str:
+    """
+    Shortens a source file name for reports.
+
+    Files inside the project are shown relative to it, files inside
+    site-packages or the standard library relative to those.
+
+    :param str filename: The file name recorded by the profiler.
+    :param Path, optional project_root: The root directory of the project.
+    :rtype: str
+    """
+    if project_root is not None and filename.startswith(str(project_root) + os.sep):
+        return os.path.relpath(filename, project_root)
+    if "site-packages" + os.sep in filename:
+        return filename.split("site-packages" + os.sep, 1)[1]
+    return STDLIB_PATTERN.split(filename)[-1]
+
+
+def format_function(func: tuple, project_root: Path | None = None) -> str:
+    """
+    Renders a pstats function key as 'file:line(name)'.
+
+    :param tuple func: A (filename, line, name) key.
+    :param Path, optional project_root: The root directory of the project.
+    :rtype: str
+    """
+    filename, line, name = func
+    if filename == "~":
+        return name
+    return f"{shorten_path(filename, project_root)}:{line}({name})"
+
+
+def filter_own(stats: dict, source_dir: Path) -> dict:
+    """
+    Keeps only the functions defined under the project's own sources.
+
+    :param dict stats: pstats statistics, keyed by (filename, line, name).
+    :param Path source_dir: The project's `src/` directory.
+    :rtype: dict
+    """
+    prefix = str(source_dir) + os.sep
+    return {func: row for func, row in stats.items() if func[0].startswith(prefix)}
+
+
+def build_collapsed_stacks(stats: dict, project_root: Path | None = None) -> dict[str, float]:
+    """
+    Reconstructs approximate call stacks from cProfile's caller/callee pairs.
+
+    Starting from the functions without callers, each function's self time is
+    attributed to the current stack, and each callee is visited with the share
+    of its cumulative time spent in calls from the current function. Recursive
+    edges are not followed.
+
+    :param dict stats: pstats statistics, keyed by (filename, line, name).
+    :param Path, optional project_root: Used to shorten file names.
+    :return: Seconds of self time per ';'-joined stack.
+    :rtype: dict[str, float]
+    """
+    callees = defaultdict(list)
+    roots = []
+    for func, (_, _, _, _, callers) in stats.items():
+        if not callers:
+            roots.append(func)
+        for caller, edge in callers.items():
+            if isinstance(edge, tuple):
+                callees[caller].append((func, edge[3]))
+
+    labels = {
+        func: format_function(func, project_root).replace(";", ",") for func in stats
+    }
+    total = sum(stats[func][3] for func in roots)
+    threshold = total * MIN_STACK_FRACTION
+    stacks = defaultdict(float)
+
+    # Each pending entry is (function, seconds attributed, stack, functions on it).
+    pending = [(func, stats[func][3], (), frozenset()) for func in roots]
+    while pending:
+        func, seconds, stack, on_stack = pending.pop()
+        _, _, self_time, cumulative, _ = stats[func]
+        stack = stack + (labels[func],)
+        on_stack = on_stack | {func}
+        share = seconds / cumulative if cumulative else 0.0
+        stacks[";".join(stack)] += self_time * share
+        for callee, edge_time in callees[func]:
+            weight = edge_time * share
+            if callee not in on_stack and callee in stats and weight >= threshold:
+                pending.append((callee, weight, stack, on_stack))
+    return stacks
+
+
+def write_collapsed_stacks(stacks: dict[str, float], path: Path):
+    """
+    Writes collapsed stacks with their weight in microseconds.
+
+    :param dict stacks: Seconds per ';'-joined stack.
+    :param Path path: The file to write.
+    """
+    lines = [
+        f"{stack} {round(seconds * 1_000_000)}"
+        for stack, seconds in sorted(stacks.items())
+        if round(seconds * 1_000_000) > 0
+    ]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def print_top_functions(
+    console: Console,
+    stats: dict,
+    sort_key: str,
+    top: int,
+    project_root: Path | None = None,
+):
+    """
+    Prints the top functions of a profile.
+
+    :param Console console: The rich Console instance for output.
+    :param dict stats: pstats statistics, keyed by (filename, line, name).
+    :param str sort_key: 'cumulative', 'tottime' or 'calls'.
+    :param int top: The number of functions to show.
+    :param Path, optional project_root: Used to shorten file names.
+    """
+    column = SORT_KEYS[sort_key]
+    rows = sorted(stats.items(), key=lambda item: item[1][column], reverse=True)[:top]
+    console.print(f"\n[bold]Top {len(rows)} functions by {sort_key}[/bold]")
+    console.print(
+        f"{'cumulative':>12}  {'self':>10}  {'calls':>10}  function",
+        highlight=False,
+        soft_wrap=True,
+    )
+    for func, (primitive, calls, self_time, cumulative, _) in rows:
+        call_text = str(calls) if calls == primitive else f"{calls}/{primitive}"
+        console.print(
+            f"{cumulative:>11.4f}s  {self_time:>9.4f}s  {call_text:>10}  "
+            f"{format_function(func, project_root)}",
+            highlight=False,
+            soft_wrap=True,
+        )
+
+
+def print_comparison(
+    console: Console,
+    stats: dict,
+    baseline: dict,
+    top: int,
+    project_root: Path | None = None,
+):
+    """
+    Prints the functions whose cumulative time changed most against a baseline.
+
+    Functions are matched by file and name, so they still line up after
+    edits that move them around in their file.
+
+    :param Console console: The rich Console instance for output.
+    :param dict stats: The new pstats statistics.
+    :param dict baseline: The previous pstats statistics.
+    :param int top: The number of functions to show.
+    :param Path, optional project_root: Used to shorten file names.
+    """
+    def by_name(table: dict) -> dict:
+        merged = {}
+        for func, row in table.items():
+            key = (func[0], func[2])
+            cumulative, self_time, func_key = merged.get(key, (0.0, 0.0, func))
+            merged[key] = (cumulative + row[3], self_time + row[2], func_key)
+        return merged
+
+    before, after = by_name(baseline), by_name(stats)
+    changes = []
+    for key in before.keys() | after.keys():
+        old = before.get(key, (0.0, 0.0, None))
+        new = after.get(key, (0.0, 0.0, None))
+        changes.append((new[0] - old[0], old[0], new[0], new[2] or old[2]))
+    changes.sort(key=lambda change: abs(change[0]), reverse=True)
+
+    console.print("\n[bold]Largest changes in cumulative time[/bold]")
+    console.print(
+        f"{'before':>12}  {'after':>10}  {'change':>10}  function",
+        highlight=False,
+        soft_wrap=True,
+    )
+    for delta, old, new, func in changes[:top]:
+        color = "red" if delta > 0 else "green"
+        console.print(
+            f"{old:>11.4f}s  {new:>9.4f}s  [{color}]{delta:>+9.4f}s[/{color}]  "
+            f"{format_function(func, project_root)}",
+            highlight=False,
+            soft_wrap=True,
+        )
+
+
+def wait_for_child(process: subprocess.Popen) -> int:
+    """
+    Waits for a profiled child, letting it finish writing on Ctrl+C.
+
+    The child receives the same Ctrl+C and writes its output on the way out,
+    so it must not be killed the way `subprocess.run` does.
+
+    :param Popen process: The child process.
+    :return: The child's exit code.
+    :rtype: int
+    """
+    while True:
+        try:
+            return process.wait()
+        except KeyboardInterrupt:
+            continue
+
+
+def profile_script(
+    console: Console, project_root: Path, run_cmd: list[str], options: dict
+) -> int:
+    """
+    Handles 'pyinit run --profile'.
+
+    :param Console console: The rich Console instance for output.
+    :param Path project_root: The root directory of the project.
+    :param list run_cmd: The venv interpreter, the main file and its arguments.
+    :param dict options: The run options ('--profile-sort', '--profile-top',
+                         '--profile-own', '--profile-compare').
+    :return: The script's exit code.
+    :rtype: int
+    :raises ValueError: If an option has an invalid value.
+    """
+    sort_key = options.get("--profile-sort")
+    if sort_key is not None and sort_key not in SORT_KEYS:
+        raise ValueError(
+            f"'--profile-sort' must be one of: {', '.join(SORT_KEYS)} (got '{sort_key}')"
+        )
+    top = get_count_option(options, "--profile-top", DEFAULT_TOP)
+    compare = options.get("--profile-compare")
+    if compare is not None and not Path(compare).is_file():
+        raise ValueError(f"Profile '{compare}' to compare against was not found.")
+
+    pstats_path = new_output_path(project_root, ".pstats")
+    cmd = [run_cmd[0], str(get_bootstrap("pyinit_profile"))] + run_cmd[1:]
+    env = {**os.environ, "PYINIT_PROFILE_OUTPUT": str(pstats_path)}
+    returncode = wait_for_child(subprocess.Popen(cmd, env=env))
+
+    if not pstats_path.exists():
+        console.print("[bold red][ERROR][/bold red] The script exited without writing a profile.")
+        return returncode or 1
+
+    stats = pstats.Stats(str(pstats_path)).stats
+    collapsed_path = pstats_path.with_suffix(".collapsed")
+    write_collapsed_stacks(build_collapsed_stacks(stats, project_root), collapsed_path)
+
+    shown = filter_own(stats, project_root / "src") if options.get("--profile-own") else stats
+    for key in [sort_key] if sort_key else ["cumulative", "tottime"]:
+        print_top_functions(console, shown, key, top, project_root)
+    if compare is not None:
+        baseline = pstats.Stats(compare).stats
+        if options.get("--profile-own"):
+            baseline = filter_own(baseline, project_root / "src")
+        print_comparison(console, shown, baseline, top, project_root)
+
+    console.print(
+        f"\n[bold green]Successfully[/bold green] wrote "
+        f"'{pstats_path.relative_to(project_root)}' and "
+        f"'{collapsed_path.relative_to(project_root)}'."
+    )
+    return returncode
+
+
+def sample_script(
+    console: Console, project_root: Path, run_cmd: list[str], options: dict
+):
+    """
+    Handles 'pyinit run --sample'.
+
+    :param Console console: The rich Console instance for output.
+    :param Path project_root: The root directory of the project.
+    :param list run_cmd: The venv interpreter, the main file and its arguments.
+    :param dict options: The run options ('--sample-interval', in milliseconds).
+    :raises ValueError: If the interval is not a positive number.
+    """
+    interval = get_number_option(options, "--sample-interval", DEFAULT_SAMPLE_INTERVAL)
+
+    output_path = new_output_path(project_root, ".sample.collapsed")
+    console.print(
+        f"[bold green]     Sampling[/bold green] every {interval:g} ms into "
+        f"'{output_path.relative_to(project_root)}' (send SIGUSR2 to write it early)"
+    )
+    os.environ.update(
+        {
+            "PYINIT_SAMPLE_OUTPUT": str(output_path),
+            "PYINIT_SAMPLE_INTERVAL": str(interval),
+            "PYINIT_PROJECT_ROOT": str(project_root),
+        }
+    )
+    cmd = [run_cmd[0], str(get_bootstrap("pyinit_sample"))] + run_cmd[1:]
+    if os.name != "posix":
+        sys.exit(wait_for_child(subprocess.Popen(cmd)))
+    exec_launch(cmd)
+
+
+def _format_size(size: int, signed: bool = False) -> str:
+    """
+    Renders a size in bytes with a binary unit.
+
+    :param int size: The size in bytes.
+    :param bool signed: If True, positive sizes get a '+' sign.
+    :rtype: str
+    """
+    sign = "+" if signed and size >= 0 else "-" if size < 0 else ""
+    size = abs(size)
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if size < 1024 or unit == "GiB":
+            return f"{sign}{size:.1f} {unit}" if unit != "B" else f"{sign}{size} B"
+        size /= 1024
+
+
+def load_snapshot(path: Path) -> tracemalloc.Snapshot:
+    """
+    Loads a snapshot written by the memory bootstrap, without its own frames.
+
+    :param Path path: The `.tracemalloc` file.
+    :rtype: tracemalloc.Snapshot
+    """
+    return tracemalloc.Snapshot.load(str(path)).filter_traces(
+        [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, str(get_bootstrap("pyinit_mem"))),
+            tracemalloc.Filter(False, "<unknown>"),
+        ]
+    )
+
+
+def _print_location(
+    console: Console, traceback: tracemalloc.Traceback, group: str, project_root: Path
+):
+    """
+    Prints the location of an allocation site, ending a report row.
+
+    :param Console console: The rich Console instance for output.
+    :param Traceback traceback: The site's traceback.
+    :param str group: 'filename', 'lineno' or 'traceback'.
+    :param Path project_root: Used to shorten file names.
+    """
+    # Tracebacks are stored oldest frame first; show the allocating frame first.
+    frames = list(reversed(traceback))
+    if group == "filename":
+        lines = [shorten_path(frames[0].filename, project_root)]
+    else:
+        lines = [
+            f"{shorten_path(frame.filename, project_root)}:{frame.lineno}"
+            for frame in (frames if group == "traceback" else frames[:1])
+        ]
+    console.print(f"  {lines[0]}", highlight=False, soft_wrap=True)
+    for line in lines[1:]:
+        console.print(f"  {'':>34}  {line}", highlight=False, soft_wrap=True)
+
+
+def print_memory_report(
+    console: Console,
+    first: tracemalloc.Snapshot,
+    last: tracemalloc.Snapshot,
+    group: str,
+    top: int,
+    project_root: Path,
+):
+    """
+    Prints the largest allocation sites of a snapshot and their growth.
+
+    :param Console console: The rich Console instance for output.
+    :param Snapshot first: The baseline snapshot.
+    :param Snapshot last: The snapshot to report on.
+    :param str group: 'filename', 'lineno' or 'traceback'.
+    :param int top: The number of allocation sites to show.
+    :param Path project_root: Used to shorten file names.
+    """
+    statistics = last.statistics(group)[:top]
+    console.print(f"\n[bold]Top {len(statistics)} allocation sites by size[/bold]")
+    console.print(
+        f"{'size':>12}  {'blocks':>10}  {'average':>10}  location", highlight=False
+    )
+    for stat in statistics:
+        console.print(
+            f"{_format_size(stat.size):>12}  {stat.count:>10}  "
+            f"{_format_size(stat.size // max(stat.count, 1)):>10}",
+            highlight=False,
+            end="",
+        )
+        _print_location(console, stat.traceback, group, project_root)
+
+    growth = [diff for diff in last.compare_to(first, group) if diff.size_diff][:top]
+    console.print(f"\n[bold]Top {len(growth)} changes since the first snapshot[/bold]")
+    console.print(
+        f"{'change':>12}  {'size':>10}  {'blocks':>10}  location", highlight=False
+    )
+    for diff in growth:
+        color = "red" if diff.size_diff > 0 else "green"
+        console.print(
+            f"[{color}]{_format_size(diff.size_diff, signed=True):>12}[/{color}]  "
+            f"{_format_size(diff.size):>10}  {diff.count_diff:>+10}",
+            highlight=False,
+            end="",
+        )
+        _print_location(console, diff.traceback, group, project_root)
+
+
+def mem_script(
+    console: Console, project_root: Path, run_cmd: list[str], options: dict
+) -> int:
+    """
+    Handles 'pyinit run --mem'.
+
+    :param Console console: The rich Console instance for output.
+    :param Path project_root: The root directory of the project.
+    :param list run_cmd: The venv interpreter, the main file and its arguments.
+    :param dict options: The run options ('--mem-interval' in seconds,
+                         '--mem-group', '--mem-top', '--mem-frames').
+    :return: The script's exit code.
+    :rtype: int
+    :raises ValueError: If an option has an invalid value.
+    """
+    group = options.get("--mem-group", "lineno")
+    if group not in MEM_GROUPS:
+        raise ValueError(
+            f"'--mem-group' must be one of: {', '.join(MEM_GROUPS)} (got '{group}')"
+        )
+    # No interval means snapshots only at start, on SIGUSR1 and at exit.
+    interval = get_number_option(options, "--mem-interval", 0, allow_zero=True)
+    top = get_count_option(options, "--mem-top", DEFAULT_TOP)
+    # Grouping by traceback is only useful with more than one frame.
+    frames = get_count_option(options, "--mem-frames", 10 if group == "traceback" else 1)
+
+    output_dir = new_output_path(project_root, ".mem")
+    output_dir.mkdir()
+    console.print(
+        f"[bold green]    Tracing[/bold green] allocations into "
+        f"'{output_dir.relative_to(project_root)}' (send SIGUSR1 for a snapshot)"
+    )
+    env = {
+        **os.environ,
+        "PYINIT_MEM_OUTPUT": str(output_dir),
+        "PYINIT_MEM_INTERVAL": str(interval),
+        "PYINIT_MEM_FRAMES": str(frames),
+    }
+    cmd = [run_cmd[0], str(get_bootstrap("pyinit_mem"))] + run_cmd[1:]
+    returncode = wait_for_child(subprocess.Popen(cmd, env=env))
+
+    snapshots = sorted(output_dir.glob("*.tracemalloc"))
+    if len(snapshots) < 2:
+        console.print(
+            "[bold red][ERROR][/bold red] The script exited without writing snapshots."
+        )
+        return returncode or 1
+
+    print_memory_report(
+        console,
+        load_snapshot(snapshots[0]),
+        load_snapshot(snapshots[-1]),
+        group,
+        top,
+        project_root,
+    )
+    console.print(
+        f"\n[bold green]Successfully[/bold green] wrote {len(snapshots)} snapshots and "
+        f"'rss.csv' to '{output_dir.relative_to(project_root)}'."
+    )
+    return returncode
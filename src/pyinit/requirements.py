@@ -0,0 +1,116 @@
+# Copyright (c) 2025 mrbooo895.
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""
+Provides incremental updates of a project's `requirements.txt`.
+
+Rather than regenerating the whole file with `pip freeze`, the helpers in
+this module compare snapshots of the installed distributions taken before
+and after a change and patch only the affected lines. Comments, ordering and
+editable or option lines written by hand are preserved.
+"""
+
+import json
+import re
+from importlib.metadata import Distribution
+
+from .utils import normalize_name
+
+# Distributions that 'pip freeze' leaves out by default.
+FREEZE_EXCLUDED = {"pip", "setuptools", "wheel", "distribute"}
+
+PINNED_LINE_PATTERN = re.compile(
+    r"^(?P<name>[A-Za-z0-9][A-Za-z0-9._-]*)(?P<extras>\[[^\]]*\])?\s*"
+    r"(?:==\s*(?P<version>[^\s;#\\]+)|@\s*\S+)(?P<rest>.*)$"
+)
+
+
+def freeze_line(dist: Distribution) -> str | None:
+    """
+    Formats an installed distribution the way 'pip freeze' would.
+
+    :param Distribution dist: The installed distribution.
+    :return: The requirement line, or None for distributions that 'pip freeze'
+             omits or that need its special handling (editable installs).
+    :rtype: str or None
+    """
+    name = dist.metadata["Name"]
+    if normalize_name(name) in FREEZE_EXCLUDED:
+        return None
+
+    direct_url = dist.read_text("direct_url.json")
+    if direct_url:
+        try:
+            data = json.loads(direct_url)
+        except ValueError:
+            data = {}
+        if data.get("dir_info", {}).get("editable"):
+            return None
+        if data.get("url") and "archive_info" not in data:
+            return f"{name} @ {data['url']}"
+    return f"{name}=={dist.version}"
+
+
+def patch_requirements(
+    lines: list[str],
+    before: dict[str, str],
+    after: dict[str, Distribution],
+) -> tuple[list[str], bool]:
+    """
+    Patches requirement lines to reflect changes between two snapshots.
+
+    Pinned lines of removed distributions are dropped, those of upgraded or
+    downgraded distributions get their new version (keeping any trailing
+    comment), and new distributions are inserted in alphabetical position.
+
+    :param list lines: The current lines of `requirements.txt`.
+    :param dict before: Normalized name to version, before the change.
+    :param dict after: Normalized name to distribution, after the change.
+    :return: The patched lines, and whether anything was changed.
+    :rtype: tuple[list[str], bool]
+    """
+    changed = {
+        name
+        for name in before.keys() | after.keys()
+        if name not in after or before.get(name) != after[name].version
+    }
+    if not changed:
+        return lines, False
+
+    patched = []
+    present = set()
+    for line in lines:
+        match = PINNED_LINE_PATTERN.match(line.strip())
+        name = normalize_name(match["name"]) if match else None
+        if name is None or name not in changed:
+            patched.append(line)
+            if name:
+                present.add(name)
+            continue
+        if name not in after:
+            continue
+        new_line = freeze_line(after[name])
+        if new_line is not None:
+            patched.append(new_line + match["rest"])
+            present.add(name)
+
+    # New distributions are inserted before the first pinned line that sorts
+    # after them, or right after the last pinned line, which keeps a
+    # 'pip freeze'-style file in order.
+    for name in sorted(changed - present):
+        if name not in after or (new_line := freeze_line(after[name])) is None:
+            continue
+        position = None
+        for index, line in enumerate(patched):
+            match = PINNED_LINE_PATTERN.match(line.strip())
+            if match is None:
+                continue
+            if normalize_name(match["name"]) > name:
+                position = index
+                break
+            position = index + 1
+        patched.insert(len(patched) if position is None else position, new_line)
+
+    return patched, patched != lines
@@ -9,21 +9,32 @@ Implements the 'run' command for the pyinit command-line tool.
 This module is responsible for executing the main entry point of a project.
 It abstracts away the need for the user to manually activate the virtual
 environment and find the path to the main script. It also supports passing
-command-line arguments directly to the user's script.
+command-line arguments directly to the user's script, a watch mode that
+restarts the script whenever `src/` changes, and profiling modes (see
+`profiling.py`). On POSIX systems the script replaces the pyinit process, and
+the resolved launch command is cached so later runs skip all of the work
+below (see `launch.py`).
 """
 
+import os
 import subprocess
 import sys
 
 from rich.console import Console
 
+from .launch import exec_launch, parse_run_options, write_launch_record
+from .lock import LOCK_FILE_NAME, sync_environment
+from .metadata import get_site_packages
+from .profiling import mem_script, profile_script, sample_script
 from .utils import (
     check_platform,
     check_project_root,
     check_venv_exists,
     find_project_root,
     get_project_name,
+    get_pyinit_config,
 )
+from .watch import watch_and_run
 from .wrappers import error_handling
 
 console = Console()
@@ -37,16 +48,20 @@ def run_project(app_args: list = None):
     This function serves as the entry point for the 'pyinit run' command.
     It locates the project, its virtual environment, and its main script
     (assumed to be `src/<package_name>/main.py`), and then runs it as a
-    subprocess, passing along any extra arguments.
+    subprocess, passing along any extra arguments. On POSIX systems the script
+    replaces the current process instead, and the resolved command is cached
+    for the fast path of later runs.
 
     :param list, optional app_args: A list of command-line arguments to pass
-                                    to the user's script. Defaults to None.
+                                    to the user's script, optionally preceded
+                                    by run options such as `--watch`,
+                                    `--profile`, `--sample` or `--mem`.
+                                    Defaults to None.
     :raises SystemExit: If not run within a valid project or if critical files
                         (like the main script or venv) are missing.
     """
     project_root = find_project_root()
-    if not app_args:
-        app_args = []
+    options, app_args = parse_run_options(app_args or [])
 
     # --- Pre-flight Checks ---
     check_project_root(project_root)
@@ -65,6 +80,16 @@ def run_project(app_args: list = None):
     # Verify that the virtual environment exists.
     check_venv_exists(venv_dir)
 
+    # --- Keep the Environment in Sync ---
+    stamped_paths = [project_root / "pyproject.toml", venv_dir / "pyvenv.cfg"]
+    if get_pyinit_config(project_root).get("auto-sync") and (
+        project_root / LOCK_FILE_NAME
+    ).exists():
+        sync_environment(project_root, console, quiet=True)
+        # The cached launch stays valid only while the lockfile and the
+        # installed packages are unchanged since this sync.
+        stamped_paths += [project_root / LOCK_FILE_NAME, get_site_packages(venv_dir)]
+
     # --- Determine Platform-specific Python Executable ---
     _, python_executable = check_platform(venv_dir)
 
@@ -73,5 +98,35 @@ def run_project(app_args: list = None):
     # Construct the full command, including the Python interpreter,
     # the script path, and any passthrough arguments.
     run_cmd = [str(python_executable), str(main_file)] + app_args
+
+    # Every run option belongs to a mode ('--profile-top' to '--profile'),
+    # and the modes exclude each other. In watch mode the script is
+    # restarted on every change under src/.
+    modes = {option.split("-")[2] for option in options}
+    if len(modes) > 1:
+        raise ValueError(
+            "Only one of '--watch', '--profile', '--sample' and '--mem' "
+            "can be used at a time."
+        )
+    if "watch" in modes:
+        sys.exit(watch_and_run(run_cmd, project_root / "src", console))
+    if "profile" in modes:
+        sys.exit(profile_script(console, project_root, run_cmd, options))
+    if "sample" in modes:
+        sample_script(console, project_root, run_cmd, options)
+    if "mem" in modes:
+        sys.exit(mem_script(console, project_root, run_cmd, options))
+
     # Execute the command. Output is streamed directly to the console.
-    subprocess.run(run_cmd, check=True)
+    if os.name != "posix":
+        subprocess.run(run_cmd, check=True)
+        return
+
+    stamped_paths.append(python_executable)
+    write_launch_record(
+        str(project_root),
+        run_cmd[:2],
+        project_name,
+        [str(path) for path in stamped_paths if path is not None],
+    )
+    exec_launch(run_cmd)
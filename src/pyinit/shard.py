@@ -0,0 +1,438 @@
+# Copyright (c) 2025 mrbooo895.
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""
+Splits a test suite across processes for 'pyinit test -j N' and '--shard'.
+
+The test IDs are collected once, then distributed by greedy bin-packing on
+the per-test durations recorded by earlier runs: the longest tests are
+placed first, each in the currently lightest group. Tests without a recorded
+duration are estimated from the size of their file. With `-j N` the groups
+run in N local pytest processes, whose output is streamed with a per-worker
+prefix and whose results are merged into one summary. With `--shard i/N`
+only the i-th of N groups runs; the split depends only on the collected
+tests, the durations file and the test files, so every CI agent computes the
+same one, and each shard's timings can be merged back with
+'--merge-durations'.
+
+pytest talks to pyinit through the `pyinit_pytest` plugin shipped in
+`pyinit/_bootstrap`, so nothing beyond pytest has to be installed in the
+project's venv.
+"""
+
+import heapq
+import json
+import os
+import subprocess
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from rich.console import Console
+from rich.markup import escape
+
+from .profiling import BOOTSTRAP_DIR
+from .utils import get_pyinit_config, write_atomic
+
+# Kept outside the ignored `.pyinit/`, so it can be committed and every CI
+# agent splits the suite the same way.
+DURATIONS_FILE = Path("tests") / ".test-durations.json"
+SHARD_DURATIONS_FILE = Path(".pyinit") / "test-durations.shard-{index}-of-{total}.json"
+PLUGIN_ARGS = ["-p", "pyinit_pytest"]
+
+# Seconds assumed for an average test if no test has a recorded duration.
+DEFAULT_DURATION = 1.0
+
+
+def get_durations_path(project_root: Path) -> Path:
+    """
+    Returns the durations file, `durations` in `[tool.pyinit.test]`.
+
+    Defaults to `tests/.test-durations.json`. Commit it (or restore it from a
+    CI cache) to share the timings that balance the shards.
+
+    :param Path project_root: The root directory of the project.
+    :rtype: Path
+    """
+    config = get_pyinit_config(project_root).get("test", {})
+    return project_root / config.get("durations", DURATIONS_FILE)
+
+
+def plugin_env(**paths: Path) -> dict:
+    """
+    Returns an environment that loads the pyinit pytest plugin.
+
+    :param Path paths: The plugin's files, by keyword: `collect`, `select`
+                       and `report` (see `pyinit_pytest`).
+    :rtype: dict
+    """
+    env = {**os.environ}
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [str(BOOTSTRAP_DIR), env.get("PYTHONPATH")])
+    )
+    for name, path in paths.items():
+        env[f"PYINIT_TEST_{name.upper()}"] = str(path)
+    return env
+
+
+def read_durations(path: Path) -> dict[str, float]:
+    """
+    Reads a durations file: the duration of every test, in seconds.
+
+    :param Path path: The durations file.
+    :rtype: dict[str, float]
+    """
+    if not path.exists():
+        return {}
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except json.JSONDecodeError:
+        return {}
+
+
+def write_durations(path: Path, durations: dict[str, float]):
+    """
+    Writes a durations file, sorted so that it diffs well under version control.
+
+    :param Path path: The durations file.
+    :param dict durations: The duration of every test, in seconds.
+    """
+    data = json.dumps(durations, indent=1, sort_keys=True) + "\n"
+    write_atomic(path, data.encode("utf-8"))
+
+
+def report_durations(results: dict[str, dict]) -> dict[str, float]:
+    """
+    Extracts the durations worth recording from the plugin's report.
+
+    Skipped tests are left out, since their duration says nothing about a
+    real run.
+
+    :param dict results: The plugin's report, by test ID.
+    :rtype: dict[str, float]
+    """
+    return {
+        nodeid: round(result["duration"], 6)
+        for nodeid, result in results.items()
+        if result["outcome"] != "skipped"
+    }
+
+
+def collect_tests(
+    python_executable: Path, project_root: Path, pytest_args: list[str]
+) -> list[str]:
+    """
+    Collects the test IDs pytest would run with the given arguments.
+
+    :param Path python_executable: The venv's Python interpreter.
+    :param Path project_root: The root directory of the project.
+    :param list pytest_args: The user's pytest arguments.
+    :return: The test IDs, in collection order.
+    :rtype: list[str]
+    :raises RuntimeError: If the collection fails.
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        output = Path(temp_dir) / "collected.json"
+        result = subprocess.run(
+            [str(python_executable), "-m", "pytest", "--collect-only", "-q"]
+            + PLUGIN_ARGS
+            + pytest_args,
+            cwd=project_root,
+            env=plugin_env(collect=output),
+            capture_output=True,
+            text=True,
+        )
+        # Exit code 5 means that no tests were collected.
+        if result.returncode not in (0, 5) or not output.exists():
+            details = (result.stdout + result.stderr).strip()
+            raise RuntimeError(f"Test collection failed:\n{details}")
+        return json.loads(output.read_text(encoding="utf-8"))
+
+
+def estimate_durations(
+    project_root: Path, tests: list[str], durations: dict[str, float]
+) -> dict[str, float]:
+    """
+    Completes the recorded durations with estimates for the other tests.
+
+    A test without a recorded duration is estimated from its share of its
+    file's size (the file's size divided by its number of tests), at the
+    seconds per byte measured on the recorded tests, or such that an average
+    test takes `DEFAULT_DURATION` if none is recorded.
+
+    :param Path project_root: The root directory of the project.
+    :param list tests: The collected test IDs.
+    :param dict durations: The recorded durations, in seconds.
+    :return: The recorded or estimated duration of every test.
+    :rtype: dict[str, float]
+    """
+    files = [nodeid.split("::")[0] for nodeid in tests]
+    counts = {}
+    for file in files:
+        counts[file] = counts.get(file, 0) + 1
+    sizes = {}
+    for file in counts:
+        path = project_root / file
+        sizes[file] = path.stat().st_size if path.is_file() else 0
+    shares = {
+        nodeid: sizes[file] / counts[file] for nodeid, file in zip(tests, files)
+    }
+    # Tests outside of a regular file (e.g. collected by a plugin) count as
+    # the average test.
+    mean_share = sum(shares.values()) / len(shares) if shares else 0
+    shares = {nodeid: share or mean_share or 1 for nodeid, share in shares.items()}
+
+    known = [nodeid for nodeid in tests if nodeid in durations]
+    known_share = sum(shares[nodeid] for nodeid in known)
+    known_time = sum(durations[nodeid] for nodeid in known)
+    if known_share and known_time:
+        rate = known_time / known_share
+    else:
+        rate = DEFAULT_DURATION / (sum(shares.values()) / len(shares))
+    return {
+        nodeid: durations[nodeid] if nodeid in durations else shares[nodeid] * rate
+        for nodeid in tests
+    }
+
+
+def balance_tests(
+    tests: list[str], durations: dict[str, float], groups: int
+) -> list[list[str]]:
+    """
+    Splits tests into groups of about equal total duration.
+
+    Longest-processing-time-first: the tests are placed from the longest to
+    the shortest, each in the group with the smallest total so far. Ties are
+    broken by collection order, so the split is deterministic, and every
+    group keeps the collection order to preserve fixture locality.
+
+    :param list tests: The test IDs, in collection order.
+    :param dict durations: The duration of every test, in seconds (see
+                           `estimate_durations`).
+    :param int groups: The number of groups.
+    :return: The groups; some are empty if there are fewer tests than groups.
+    :rtype: list[list[str]]
+    """
+    order = sorted(
+        range(len(tests)), key=lambda index: (-durations[tests[index]], index)
+    )
+    loads = [(0.0, group) for group in range(groups)]
+    members = [[] for _ in range(groups)]
+    for index in order:
+        load, group = heapq.heappop(loads)
+        members[group].append(index)
+        heapq.heappush(loads, (load + durations[tests[index]], group))
+    return [[tests[index] for index in sorted(group)] for group in members]
+
+
+def parse_shard(value: str) -> tuple[int, int]:
+    """
+    Parses a '--shard' value, e.g. '2/8'.
+
+    :param str value: The value, 'INDEX/TOTAL' with 1 <= INDEX <= TOTAL.
+    :rtype: tuple[int, int]
+    :raises ValueError: If the value is malformed.
+    """
+    index, _, total = value.partition("/")
+    if not (index.isdigit() and total.isdigit() and 1 <= int(index) <= int(total)):
+        raise ValueError(f"Invalid shard '{value}': expected INDEX/TOTAL, e.g. '1/4'.")
+    return int(index), int(total)
+
+
+def merge_duration_files(paths: list[Path]) -> dict[str, float]:
+    """
+    Combines durations files; later files win for tests found in several.
+
+    :param list paths: The durations files, e.g. one per shard.
+    :rtype: dict[str, float]
+    """
+    durations = {}
+    for path in paths:
+        durations.update(read_durations(path))
+    return durations
+
+
+def run_single(
+    python_executable: Path,
+    project_root: Path,
+    pytest_args: list[str],
+    tests: list[str] | None = None,
+) -> tuple[int, dict]:
+    """
+    Runs pytest in one process with its output going straight to the console.
+
+    :param Path python_executable: The venv's Python interpreter.
+    :param Path project_root: The root directory of the project.
+    :param list pytest_args: The user's pytest arguments.
+    :param list, optional tests: Only run these test IDs. Defaults to all.
+    :return: pytest's return code and the plugin's report.
+    :rtype: tuple[int, dict]
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        paths = {"report": Path(temp_dir) / "report.json"}
+        if tests is not None:
+            paths["select"] = Path(temp_dir) / "tests.select"
+            paths["select"].write_text("\n".join(tests) + "\n", encoding="utf-8")
+        returncode = subprocess.run(
+            [str(python_executable), "-m", "pytest"] + PLUGIN_ARGS + pytest_args,
+            cwd=project_root,
+            env=plugin_env(**paths),
+        ).returncode
+        report = paths["report"]
+        if not report.exists():
+            return returncode, {}
+        return returncode, json.loads(report.read_text(encoding="utf-8"))
+
+
+def run_worker(
+    name: str,
+    python_executable: Path,
+    project_root: Path,
+    pytest_args: list[str],
+    tests: list[str],
+    work_dir: Path,
+    console: Console,
+    lock: threading.Lock,
+) -> tuple[int, dict, float]:
+    """
+    Runs a group of tests in one pytest process, streaming its prefixed output.
+
+    :param str name: The worker's name, used as the output prefix.
+    :param Path python_executable: The venv's Python interpreter.
+    :param Path project_root: The root directory of the project.
+    :param list pytest_args: The user's pytest arguments.
+    :param list tests: The test IDs this worker runs.
+    :param Path work_dir: A directory for the worker's plugin files.
+    :param Console console: The rich Console instance for printing messages.
+    :param threading.Lock lock: A lock serializing writes to the console.
+    :return: The return code, the plugin's report and the duration in seconds.
+    :rtype: tuple[int, dict, float]
+    """
+    select = work_dir / f"{name}.select"
+    report = work_dir / f"{name}.json"
+    select.write_text("\n".join(tests) + "\n", encoding="utf-8")
+
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [str(python_executable), "-m", "pytest"] + PLUGIN_ARGS + pytest_args,
+        cwd=project_root,
+        env=plugin_env(select=select, report=report),
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        errors="replace",
+    )
+    for line in process.stdout:
+        with lock:
+            console.print(
+                f"[bold cyan]{name}[/] | {escape(line.rstrip())}",
+                highlight=False,
+                soft_wrap=True,
+            )
+    returncode = process.wait()
+    duration = time.perf_counter() - start
+    results = json.loads(report.read_text(encoding="utf-8")) if report.exists() else {}
+    return returncode, results, duration
+
+
+def run_parallel(
+    console: Console,
+    python_executable: Path,
+    project_root: Path,
+    pytest_args: list[str],
+    tests: list[str],
+    durations: dict[str, float],
+    jobs: int,
+) -> tuple[bool, dict]:
+    """
+    Handles 'pyinit test -j N': runs the tests over N balanced workers.
+
+    :param Console console: The rich Console instance for output.
+    :param Path python_executable: The venv's Python interpreter.
+    :param Path project_root: The root directory of the project.
+    :param list pytest_args: The user's pytest arguments.
+    :param list tests: The test IDs to run, in collection order.
+    :param dict durations: The duration of every test, in seconds.
+    :param int jobs: The number of workers, 0 for one per CPU.
+    :return: Whether every test passed, and the merged report of the workers.
+    :rtype: tuple[bool, dict]
+    """
+    groups = [
+        group
+        for group in balance_tests(tests, durations, jobs or os.cpu_count() or 1)
+        if group
+    ]
+    width = len(str(len(groups)))
+    names = [f"w{index:0{width}}" for index in range(1, len(groups) + 1)]
+    console.print(
+        f"[bold green]    Running[/bold green] {len(tests)} tests in "
+        f"{len(groups)} workers\n"
+    )
+
+    lock = threading.Lock()
+    started = time.perf_counter()
+    with tempfile.TemporaryDirectory() as temp_dir, ThreadPoolExecutor(
+        max_workers=len(groups)
+    ) as executor:
+        futures = [
+            executor.submit(
+                run_worker,
+                name,
+                python_executable,
+                project_root,
+                pytest_args,
+                group,
+                Path(temp_dir),
+                console,
+                lock,
+            )
+            for name, group in zip(names, groups)
+        ]
+        outcomes = [future.result() for future in futures]
+    total_time = time.perf_counter() - started
+
+    # --- Merged Report ---
+    results = {}
+    for _, worker_results, _ in outcomes:
+        results.update(worker_results)
+
+    console.print("\n[bold green]    Summary[/bold green]")
+    for name, group, (returncode, worker_results, duration) in zip(
+        names, groups, outcomes
+    ):
+        # pytest exits with 0 if all tests passed and 1 if some failed; any
+        # other code means the worker itself broke down.
+        status = {0: "PASSED", 1: "FAILED"}.get(returncode, f"EXIT {returncode}")
+        style = "bold green" if returncode == 0 else "bold red"
+        console.print(
+            f"  {name}  [{style}]{status:<7}[/] {len(worker_results):>5}/{len(group)} "
+            f"tests  {duration:.2f}s",
+            highlight=False,
+        )
+
+    counts = {"passed": 0, "failed": 0, "error": 0, "skipped": 0}
+    for result in results.values():
+        counts[result["outcome"]] += 1
+    for nodeid in tests:
+        outcome = results.get(nodeid, {}).get("outcome", "not run")
+        if outcome in ("failed", "error", "not run"):
+            console.print(
+                f"  [bold red]{outcome.upper()}[/] {escape(nodeid)}", highlight=False
+            )
+    missing = len(tests) - len(results)
+
+    console.print(
+        f"\n[bold green]->[/] {counts['passed']} passed, {counts['failed']} failed, "
+        f"{counts['error']} errors, {counts['skipped']} skipped"
+        + (f", {missing} not run" if missing else "")
+        + f" in {total_time:.2f}s"
+    )
+    passed = not (counts["failed"] or counts["error"] or missing) and all(
+        returncode == 0 for returncode, _, _ in outcomes
+    )
+    return passed, results
@@ -0,0 +1,234 @@
+# Copyright (c) 2025 mrbooo895.
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""
+Implements the 'venv slim' command for the pyinit command-line tool.
+
+'pyinit venv slim' shrinks a virtual environment for deployment images. It
+removes test suites, documentation and (optionally) type stubs shipped inside
+installed distributions, along with stale bytecode, and rewrites each
+distribution's `RECORD` so pip can still upgrade or uninstall it. What is
+removed can be tuned in the `[tool.pyinit.slim]` table of `pyproject.toml`.
+"""
+
+import csv
+import fnmatch
+import io
+import os
+import sys
+from importlib.metadata import Distribution
+from pathlib import Path, PurePosixPath
+
+from rich.console import Console
+
+from .bytecode import compile_paths, get_compile_config
+from .metadata import get_installed_distributions, get_site_packages, get_venv_python_version
+from .utils import check_platform, get_pyinit_config, write_atomic
+
+TEST_DIRS = {"tests"}
+DOC_DIRS = {"doc", "docs"}
+DOC_SUFFIXES = {".md", ".rst"}
+
+
+def get_slim_config(project_root: Path) -> dict:
+    """
+    Reads the `[tool.pyinit.slim]` settings, filling in the defaults.
+
+    :param Path project_root: The root directory of the project.
+    :rtype: dict
+    """
+    config = {"tests": True, "docs": True, "stubs": False, "remove": [], "compile": False}
+    config.update(get_pyinit_config(project_root).get("slim", {}))
+    return config
+
+
+def is_removable(relative: PurePosixPath, config: dict) -> bool:
+    """
+    Tells whether a file recorded by a distribution can be removed.
+
+    Only files inside packages are considered: top-level modules, metadata
+    directories and files installed outside site-packages are always kept.
+
+    :param PurePosixPath relative: The file's path relative to site-packages.
+    :param dict config: The slim settings.
+    :rtype: bool
+    """
+    parts = relative.parts
+    if len(parts) < 2 or parts[0] == ".." or parts[0].endswith((".dist-info", ".egg-info")):
+        return False
+    if any(fnmatch.fnmatch(str(relative), pattern) for pattern in config["remove"]):
+        return True
+
+    # Directory names are only matched below the top-level package, so a
+    # distribution whose import name is 'tests' or 'docs' is never stripped.
+    directories = parts[1:-1]
+    if config["tests"] and TEST_DIRS.intersection(directories):
+        return True
+    if config["docs"] and (
+        DOC_DIRS.intersection(directories) or relative.suffix in DOC_SUFFIXES
+    ):
+        return True
+    return config["stubs"] and relative.suffix == ".pyi"
+
+
+def is_stale_bytecode(path: Path, cache_tag: str) -> bool:
+    """
+    Tells whether a `__pycache__` entry can never be used again.
+
+    :param Path path: A file inside a `__pycache__` directory.
+    :param str cache_tag: The venv interpreter's cache tag, e.g. 'cpython-311'.
+    :rtype: bool
+    """
+    name_parts = path.name.split(".")
+    if path.suffix != ".pyc" or len(name_parts) < 3:
+        return False
+    source = path.parent.parent / f"{name_parts[0]}.py"
+    return name_parts[1] != cache_tag or not source.exists()
+
+
+def _remove_file(path: Path, removed_from: set[Path] | None = None) -> int:
+    try:
+        size = path.stat().st_size
+        path.unlink()
+    except FileNotFoundError:
+        return 0
+    if removed_from is not None:
+        removed_from.add(path.parent)
+    return size
+
+
+def slim_distribution(
+    dist: Distribution,
+    site_packages: Path,
+    config: dict,
+    cache_tag: str,
+    removed_from: set[Path] | None = None,
+) -> int:
+    """
+    Removes the removable files of one distribution and rewrites its RECORD.
+
+    :param Distribution dist: The installed distribution.
+    :param Path site_packages: The venv's site-packages directory.
+    :param dict config: The slim settings.
+    :param str cache_tag: The venv interpreter's cache tag.
+    :param set removed_from: If given, collects the directories files were
+                             removed from.
+    :return: The number of bytes freed.
+    :rtype: int
+    """
+    record_text = dist.read_text("RECORD")
+    if not record_text:
+        return 0
+
+    rows = [row for row in csv.reader(io.StringIO(record_text)) if row]
+    freed = 0
+    kept = []
+    for row in rows:
+        relative = PurePosixPath(row[0])
+        if is_removable(relative, config):
+            freed += _remove_file(site_packages / relative, removed_from)
+            continue
+        kept.append(row)
+
+    # Bytecode of removed sources is stale; drop it from RECORD as well.
+    record = []
+    for row in kept:
+        relative = PurePosixPath(row[0])
+        if relative.parent.name == "__pycache__" and (
+            is_stale_bytecode(site_packages / relative, cache_tag)
+        ):
+            freed += _remove_file(site_packages / relative, removed_from)
+            continue
+        record.append(row)
+
+    record_path = next(
+        (
+            site_packages / row[0]
+            for row in record
+            if PurePosixPath(row[0]).name == "RECORD"
+            and PurePosixPath(row[0]).parent.name.endswith(".dist-info")
+        ),
+        None,
+    )
+    if record_path is not None and len(record) != len(rows):
+        output = io.StringIO()
+        csv.writer(output, lineterminator="\n").writerows(record)
+        write_atomic(record_path, output.getvalue().encode("utf-8"))
+    return freed
+
+
+def remove_stale_bytecode(
+    site_packages: Path, cache_tag: str, removed_from: set[Path] | None = None
+) -> int:
+    """
+    Removes unusable `__pycache__` entries and the directories emptied by slimming.
+
+    Only directories left empty by files removed in this run are deleted;
+    empty directories that were already in site-packages are kept.
+
+    :param Path site_packages: The venv's site-packages directory.
+    :param str cache_tag: The venv interpreter's cache tag.
+    :param set removed_from: The directories `slim_distribution` removed files from.
+    :return: The number of bytes freed.
+    :rtype: int
+    """
+    removed_from = set() if removed_from is None else removed_from
+    freed = 0
+    for root, _, files in os.walk(site_packages):
+        directory = Path(root)
+        if directory.name == "__pycache__":
+            for name in files:
+                path = directory / name
+                if is_stale_bytecode(path, cache_tag):
+                    freed += _remove_file(path, removed_from)
+
+    # Deepest first, walking up while removing a directory empties its parent.
+    for directory in sorted(removed_from, key=lambda p: len(p.parts), reverse=True):
+        while (
+            directory.is_relative_to(site_packages)
+            and directory != site_packages
+            and directory.is_dir()
+            and not any(directory.iterdir())
+        ):
+            directory.rmdir()
+            directory = directory.parent
+    return freed
+
+
+def slim_virtual_env(console: Console, venv_dir: Path, compile_sources: bool = False):
+    """
+    Handles the 'pyinit venv slim' command.
+
+    :param Console console: The rich Console instance for output.
+    :param Path venv_dir: The project's virtual environment.
+    :param bool compile_sources: If True, precompiles the remaining sources.
+                                 The `compile` setting enables it as well.
+    """
+    site_packages = get_site_packages(venv_dir)
+    if site_packages is None:
+        console.print("[bold red][ERROR][/bold red] No site-packages found in 'venv'.")
+        sys.exit(1)
+
+    config = get_slim_config(venv_dir.parent)
+    version = get_venv_python_version(venv_dir).split(".")
+    cache_tag = f"{sys.implementation.name}-{version[0]}{version[1]}"
+
+    console.print("[bold green]     Slimming[/bold green] site-packages")
+    freed = 0
+    removed_from: set[Path] = set()
+    distributions = get_installed_distributions(venv_dir)
+    for dist in distributions.values():
+        freed += slim_distribution(dist, site_packages, config, cache_tag, removed_from)
+    freed += remove_stale_bytecode(site_packages, cache_tag, removed_from)
+
+    if compile_sources or config["compile"]:
+        console.print("[bold green]    Compiling[/bold green] remaining sources")
+        _, python_executable = check_platform(venv_dir)
+        compile_paths(python_executable, [site_packages], get_compile_config(venv_dir.parent))
+
+    console.print(
+        f"[bold green]Successfully[/bold green] slimmed {len(distributions)} "
+        f"distribution(s), freeing {freed / (1024 * 1024):.1f} MiB."
+    )
@@ -9,22 +9,91 @@ Implements the 'test' command for the pyinit command-line tool.
 This module provides a convenient wrapper for running tests using the 'pytest'
 framework. It handles the automatic installation of pytest if it is not found
 and allows for passing additional arguments directly to the pytest runner.
+Every run records the duration of each test, which 'pyinit test -j N' uses to
+balance the tests across N worker processes and 'pyinit test --shard i/N'
+to pick a balanced i-th of N subsets for CI agents. 'pyinit test --affected'
+only runs the tests that depend on the files changed against a git ref.
+A history of every test's results is kept to run the tests that failed last
+time first, to report the slowest tests and to flag flaky ones.
 """
 
-import subprocess
+import glob
+import os
 import sys
+from pathlib import Path
 
 from rich.console import Console
 
+from .affected import (
+    code_fingerprints,
+    find_affected_tests,
+    get_changed_files,
+    scan_sources,
+)
+from .history import (
+    print_history_report,
+    read_history,
+    record_results,
+    write_history,
+    write_priority,
+)
+from .launch import parse_run_options
+from .lock import LOCK_FILE_NAME, sync_environment
+from .shard import (
+    SHARD_DURATIONS_FILE,
+    balance_tests,
+    collect_tests,
+    estimate_durations,
+    get_durations_path,
+    merge_duration_files,
+    parse_shard,
+    read_durations,
+    report_durations,
+    run_parallel,
+    run_single,
+    write_durations,
+)
 from .utils import (
     check_platform,
     check_project_root,
     check_venv_exists,
     ensure_tool_installed,
     find_project_root,
+    get_pyinit_config,
 )
 from .wrappers import error_handling
 
+# Options of 'pyinit test' itself. They must come before the pytest
+# arguments; '--' ends them explicitly.
+TEST_FLAGS = {"--merge-durations", "--affected"}
+TEST_OPTIONS = {"-j", "--jobs", "--shard", "--base"}
+
+
+def merge_durations(console: Console, project_root: Path, paths: list[str]):
+    """
+    Handles 'pyinit test --merge-durations': folds per-shard timings back in.
+
+    :param Console console: The rich Console instance for output.
+    :param Path project_root: The root directory of the project.
+    :param list paths: The shard durations files. Defaults to those written
+                       to `.pyinit` by '--shard'.
+    """
+    if not paths:
+        pattern = str(project_root / SHARD_DURATIONS_FILE)
+        paths = sorted(glob.glob(pattern.format(index="*", total="*")))
+    if not paths:
+        console.print(
+            "[bold yellow][INFO][/bold yellow] No shard durations files to merge."
+        )
+        return
+    durations_path = get_durations_path(project_root)
+    merged = merge_duration_files([Path(path) for path in paths])
+    write_durations(durations_path, {**read_durations(durations_path), **merged})
+    console.print(
+        f"[bold green]     Merged[/bold green] {len(merged)} test durations from "
+        f"{len(paths)} file(s) into '{durations_path.relative_to(project_root)}'"
+    )
+
 
 @error_handling
 def run_tests(pytest_args: list = None):
@@ -38,21 +107,31 @@ def run_tests(pytest_args: list = None):
        passed as arguments).
     3. Ensures pytest is installed in the virtual environment, installing it
        if necessary.
-    4. Executes pytest, passing along any user-provided arguments.
+    4. Executes pytest, passing along any user-provided arguments, either in
+       a single process or, with `-j N`, split across N worker processes.
 
-    :param list, optional pytest_args: A list of arguments to be passed directly
-                                       to the pytest command. Defaults to None.
+    :param list, optional pytest_args: The 'pyinit test' options followed by
+                                       the arguments to be passed directly to
+                                       the pytest command. Defaults to None.
     :raises SystemExit: If not run within a valid project, if the virtual
                         environment is not found, or if the installation of
                         pytest fails.
     """
     console = Console()
     project_root = find_project_root()
-    if not pytest_args:
-        pytest_args = []
+    options, pytest_args = parse_run_options(
+        pytest_args or [], TEST_FLAGS, TEST_OPTIONS
+    )
+    jobs = options.get("--jobs", options.get("-j"))
+    if jobs is not None and not jobs.isdigit():
+        raise ValueError("'-j' expects a number of workers (0 for one per CPU).")
+    shard = parse_shard(options["--shard"]) if "--shard" in options else None
 
     # --- Pre-flight Checks ---
     check_project_root(project_root)
+    if options.get("--merge-durations"):
+        merge_durations(console, project_root, pytest_args)
+        return
     venv_dir = project_root / "venv"
     check_venv_exists(venv_dir)
 
@@ -70,6 +149,12 @@ def run_tests(pytest_args: list = None):
     # --- Determine Platform-specific Executables ---
     pip_executable, python_executable = check_platform(venv_dir)
 
+    # --- Keep the Environment in Sync ---
+    if get_pyinit_config(project_root).get("auto-sync") and (
+        project_root / LOCK_FILE_NAME
+    ).exists():
+        sync_environment(project_root, console, quiet=True)
+
     # --- Ensure Pytest is Installed ---
     # The utility function now handles the check and installation logic.
     ensure_tool_installed(
@@ -80,13 +165,120 @@ def run_tests(pytest_args: list = None):
         console=console,
     )
 
+    # --- Test History ---
+    # Tests that failed last time run first, then those whose code changed.
+    config = get_pyinit_config(project_root).get("test", {})
+    history_size = config.get("history", 20)
+    sources = None
+    if history_size or options.get("--affected"):
+        sources = scan_sources(project_root)
+    if history_size:
+        history = read_history(project_root)
+        fingerprints = code_fingerprints(project_root, sources)
+        priority_path, failed, changed_files = write_priority(
+            project_root, history, fingerprints
+        )
+        os.environ["PYINIT_TEST_PRIORITY"] = str(priority_path)
+        if history and (failed or changed_files):
+            console.print(
+                f"[bold green]      First[/bold green] {failed} previously failed "
+                f"test(s), then {changed_files} changed test file(s)"
+            )
+
+    # --- Select Tests ---
+    affected = None
+    if options.get("--affected"):
+        base = options.get("--base") or config.get("base", "HEAD")
+        changed = get_changed_files(project_root, base)
+        affected = find_affected_tests(sources, changed)
+        if affected is None:
+            console.print(
+                f"[bold yellow][INFO][/bold yellow] {len(changed)} file(s) changed "
+                f"since '{base}', including project-wide settings: running all tests."
+            )
+        elif not affected:
+            console.print(
+                f"[bold yellow][INFO][/bold yellow] No tests are affected by the "
+                f"{len(changed)} file(s) changed since '{base}'."
+            )
+            sys.exit(0)
+
+    durations_path = get_durations_path(project_root)
+    tests = None
+    if jobs is not None or shard or affected:
+        tests = collect_tests(python_executable, project_root, pytest_args)
+        if affected:
+            tests = [
+                nodeid for nodeid in tests if nodeid.split("::")[0] in affected
+            ]
+            console.print(
+                f"[bold green]   Affected[/bold green] {len(tests)} tests in "
+                f"{len(affected)} file(s) by {len(changed)} changed file(s) since "
+                f"'{base}'"
+            )
+    if jobs is not None or shard:
+        recorded = read_durations(durations_path)
+        durations = estimate_durations(project_root, tests, recorded)
+        console.print(
+            f"[bold green]  Collected[/bold green] {len(tests)} tests "
+            f"({sum(nodeid in recorded for nodeid in tests)} with recorded durations)"
+        )
+        if shard:
+            index, total = shard
+            tests = balance_tests(tests, durations, total)[index - 1]
+            estimate = sum(durations[nodeid] for nodeid in tests)
+            console.print(
+                f"[bold green]      Shard[/bold green] {index}/{total}: "
+                f"{len(tests)} tests, about {estimate:.1f}s"
+            )
+    if tests is not None and not tests:
+        console.print("[bold yellow][INFO][/bold yellow] No tests to run.")
+        sys.exit(0)
+
     # --- Run Tests ---
-    console.print("[bold green]Running[/bold green] tests")
+    if jobs is not None:
+        passed, results = run_parallel(
+            console,
+            python_executable,
+            project_root,
+            pytest_args,
+            tests,
+            durations,
+            int(jobs),
+        )
+    else:
+        console.print("[bold green]Running[/bold green] tests")
+        # Execute pytest, with the plugin that reports the duration of every
+        # test. CWD is set to project root for consistent path discovery.
+        # Output is streamed directly to the console.
+        returncode, results = run_single(
+            python_executable, project_root, pytest_args, tests
+        )
+        passed = returncode == 0
+
+    # --- Record Durations ---
+    # A shard only writes its own timings, to be merged once every shard is
+    # done, so that all shards balance on the same durations file.
+    if shard:
+        shard_path = project_root / str(SHARD_DURATIONS_FILE).format(
+            index=shard[0], total=shard[1]
+        )
+        write_durations(shard_path, report_durations(results))
+        console.print(
+            f"[bold green]      Wrote[/bold green] the shard's durations to "
+            f"'{shard_path.relative_to(project_root)}'"
+        )
+    elif results:
+        write_durations(
+            durations_path,
+            {**read_durations(durations_path), **report_durations(results)},
+        )
 
-    # Construct the command to run pytest as a module.
-    run_tests_cmd = [str(python_executable), "-m", "pytest"] + pytest_args
+    if history_size:
+        record_results(history, results, fingerprints, history_size)
+        write_history(project_root, history)
+        print_history_report(console, history, results, config.get("slowest", 5))
 
-    # Execute pytest. CWD is set to project root for consistent path discovery.
-    # Output is streamed directly to the console.
-    subprocess.run(run_tests_cmd, cwd=project_root)
+    if tests is not None:
+        sys.exit(0 if passed else 1)
     console.print("\n[bold green]Testing[/bold green] process completed.")
@@ -9,36 +9,101 @@ Implements the 'uninstall' command for the pyinit command-line tool.
 This module contains the logic for removing one or more Python packages from
 the active project's virtual environment. It verifies which packages are
 actually installed before prompting for removal, and after a successful
-uninstallation, it automatically updates the `requirements.txt` file.
+uninstallation, it automatically updates the `requirements.txt` file. With
+`--autoremove`, dependencies that nothing else needs anymore are removed too.
 """
 
 import subprocess
 import sys
+from importlib.metadata import Distribution
 
+from packaging.requirements import InvalidRequirement, Requirement
 from rich.console import Console
 
 # Import the shared utility function from the 'install' module.
 from .install import update_requirements
+from .lock import TOOL_PACKAGES, UNMANAGED_PACKAGES, get_dependency_groups
+from .metadata import get_installed_distributions, get_marker_environment, get_requirements
 from .utils import (
     check_platform,
     check_project_root,
     check_venv_exists,
     find_project_root,
+    get_project_name,
+    normalize_name,
 )
 from .wrappers import error_handling
 
 
+def find_orphans(
+    installed: dict[str, Distribution],
+    removed: set[str],
+    roots: list[Requirement],
+    environment: dict[str, str],
+    keep: set[str],
+) -> list[str]:
+    """
+    Finds the distributions left unused once some others are removed.
+
+    The dependency graph is built from each distribution's `Requires-Dist`.
+    A distribution is kept if it is reachable from the declared requirements
+    (`roots`), from the names in `keep`, from a distribution that was
+    top-level (required by nothing) before the removal, or from one that was
+    installed on request (its dist-info has a `REQUESTED` marker).
+
+    :param dict installed: A mapping of normalized name to installed distribution.
+    :param set removed: Normalized names of the distributions being removed.
+    :param list roots: The project's declared requirements.
+    :param dict environment: The venv's PEP 508 marker environment.
+    :param set keep: Normalized names that must never be removed.
+    :return: The normalized names of the orphaned distributions, sorted.
+    :rtype: list[str]
+    """
+    required = {
+        normalize_name(dep.name)
+        for dist in installed.values()
+        for dep in get_requirements(dist, environment)
+    }
+    requested = {
+        name for name, dist in installed.items() if dist.read_text("REQUESTED") is not None
+    }
+    stack = [
+        (name, frozenset())
+        for name in installed
+        if name in keep
+        or (name not in removed and (name not in required or name in requested))
+    ]
+    stack.extend((normalize_name(req.name), frozenset(req.extras)) for req in roots)
+
+    reachable = set()
+    visited = set()
+    while stack:
+        name, extras = stack.pop()
+        if name in removed or name not in installed or (name, extras) in visited:
+            continue
+        visited.add((name, extras))
+        reachable.add(name)
+        for dep in get_requirements(installed[name], environment, tuple(sorted(extras))):
+            stack.append((normalize_name(dep.name), frozenset(dep.extras)))
+
+    return sorted(set(installed) - reachable - removed)
+
+
 @error_handling
-def uninstall_modules(modules_to_uninstall: list):
+def uninstall_modules(modules_to_uninstall: list, autoremove: bool = False):
     """
     Uninstalls one or more Python modules and updates requirements.txt.
 
     This function serves as the primary entry point for the 'pyinit uninstall'
     command. It first checks which of the requested packages are actually
     installed, prompts the user for confirmation on that filtered list,
-    uninstalls them, and then regenerates the `requirements.txt` file.
+    uninstalls them, and then updates the `requirements.txt` file.
 
     :param list modules_to_uninstall: A list of package names to uninstall.
+    :param bool autoremove: If True, also removes the dependencies that are no
+                            longer required by the project's declared
+                            dependencies or by the remaining top-level
+                            packages. Defaults to False.
     :raises SystemExit: If not run within a valid project, if the venv is not
                         found, if the user cancels, or if uninstallation fails.
     """
@@ -54,20 +119,15 @@ def uninstall_modules(modules_to_uninstall: list):
     pip_executable, _ = check_platform(venv_dir)
 
     # --- Verify which packages are actually installed ---
-
-    freeze_result = subprocess.run(
-        [str(pip_executable), "freeze"], check=True, capture_output=True, text=True
-    )
-    # Create a set of normalized installed package names for fast lookups.
-    installed_packages = {
-        line.split("==")[0].lower().replace("-", "_")
-        for line in freeze_result.stdout.strip().split("\n")
+    # The snapshot is also used to patch requirements.txt afterwards.
+    installed_distributions = get_installed_distributions(venv_dir)
+    installed_before = {
+        name: dist.version for name, dist in installed_distributions.items()
     }
     # Filter the user's list to only include packages that are actually installed.
     packages_to_actually_uninstall = []
     for module in modules_to_uninstall:
-        normalized_module = module.lower().replace("-", "_")
-        if normalized_module in installed_packages:
+        if normalize_name(module) in installed_before:
             packages_to_actually_uninstall.append(module)
         else:
             console.print(f"[bold yellow][INFO][/] Package '{module}' is not installed")
@@ -76,11 +136,41 @@ def uninstall_modules(modules_to_uninstall: list):
         console.print("[green]\n->[/] Nothing to uninstall.")
         sys.exit(0)
 
+    # --- Find Orphaned Dependencies ---
+    orphans = []
+    if autoremove:
+        roots = []
+        for lines in get_dependency_groups(project_root).values():
+            for line in lines:
+                try:
+                    roots.append(Requirement(line))
+                except InvalidRequirement:
+                    continue
+        keep = (
+            UNMANAGED_PACKAGES
+            | TOOL_PACKAGES
+            | {normalize_name(get_project_name(project_root) or "")}
+        )
+        orphans = find_orphans(
+            installed_distributions,
+            {normalize_name(m) for m in packages_to_actually_uninstall},
+            roots,
+            get_marker_environment(venv_dir),
+            keep,
+        )
+
     # --- Confirmation Phase ---
     modules_str = ", ".join(f"'{m}'" for m in packages_to_actually_uninstall)
     console.print(
         f"[bold green]->[/] The following packages will be uninstalled: {modules_str}"
     )
+    if orphans:
+        orphans_str = ", ".join(
+            f"'{installed_distributions[name].metadata['Name']}'" for name in orphans
+        )
+        console.print(
+            f"[bold green]->[/] The following unused dependencies will be removed: {orphans_str}"
+        )
 
     confirm = console.input("Are you sure you want to proceed? (y/N): ")
     if confirm.lower() != "y":
@@ -94,15 +184,15 @@ def uninstall_modules(modules_to_uninstall: list):
         str(pip_executable),
         "uninstall",
         "-y",
-    ] + packages_to_actually_uninstall
+    ] + packages_to_actually_uninstall + orphans
     subprocess.run(
         uninstall_cmd,
         check=True,
         capture_output=True,
     )
     console.print(
-        f"[bold green]Successfully[/bold green] Uninstalled {len(packages_to_actually_uninstall)} package(s)."
+        f"[bold green]Successfully[/bold green] Uninstalled {len(packages_to_actually_uninstall) + len(orphans)} package(s)."
     )
 
     # --- Update Lock File ---
-    update_requirements(project_root, pip_executable, console)
+    update_requirements(project_root, pip_executable, console, installed_before)
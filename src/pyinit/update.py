@@ -16,30 +16,44 @@ import sys
 
 from rich.console import Console
 
+from .cache import IndexCache, OfflineCacheMiss, get_index_cache_ttl
+from .index import DEFAULT_MAX_CONNECTIONS, find_outdated, get_index_url
+
 # Import the shared utility function from the 'install' module.
 from .install import update_requirements
+from .metadata import (
+    get_installed_versions,
+    get_supported_tags,
+    get_venv_python_version,
+)
 from .utils import (
     check_platform,
     check_project_root,
     check_venv_exists,
     find_project_root,
+    get_pyinit_config,
 )
+from .wheelhouse import get_wheelhouse_dir, has_wheels, wheelhouse_pip_args
 from .wrappers import error_handling
 
 
 @error_handling
-def update_modules(upgrade: bool = False):
+def update_modules(upgrade: bool = False, offline: bool = False):
     """
     Checks for or applies updates to project dependencies intelligently.
 
     This function is the entry point for the 'pyinit update' command. It first
-    runs `pip list --outdated` to identify which packages have updates.
+    queries the package index for the installed packages to identify which
+    ones have updates.
     - If `upgrade` is False, it displays this list.
     - If `upgrade` is True, it proceeds to upgrade only those outdated packages.
     It exits gracefully if all packages are already up-to-date.
 
     :param bool upgrade: If True, upgrades outdated packages. If False, only
                          checks for them. Defaults to False.
+    :param bool offline: If True, answers purely from the index cache without
+                         any network access, and upgrades from the wheelhouse.
+                         Defaults to False.
     :raises SystemExit: If not run in a valid project or if a subprocess fails.
     """
     console = Console()
@@ -53,19 +67,60 @@ def update_modules(upgrade: bool = False):
     # --- Determine Platform-specific Executables ---
     pip_executable, _ = check_platform(venv_dir)
 
+    # --- Offline Upgrades from the Wheelhouse ---
+    # Without network access, pip can only upgrade from the wheelhouse.
+    pip_source_args = []
+    if offline and upgrade:
+        wheelhouse = get_wheelhouse_dir(project_root)
+        if not has_wheels(wheelhouse):
+            console.print(
+                f"[bold red][ERROR][/bold red] No wheelhouse found at '{wheelhouse}'. Run 'pyinit wheelhouse sync' first."
+            )
+            sys.exit(1)
+        pip_source_args = wheelhouse_pip_args(wheelhouse)
+
     # --- Step 1: Always check for outdated packages first ---
+    # Installed versions are read from site-packages and the index is queried
+    # for all of them concurrently, instead of running `pip list --outdated`.
+    # Responses come from the user-level index cache while they are fresh.
     console.print("[bold green]    Checking[/bold green] for new module(s) versions")
-    check_cmd = [str(pip_executable), "list", "--outdated"]
-
-    outdated_result = subprocess.run(check_cmd, capture_output=True, text=True)
-    # Pip's `list --outdated` returns a non-zero exit code if it finds nothing,
-    # so we check the output content instead of the return code.
-    # The output header is 2 lines long.
-    outdated_packages_output = outdated_result.stdout.strip()
-    has_updates = len(outdated_packages_output.splitlines()) > 2
+    installed = get_installed_versions(venv_dir)
+    config = get_pyinit_config(project_root)
+    cache = IndexCache(ttl=get_index_cache_ttl(project_root), offline=offline)
+
+    outdated, errors = find_outdated(
+        installed,
+        get_index_url(project_root),
+        cache,
+        config.get("max-connections", DEFAULT_MAX_CONNECTIONS),
+        get_venv_python_version(venv_dir),
+        get_supported_tags(venv_dir),
+    )
+
+    # Packages whose page could not be fetched, because it is missing from the
+    # offline cache or the index failed, must not be reported as up to date.
+    missing = sorted(
+        name for name, error in errors.items() if isinstance(error, OfflineCacheMiss)
+    )
+    if missing:
+        missing_str = ", ".join(f"'{name}'" for name in missing)
+        console.print(
+            f"[bold red][ERROR][/bold red] {len(missing)} package(s) not in the offline cache: {missing_str}"
+        )
+        console.print(
+            "[bold green]->[/bold green] Run 'pyinit update' online first to fill the cache."
+        )
+        sys.exit(1)
+    if errors:
+        console.print(
+            f"[bold red][ERROR][/bold red] Could not check {len(errors)} package(s) against the index:"
+        )
+        for name, error in sorted(errors.items()):
+            console.print(f"[red]->[/red] '{name}': {error}", highlight=False)
+        sys.exit(1)
 
     # --- Step 2: Decide action based on check results ---
-    if not has_updates:
+    if not outdated:
         console.print(
             "[bold green]\n->[/bold green] All modules are up to date, nothing to do."
         )
@@ -73,10 +128,7 @@ def update_modules(upgrade: bool = False):
 
     if upgrade:
         # --- Upgrade Mode ---
-        # Parse the output to get the names of outdated packages.
-        packages_to_upgrade = [
-            line.split()[0] for line in outdated_packages_output.splitlines()[2:]
-        ]
+        packages_to_upgrade = [package.name for package in outdated]
 
         console.print(
             f"[bold green]     Found[/bold green] {len(packages_to_upgrade)} module(s) to upgrade."
@@ -86,16 +138,23 @@ def update_modules(upgrade: bool = False):
             str(pip_executable),
             "install",
             "--upgrade",
-        ] + packages_to_upgrade
+        ] + packages_to_upgrade + pip_source_args
         subprocess.run(upgrade_cmd, check=True)
         console.print("\n[bold green]Successfully[/bold green] upgraded all modules.")
         # Update the lock file after a successful upgrade.
-        update_requirements(project_root, pip_executable, console)
+        update_requirements(project_root, pip_executable, console, installed)
 
     else:
         # --- Check-Only Mode ---
-        # Simply print the list of outdated packages that we already fetched.
-        console.print(outdated_packages_output)
+        # Print the outdated packages as an aligned table.
+        width = max(len("Package"), *(len(package.name) for package in outdated))
+        console.print(f"{'Package':<{width}}  {'Version':<12}  Latest")
+        console.print(f"{'-' * width}  {'-' * 12}  {'-' * 12}")
+        for package in outdated:
+            console.print(
+                f"{package.name:<{width}}  {package.installed:<12}  {package.latest}",
+                highlight=False,
+            )
         console.print(
             "\n[bold green]Run:[/bold green]\n     'pyinit update --upgrade' to apply these updates."
         )
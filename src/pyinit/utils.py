@@ -10,11 +10,14 @@ This module contains common helper functions for tasks such as locating the
 project root, setting up logging, and parsing `pyproject.toml` for metadata.
 """
 
+import os
 import re
 import subprocess
 import sys
+import tempfile
 from pathlib import Path
 
+from packaging.requirements import InvalidRequirement, Requirement
 from rich.console import Console
 
 # Conditional import of TOML library for Python version compatibility.
@@ -44,6 +47,17 @@ def find_project_root() -> Path | None:
     return None
 
 
+def normalize_name(name: str) -> str:
+    """
+    Normalizes a distribution name for comparison (PEP 503 style).
+
+    :param str name: The distribution name to normalize.
+    :return: The lowercased name with runs of '-', '_' and '.' collapsed to '-'.
+    :rtype: str
+    """
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
 def get_project_name(project_root: Path) -> str | None:
     """
     Parses `pyproject.toml` to extract the project's name.
@@ -71,7 +85,7 @@ def get_project_dependencies(project_root: Path) -> list[str]:
     This includes both standard dependencies and all optional dependency groups.
 
     :param Path project_root: The root directory of the project.
-    :return: A list of dependency names, stripped of version specifiers.
+    :return: A list of dependency names, stripped of extras, specifiers and markers.
     :rtype: list[str]
     """
     pyproject_path = project_root / "pyproject.toml"
@@ -89,10 +103,14 @@ def get_project_dependencies(project_root: Path) -> list[str]:
             for group in data["project"]["optional-dependencies"].values():
                 dependencies.extend(group)
 
-        # Clean names, removing version specifiers (e.g., "requests>=2.0" -> "requests")
-        cleaned_deps = [
-            re.split(r"[<>=!~]", dep)[0].strip() for dep in dependencies if dep.strip()
-        ]
+        # Keep only the project names (e.g., "requests[socks]>=2.0; python_version<'4'"
+        # -> "requests"); entries that are not valid requirements are skipped.
+        cleaned_deps = []
+        for dep in dependencies:
+            try:
+                cleaned_deps.append(Requirement(dep).name)
+            except InvalidRequirement:
+                continue
         # Return a unique list of dependencies.
         return list(set(cleaned_deps))
 
@@ -100,6 +118,43 @@ def get_project_dependencies(project_root: Path) -> list[str]:
         return []
 
 
+def get_pyinit_config(project_root: Path) -> dict:
+    """
+    Parses `pyproject.toml` to extract the `[tool.pyinit]` configuration table.
+
+    :param Path project_root: The root directory of the project.
+    :return: The pyinit configuration table, or an empty dict if absent or on error.
+    :rtype: dict
+    """
+    pyproject_path = project_root / "pyproject.toml"
+    try:
+        with open(pyproject_path, "rb") as f:
+            data = tomllib.load(f)
+
+        return data.get("tool", {}).get("pyinit", {})
+
+    except (tomllib.TOMLDecodeError, FileNotFoundError):
+        return {}
+
+
+def write_atomic(path: Path, data: bytes):
+    """
+    Writes a file atomically so concurrent readers never see partial data.
+
+    :param Path path: The destination file.
+    :param bytes data: The content to write.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, path)
+    except BaseException:
+        Path(temp_path).unlink(missing_ok=True)
+        raise
+
+
 def check_project_root(proj_root):
     if not proj_root:
         console.print(
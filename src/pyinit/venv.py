@@ -7,32 +7,51 @@
 Implements the 'venv' command group for the pyinit command-line tool.
 
 This module provides sub-commands for explicit management of the project's
-virtual environment, allowing users to create or remove it on demand.
+virtual environment, allowing users to create or remove it on demand, to
+pack it into a relocatable archive and unpack it elsewhere, to share
+identical files with other venvs through a content-addressed store, or to
+slim it down for deployment.
 This offers more control over the project's state.
 """
 
 import shutil
+import subprocess
 import sys
 import venv
 from pathlib import Path
 
 from rich.console import Console
 
-from .utils import check_project_root, find_project_root
+from .dedupe import dedupe_virtual_env, report_disk_usage
+from .slim import slim_virtual_env
+from .utils import check_platform, check_project_root, check_venv_exists, find_project_root
+from .venvpack import pack_virtual_env, unpack_virtual_env
+from .wheelhouse import install_from_wheelhouse
 from .wrappers import error_handling
 
 
 @error_handling
-def manage_venv(action: str):
+def manage_venv(
+    action: str,
+    archive: str | None = None,
+    compile_sources: bool = False,
+    offline: bool = False,
+):
     """
     Main dispatcher for 'venv' sub-commands.
 
     This function serves as the entry point for 'pyinit venv'. It validates
     the project context and then routes to the appropriate handler function
-    (`create_virtual_env` or `remove_virtual_env`) based on the user's
-    chosen action.
-
-    :param str action: The sub-command to execute ('create' or 'remove').
+    (`create_virtual_env`, `remove_virtual_env`, `pack_virtual_env`,
+    `unpack_virtual_env`, `dedupe_virtual_env`, `report_disk_usage` or
+    `slim_virtual_env`) based on the user's chosen action.
+
+    :param str action: The sub-command to execute ('create', 'remove',
+                       'pack', 'unpack', 'dedupe', 'du' or 'slim').
+    :param str, optional archive: The archive path for 'pack' and 'unpack'.
+    :param bool compile_sources: For 'slim', precompiles the remaining sources.
+    :param bool offline: For 'create', installs the requirements from the
+                         wheelhouse.
     :raises SystemExit: If not run within a valid project.
     """
     console = Console()
@@ -44,20 +63,37 @@ def manage_venv(action: str):
 
     # Route to the specific function based on the sub-command.
     if action == "create":
-        create_virtual_env(console, venv_dir)
+        create_virtual_env(console, venv_dir, offline)
     elif action == "remove":
         remove_virtual_env(console, venv_dir)
-
-
-def create_virtual_env(console: Console, venv_dir: Path):
+    elif action == "pack":
+        pack_virtual_env(console, venv_dir, Path(archive) if archive else None)
+    elif action == "unpack":
+        unpack_virtual_env(console, venv_dir, Path(archive) if archive else None)
+    elif action == "dedupe":
+        check_venv_exists(venv_dir)
+        dedupe_virtual_env(console, venv_dir)
+    elif action == "du":
+        check_venv_exists(venv_dir)
+        report_disk_usage(console, venv_dir)
+    elif action == "slim":
+        check_venv_exists(venv_dir)
+        slim_virtual_env(console, venv_dir, compile_sources)
+
+
+def create_virtual_env(console: Console, venv_dir: Path, offline: bool = False):
     """
     Creates a new virtual environment for the project.
 
     Handles the logic for the 'pyinit venv create' command. It includes a
-    safety check to prevent overwriting an existing environment.
+    safety check to prevent overwriting an existing environment. With
+    `offline`, `requirements.txt` is then installed from the project's
+    wheelhouse; if that fails, the new environment is kept and pip's error is
+    shown as a warning.
 
     :param Console console: The rich Console instance for output.
     :param Path venv_dir: The path where the virtual environment should be created.
+    :param bool offline: If True, installs the requirements from the wheelhouse.
     :raises SystemExit: If a virtual environment already exists or if creation fails.
     """
     console.print("[bold green]     Creating[/bold green] virtual environment")
@@ -69,6 +105,23 @@ def create_virtual_env(console: Console, venv_dir: Path):
 
     # Use Python's built-in venv module to create the environment.
     venv.create(venv_dir, with_pip=True)
+
+    # Restore the locked requirements offline, on request only.
+    if offline:
+        pip_executable, _ = check_platform(venv_dir)
+        try:
+            if not install_from_wheelhouse(venv_dir.parent, pip_executable, console):
+                console.print(
+                    "[bold yellow][WARNING][/bold yellow] No wheelhouse or requirements to install. Run 'pyinit wheelhouse sync' first."
+                )
+        except subprocess.CalledProcessError as e:
+            console.print(
+                "[bold yellow][WARNING][/bold yellow] Could not install the requirements from the wheelhouse:"
+            )
+            console.print(
+                e.stderr.decode(errors="replace").strip(), markup=False, highlight=False
+            )
+
     console.print(
         "[bold green]Successfully[/bold green] created virtual environment."
     )
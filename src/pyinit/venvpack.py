@@ -0,0 +1,303 @@
+# Copyright (c) 2025 mrbooo895.
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""
+Implements the 'venv pack' and 'venv unpack' commands.
+
+'pyinit venv pack' writes a relocatable, gzip-compressed tar archive of the
+project's virtual environment, keyed by a hash of `requirements.txt` and the
+interpreter, so CI jobs can cache it. The absolute venv path found in scripts
+and configuration files is replaced with a placeholder while the archive is
+streamed out, and those files are listed in a manifest stored as the first
+member. 'pyinit venv unpack' restores the archive in a single streaming pass,
+substituting the new location as each templated file is read.
+"""
+
+import gzip
+import hashlib
+import io
+import json
+import os
+import platform
+import shutil
+import sys
+import tarfile
+import tempfile
+from pathlib import Path
+
+from rich.console import Console
+
+from .metadata import get_venv_python_version
+
+PACK_DIR = Path(".pyinit") / "venv-cache"
+MANIFEST_NAME = ".pyinit-venv.json"
+PREFIX_PLACEHOLDER = "@@PYINIT_VENV_PREFIX@@"
+
+# Only small text files are scanned for the absolute venv path.
+MAX_TEMPLATED_SIZE = 1024 * 1024
+TEMPLATED_NAMES = {"pyvenv.cfg", "direct_url.json"}
+TEMPLATED_SUFFIXES = {".pth", ".egg-link"}
+
+
+def get_pack_key(requirements_file: Path, python_version: str) -> str:
+    """
+    Computes the cache key of a packed venv.
+
+    :param Path requirements_file: The project's `requirements.txt`.
+    :param str python_version: The full version of the venv's interpreter.
+    :return: A short hexadecimal digest.
+    :rtype: str
+    """
+    digest = hashlib.sha256()
+    try:
+        digest.update(requirements_file.read_bytes())
+    except FileNotFoundError:
+        pass
+    digest.update(
+        f"\0{platform.python_implementation()}-{python_version}"
+        f"-{sys.platform}-{platform.machine()}".encode("utf-8")
+    )
+    return digest.hexdigest()[:16]
+
+
+def get_pack_path(project_root: Path, python_version: str) -> Path:
+    """
+    Determines the default archive path for the project's current state.
+
+    :param Path project_root: The root directory of the project.
+    :param str python_version: The full version of the venv's interpreter.
+    :rtype: Path
+    """
+    key = get_pack_key(project_root / "requirements.txt", python_version)
+    return project_root / PACK_DIR / f"venv-{key}.tar.gz"
+
+
+def find_pack_path(project_root: Path) -> Path | None:
+    """
+    Finds the packed venv matching the project's current `requirements.txt`.
+
+    The venv does not exist yet when unpacking, so the interpreter version of
+    the key is taken from each archive's manifest instead. The newest
+    matching archive wins.
+
+    :param Path project_root: The root directory of the project.
+    :return: The archive, or None if none matches.
+    :rtype: Path or None
+    """
+    archives = sorted(
+        (project_root / PACK_DIR).glob("venv-*.tar.gz"),
+        key=lambda path: path.stat().st_mtime,
+        reverse=True,
+    )
+    for archive in archives:
+        try:
+            with tarfile.open(archive, mode="r|gz") as tar:
+                first = tar.next()
+                if first is None or first.name != MANIFEST_NAME:
+                    continue
+                python_version = json.load(tar.extractfile(first))["python"]
+        except (OSError, tarfile.TarError, ValueError, KeyError):
+            continue
+        if get_pack_path(project_root, python_version) == archive:
+            return archive
+    return None
+
+
+def _is_template_candidate(relative: Path) -> bool:
+    return (
+        relative.parts[0] in ("bin", "Scripts")
+        or relative.name in TEMPLATED_NAMES
+        or relative.suffix in TEMPLATED_SUFFIXES
+    )
+
+
+def find_templated_files(venv_dir: Path) -> dict[str, bytes]:
+    """
+    Finds the text files of a venv that embed its absolute path.
+
+    :param Path venv_dir: The root directory of the virtual environment.
+    :return: A mapping of archive name to the file's templated content.
+    :rtype: dict[str, bytes]
+    """
+    prefix = str(venv_dir.resolve()).encode("utf-8")
+    templated = {}
+    for root, dirs, files in os.walk(venv_dir):
+        dirs.sort()
+        for name in sorted(files):
+            path = Path(root) / name
+            relative = path.relative_to(venv_dir)
+            if path.is_symlink() or not _is_template_candidate(relative):
+                continue
+            if path.stat().st_size > MAX_TEMPLATED_SIZE:
+                continue
+            data = path.read_bytes()
+            if prefix in data and b"\0" not in data:
+                templated[relative.as_posix()] = data.replace(
+                    prefix, PREFIX_PLACEHOLDER.encode("utf-8")
+                )
+    return templated
+
+
+def pack_venv(venv_dir: Path, archive: Path, python_version: str) -> int:
+    """
+    Streams a relocatable archive of a virtual environment.
+
+    :param Path venv_dir: The root directory of the virtual environment.
+    :param Path archive: The path of the archive to write.
+    :param str python_version: The full version of the venv's interpreter.
+    :return: The number of templated files.
+    :rtype: int
+    """
+    templated = find_templated_files(venv_dir)
+    manifest = json.dumps(
+        {"version": 1, "python": python_version, "templated": sorted(templated)},
+        indent=2,
+    ).encode("utf-8")
+
+    archive.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=archive.parent, prefix=".tmp-")
+    try:
+        with (
+            os.fdopen(fd, "wb") as raw,
+            gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=6) as compressed,
+            tarfile.open(fileobj=compressed, mode="w|", format=tarfile.PAX_FORMAT) as tar,
+        ):
+            info = tarfile.TarInfo(MANIFEST_NAME)
+            info.size = len(manifest)
+            info.mtime = int(os.path.getmtime(venv_dir))
+            tar.addfile(info, io.BytesIO(manifest))
+
+            for root, dirs, files in os.walk(venv_dir):
+                dirs.sort()
+                for name in sorted(dirs) + sorted(files):
+                    path = Path(root) / name
+                    arcname = path.relative_to(venv_dir).as_posix()
+                    info = tar.gettarinfo(str(path), arcname)
+                    if arcname in templated:
+                        info.size = len(templated[arcname])
+                        tar.addfile(info, io.BytesIO(templated[arcname]))
+                    elif info.isfile():
+                        with open(path, "rb") as f:
+                            tar.addfile(info, f)
+                    else:
+                        tar.addfile(info)
+        os.replace(temp_path, archive)
+    except BaseException:
+        Path(temp_path).unlink(missing_ok=True)
+        raise
+    return len(templated)
+
+
+def unpack_venv(archive: Path, venv_dir: Path) -> int:
+    """
+    Restores a packed virtual environment at a new location.
+
+    The archive is read in a single streaming pass into a sibling temporary
+    directory, which is renamed into place once complete.
+
+    :param Path archive: The archive written by `pack_venv`.
+    :param Path venv_dir: Where the virtual environment is restored.
+    :return: The number of files rewritten for the new location.
+    :rtype: int
+    :raises ValueError: If the archive has no manifest, or if a templated
+                        member is not a regular file inside the venv.
+    """
+    prefix = str(venv_dir.resolve()).encode("utf-8")
+    extract_args = {"filter": "tar"} if hasattr(tarfile, "tar_filter") else {}
+    temp_dir = Path(tempfile.mkdtemp(dir=venv_dir.parent, prefix=".venv-unpack-"))
+    temp_root = os.path.abspath(temp_dir)
+    try:
+        with tarfile.open(archive, mode="r|gz") as tar:
+            first = tar.next()
+            if first is None or first.name != MANIFEST_NAME:
+                raise ValueError(f"'{archive}' is not a packed pyinit venv")
+            templated = set(json.load(tar.extractfile(first))["templated"])
+
+            for member in tar:
+                if member.name == MANIFEST_NAME:
+                    continue
+                if member.name not in templated:
+                    tar.extract(member, temp_dir, **extract_args)
+                    continue
+                # Templated files bypass the extraction filter, so their path
+                # is checked here the same way.
+                target = os.path.abspath(os.path.join(temp_root, member.name))
+                if (
+                    not member.isfile()
+                    or os.path.commonpath([temp_root, target]) != temp_root
+                ):
+                    raise ValueError(
+                        f"'{member.name}' in '{archive}' is not a file inside the venv"
+                    )
+                data = tar.extractfile(member).read()
+                target = Path(target)
+                target.parent.mkdir(parents=True, exist_ok=True)
+                target.write_bytes(data.replace(PREFIX_PLACEHOLDER.encode("utf-8"), prefix))
+                os.chmod(target, member.mode)
+        os.replace(temp_dir, venv_dir)
+    except BaseException:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        raise
+    return len(templated)
+
+
+def pack_virtual_env(console: Console, venv_dir: Path, archive: Path | None = None):
+    """
+    Handles the 'pyinit venv pack' command.
+
+    :param Console console: The rich Console instance for output.
+    :param Path venv_dir: The project's virtual environment.
+    :param Path, optional archive: Where to write the archive. Defaults to a
+                                   path under `.pyinit/venv-cache` keyed by
+                                   `requirements.txt` and the interpreter.
+    :raises SystemExit: If the virtual environment does not exist.
+    """
+    if not venv_dir.is_dir():
+        console.print("[bold red][ERROR][/bold red] No 'venv' directory found to pack.")
+        sys.exit(1)
+
+    python_version = get_venv_python_version(venv_dir)
+    archive = archive or get_pack_path(venv_dir.parent, python_version)
+    console.print("[bold green]      Packing[/bold green] virtual environment")
+    templated = pack_venv(venv_dir, archive, python_version)
+
+    size = archive.stat().st_size / (1024 * 1024)
+    console.print(
+        f"[bold green]Successfully[/bold green] packed virtual environment to "
+        f"'{archive}' ({size:.1f} MiB, {templated} relocatable file(s))."
+    )
+
+
+def unpack_virtual_env(console: Console, venv_dir: Path, archive: Path | None = None):
+    """
+    Handles the 'pyinit venv unpack' command.
+
+    :param Console console: The rich Console instance for output.
+    :param Path venv_dir: Where the virtual environment is restored.
+    :param Path, optional archive: The archive to restore. Defaults to the
+                                   one matching the current `requirements.txt`
+                                   (see `find_pack_path`).
+    :raises SystemExit: If a venv already exists or no archive is found.
+    """
+    if venv_dir.exists():
+        console.print("[bold red][ERROR][/bold red] A 'venv' directory already exists.")
+        console.print("[bold red]->[/] Move it or rename it to unpack a packed environment")
+        sys.exit(1)
+
+    archive = archive or find_pack_path(venv_dir.parent)
+    if archive is None or not archive.is_file():
+        location = archive or venv_dir.parent / PACK_DIR
+        console.print(
+            f"[bold red][ERROR][/bold red] No packed environment found at '{location}'."
+        )
+        console.print("[bold red]->[/] Run 'pyinit venv pack' to create one")
+        sys.exit(1)
+
+    console.print(f"[bold green]    Unpacking[/bold green] '{archive.name}'")
+    rewritten = unpack_venv(archive, venv_dir)
+    console.print(
+        f"[bold green]Successfully[/bold green] restored virtual environment "
+        f"({rewritten} file(s) relocated)."
+    )
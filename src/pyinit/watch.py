@@ -0,0 +1,426 @@
+# Copyright (c) 2025 mrbooo895.
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""
+Implements the watch mode of 'pyinit run' ('pyinit run --watch').
+
+The watched tree is kept as an in-memory index of (mtime, size) per file and
+mtime per directory. On Linux, changes are reported by inotify (through
+ctypes, so there is no extra dependency); elsewhere, or when inotify is not
+available, the index is refreshed by incremental polling: only directories
+whose mtime changed are listed again, every other file costs one `stat`.
+Bursts of changes are debounced before the child process is restarted, and
+termination signals are forwarded to the child so it can shut down cleanly.
+"""
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import signal
+import struct
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from rich.console import Console
+
+IGNORED_DIRS = {"__pycache__", ".git", ".hg", ".mypy_cache", ".pytest_cache", ".ruff_cache"}
+IGNORED_SUFFIXES = (".pyc", ".pyo", ".swp", ".swx", ".tmp", "~")
+
+DEFAULT_DEBOUNCE = 0.2
+DEFAULT_POLL_INTERVAL = 0.5
+DEFAULT_STOP_TIMEOUT = 5.0
+
+
+def is_watched(name: str) -> bool:
+    """
+    Tells whether a file or directory name is relevant to the watcher.
+
+    :param str name: The base name of the entry.
+    :rtype: bool
+    """
+    return not (
+        name in IGNORED_DIRS
+        or name.startswith((".#", ".~"))
+        or name.endswith(IGNORED_SUFFIXES)
+    )
+
+
+class FileIndex:
+    """
+    An in-memory index of a directory tree: (mtime, size) per file.
+
+    The index also remembers the mtime and entries of every directory, so a
+    refresh only lists the directories whose content changed.
+    """
+
+    def __init__(self, root: Path):
+        """
+        :param Path root: The directory to index.
+        """
+        self.root = root
+        self.files: dict[str, tuple[int, int]] = {}
+        self.dirs: dict[str, int] = {}
+        self.children: dict[str, set[str]] = {}
+        self.scan_dir(str(root))
+
+    def scan_dir(self, path: str) -> set[str]:
+        """
+        Lists a directory (recursively for new subdirectories) into the index.
+
+        :param str path: The directory to list.
+        :return: The files that were added, changed or removed.
+        :rtype: set[str]
+        """
+        changed = set()
+        try:
+            self.dirs[path] = os.stat(path).st_mtime_ns
+            entries = list(os.scandir(path))
+        except OSError:
+            return self.remove_dir(path)
+
+        present = set()
+        for entry in entries:
+            if not is_watched(entry.name):
+                continue
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    present.add(entry.path)
+                    if entry.path not in self.dirs:
+                        changed |= self.scan_dir(entry.path)
+                elif entry.is_file():
+                    present.add(entry.path)
+                    if self.update_file(entry.path, entry.stat()):
+                        changed.add(entry.path)
+            except OSError:
+                continue
+
+        # Entries that disappeared from this directory.
+        for gone in self.children.get(path, set()) - present:
+            if gone in self.dirs:
+                changed |= self.remove_dir(gone)
+            elif self.files.pop(gone, None) is not None:
+                changed.add(gone)
+        self.children[path] = present
+        return changed
+
+    def remove_dir(self, path: str) -> set[str]:
+        """
+        Drops a directory and everything below it from the index.
+
+        :param str path: The removed directory.
+        :return: The files that were removed.
+        :rtype: set[str]
+        """
+        removed = set()
+        self.dirs.pop(path, None)
+        for child in self.children.pop(path, set()):
+            if child in self.dirs:
+                removed |= self.remove_dir(child)
+            elif self.files.pop(child, None) is not None:
+                removed.add(child)
+        return removed
+
+    def update_file(self, path: str, st: os.stat_result | None = None) -> bool:
+        """
+        Refreshes one file in the index.
+
+        :param str path: The file to refresh.
+        :param os.stat_result, optional st: Its stat result, if already known.
+        :return: True if the file was added, changed or removed.
+        :rtype: bool
+        """
+        try:
+            st = st or os.stat(path)
+        except OSError:
+            if self.files.pop(path, None) is None:
+                return False
+            self.children.get(os.path.dirname(path), set()).discard(path)
+            return True
+        signature = (st.st_mtime_ns, st.st_size)
+        if self.files.get(path) == signature:
+            return False
+        if path not in self.files:
+            self.children.setdefault(os.path.dirname(path), set()).add(path)
+        self.files[path] = signature
+        return True
+
+    def refresh(self) -> set[str]:
+        """
+        Brings the whole index up to date by incremental polling.
+
+        :return: The paths that were added, changed or removed.
+        :rtype: set[str]
+        """
+        changed = set()
+        for path, mtime in list(self.dirs.items()):
+            if path not in self.dirs:
+                continue
+            try:
+                current = os.stat(path).st_mtime_ns
+            except OSError:
+                changed |= self.remove_dir(path)
+                continue
+            if current != mtime:
+                changed |= self.scan_dir(path)
+        for path in list(self.files):
+            if self.update_file(path):
+                changed.add(path)
+        return changed
+
+
+class PollingWatcher:
+    """Detects changes by incrementally refreshing a `FileIndex`."""
+
+    def __init__(self, root: Path, interval: float = DEFAULT_POLL_INTERVAL):
+        self.index = FileIndex(root)
+        self.interval = interval
+
+    def wait(self, timeout: float) -> set[str]:
+        """
+        Waits for changes.
+
+        :param float timeout: The maximum time to wait, in seconds.
+        :return: The changed paths (empty on timeout).
+        :rtype: set[str]
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            changed = self.index.refresh()
+            remaining = deadline - time.monotonic()
+            if changed or remaining <= 0:
+                return changed
+            time.sleep(min(self.interval, remaining))
+
+    def close(self):
+        pass
+
+
+class InotifyWatcher:
+    """Detects changes through Linux inotify, confirmed against a `FileIndex`."""
+
+    IN_MODIFY = 0x00000002
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_DELETE_SELF = 0x00000400
+    IN_Q_OVERFLOW = 0x00004000
+    IN_ISDIR = 0x40000000
+    WATCH_MASK = (
+        IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+        | IN_CREATE | IN_DELETE | IN_DELETE_SELF
+    )
+    EVENT_HEADER = struct.Struct("iIII")
+
+    def __init__(self, root: Path):
+        """
+        :param Path root: The directory tree to watch.
+        :raises OSError: If inotify is not available or runs out of watches.
+        """
+        self.libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self.fd = self.libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.watches: dict[int, str] = {}
+        self.watched: set[str] = set()
+        self.index = FileIndex(root)
+        try:
+            for path in self.index.dirs:
+                self.add_watch(path)
+        except OSError:
+            self.close()
+            raise
+
+    def add_watch(self, path: str):
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(path), self.WATCH_MASK)
+        if wd < 0:
+            code = ctypes.get_errno()
+            if code in (errno.ENOENT, errno.ENOTDIR):
+                return
+            raise OSError(code, f"inotify_add_watch failed for '{path}'")
+        self.watches[wd] = path
+        self.watched.add(path)
+
+    def watch_new_dirs(self):
+        for path in self.index.dirs.keys() - self.watched:
+            self.add_watch(path)
+
+    def read_events(self) -> set[str]:
+        changed = set()
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return changed
+
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = self.EVENT_HEADER.unpack_from(data, offset)
+            offset += self.EVENT_HEADER.size
+            name = os.fsdecode(data[offset : offset + length].rstrip(b"\0"))
+            offset += length
+
+            if mask & self.IN_Q_OVERFLOW:
+                # Events were lost: fall back to a full incremental refresh.
+                changed |= self.index.refresh()
+                self.watch_new_dirs()
+                continue
+            directory = self.watches.get(wd)
+            if directory is None or (name and not is_watched(name)):
+                continue
+            path = os.path.join(directory, name) if name else directory
+            if mask & self.IN_ISDIR:
+                if mask & (self.IN_CREATE | self.IN_MOVED_TO):
+                    changed |= self.index.scan_dir(directory)
+                    self.watch_new_dirs()
+                elif mask & (self.IN_DELETE | self.IN_MOVED_FROM):
+                    changed |= self.index.scan_dir(directory)
+                    self.watched &= self.index.dirs.keys()
+            elif name and self.index.update_file(path):
+                changed.add(path)
+        return changed
+
+    def wait(self, timeout: float) -> set[str]:
+        """
+        Waits for changes.
+
+        :param float timeout: The maximum time to wait, in seconds.
+        :return: The changed paths (empty on timeout).
+        :rtype: set[str]
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return set()
+            try:
+                ready, _, _ = select.select([self.fd], [], [], remaining)
+            except InterruptedError:
+                return set()
+            if ready:
+                changed = self.read_events()
+                if changed:
+                    return changed
+
+    def close(self):
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+def create_watcher(root: Path) -> InotifyWatcher | PollingWatcher:
+    """
+    Creates the most efficient watcher available for a directory tree.
+
+    :param Path root: The directory tree to watch.
+    :rtype: InotifyWatcher or PollingWatcher
+    """
+    if sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(root)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(root)
+
+
+def stop_child(child: subprocess.Popen, sig: int, timeout: float = DEFAULT_STOP_TIMEOUT) -> int:
+    """
+    Stops a child process gracefully, killing it if it does not exit in time.
+
+    :param subprocess.Popen child: The child process.
+    :param int sig: The signal to send first.
+    :param float timeout: How long to wait before killing it, in seconds.
+    :return: The child's exit code.
+    :rtype: int
+    """
+    if child.poll() is None:
+        if sys.platform == "win32":
+            child.terminate()
+        else:
+            child.send_signal(sig)
+        try:
+            child.wait(timeout)
+        except subprocess.TimeoutExpired:
+            child.kill()
+    return child.wait()
+
+
+def watch_and_run(
+    cmd: list[str],
+    watch_dir: Path,
+    console: Console,
+    debounce: float = DEFAULT_DEBOUNCE,
+) -> int:
+    """
+    Runs a command and restarts it whenever the watched tree changes.
+
+    :param list cmd: The command to run.
+    :param Path watch_dir: The directory tree to watch.
+    :param Console console: The rich Console instance for printing messages.
+    :param float debounce: How long the tree must stay quiet before a
+                           restart, in seconds.
+    :return: The exit code of the last child process.
+    :rtype: int
+    """
+    watcher = create_watcher(watch_dir)
+    mode = "inotify" if isinstance(watcher, InotifyWatcher) else "polling"
+    console.print(
+        f"[bold green]    Watching[/bold green] '{watch_dir.name}/' "
+        f"({len(watcher.index.files)} files, {mode})"
+    )
+
+    received = []
+
+    def forward(signum, frame):
+        received.append(signum)
+
+    forwarded = [signal.SIGINT, signal.SIGTERM]
+    if hasattr(signal, "SIGHUP"):
+        forwarded.append(signal.SIGHUP)
+    previous = {sig: signal.signal(sig, forward) for sig in forwarded}
+
+    child = subprocess.Popen(cmd)
+    reported = False
+    try:
+        while not received:
+            changed = watcher.wait(DEFAULT_POLL_INTERVAL)
+            if received:
+                break
+            if child.poll() is not None and not reported:
+                console.print(
+                    f"[bold yellow][INFO][/] Process exited with code {child.returncode}, "
+                    "waiting for changes"
+                )
+                reported = True
+            if not changed:
+                continue
+
+            # Debounce: wait until the tree has been quiet for a moment.
+            while more := watcher.wait(debounce):
+                changed |= more
+            first = os.path.relpath(sorted(changed)[0], watch_dir)
+            others = f" and {len(changed) - 1} more" if len(changed) > 1 else ""
+            console.print(f"[bold green]   Restarting[/bold green] ({first}{others} changed)")
+            stop_child(child, signal.SIGTERM)
+            child = subprocess.Popen(cmd)
+            reported = False
+    finally:
+        # The child shares the terminal, so an interactive Ctrl+C reached it
+        # too: give it a moment before forwarding the signal explicitly.
+        sig = received[0] if received else signal.SIGTERM
+        if sig == signal.SIGINT:
+            try:
+                child.wait(0.5)
+            except subprocess.TimeoutExpired:
+                pass
+        returncode = stop_child(child, sig)
+        watcher.close()
+        for s, handler in previous.items():
+            signal.signal(s, handler)
+    return returncode
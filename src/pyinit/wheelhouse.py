@@ -0,0 +1,255 @@
+# Copyright (c) 2025 mrbooo895.
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""
+Implements the 'wheelhouse' command group for the pyinit command-line tool.
+
+A wheelhouse is a local directory of wheels covering everything pinned in
+`requirements.txt`. Once it is populated with 'pyinit wheelhouse sync',
+installs and virtual environment rebuilds can run against it with
+`pip install --no-index --find-links`, without any network access.
+"""
+
+import os
+import re
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from packaging.requirements import InvalidRequirement, Requirement
+from packaging.utils import InvalidWheelFilename, parse_wheel_filename
+from rich.console import Console
+
+from .cache import get_cache_dir
+from .utils import (
+    check_platform,
+    check_project_root,
+    check_venv_exists,
+    find_project_root,
+    get_pyinit_config,
+    normalize_name,
+)
+from .wrappers import error_handling
+
+
+def get_wheelhouse_dir(project_root: Path) -> Path:
+    """
+    Determines the wheelhouse directory of a project.
+
+    The `wheelhouse` setting in `[tool.pyinit]` may be `"user"` for the shared
+    user-level wheelhouse, or a path relative to the project root. It defaults
+    to `.pyinit/wheelhouse` inside the project.
+
+    :param Path project_root: The root directory of the project.
+    :return: The path of the wheelhouse (it may not exist yet).
+    :rtype: Path
+    """
+    setting = get_pyinit_config(project_root).get("wheelhouse")
+    if setting == "user":
+        return get_cache_dir() / "wheelhouse"
+    if setting:
+        return project_root / Path(setting).expanduser()
+    return project_root / ".pyinit" / "wheelhouse"
+
+
+def has_wheels(wheelhouse: Path) -> bool:
+    """
+    Tells whether a wheelhouse exists and contains at least one wheel.
+
+    :param Path wheelhouse: The wheelhouse directory.
+    :rtype: bool
+    """
+    return wheelhouse.is_dir() and any(wheelhouse.glob("*.whl"))
+
+
+def wheelhouse_pip_args(wheelhouse: Path) -> list[str]:
+    """
+    Builds the pip arguments that restrict installs to a wheelhouse.
+
+    :param Path wheelhouse: The wheelhouse directory.
+    :return: The arguments to append to a `pip install` command.
+    :rtype: list[str]
+    """
+    return ["--no-index", "--find-links", str(wheelhouse)]
+
+
+def read_requirements(requirements_file: Path) -> list[str]:
+    """
+    Reads the requirement lines of a requirements file.
+
+    Comments, blank lines and pip options (such as `-e` or `--hash`) are skipped.
+
+    :param Path requirements_file: The path of the requirements file.
+    :return: The requirement strings, in file order.
+    :rtype: list[str]
+    """
+    if not requirements_file.is_file():
+        return []
+    requirements = []
+    for line in requirements_file.read_text(encoding="utf-8").splitlines():
+        line = re.sub(r"(^|\s)#.*$", "", line).strip()
+        if line and not line.startswith("-"):
+            requirements.append(line)
+    return requirements
+
+
+def get_wheelhouse_index(wheelhouse: Path) -> dict[str, dict[str, list[Path]]]:
+    """
+    Indexes the wheels of a wheelhouse by project name and version.
+
+    :param Path wheelhouse: The wheelhouse directory.
+    :return: A mapping of normalized name to a mapping of version to wheel paths.
+    :rtype: dict[str, dict[str, list[Path]]]
+    """
+    index: dict[str, dict[str, list[Path]]] = {}
+    if not wheelhouse.is_dir():
+        return index
+    for wheel in wheelhouse.glob("*.whl"):
+        try:
+            name, version, _, _ = parse_wheel_filename(wheel.name)
+        except InvalidWheelFilename:
+            continue
+        index.setdefault(name, {}).setdefault(str(version), []).append(wheel)
+    return index
+
+
+def is_in_wheelhouse(requirement: str, index: dict) -> bool:
+    """
+    Tells whether a pinned requirement already has a wheel in the wheelhouse.
+
+    :param str requirement: A requirement string, e.g. 'rich==14.2.0'.
+    :param dict index: The wheelhouse index from `get_wheelhouse_index`.
+    :rtype: bool
+    """
+    try:
+        parsed = Requirement(requirement)
+    except InvalidRequirement:
+        return False
+    versions = index.get(normalize_name(parsed.name), {})
+    return any(parsed.specifier.contains(v, prereleases=True) for v in versions)
+
+
+def install_from_wheelhouse(
+    project_root: Path, pip_executable: Path, console: Console
+) -> bool:
+    """
+    Installs `requirements.txt` from the project's wheelhouse, if it has one.
+
+    Used after (re)creating a virtual environment so it can be rebuilt
+    without network access.
+
+    :param Path project_root: The root directory of the project.
+    :param Path pip_executable: The path to the venv's pip executable.
+    :param Console console: The rich Console instance for printing messages.
+    :return: True if the requirements were installed from the wheelhouse.
+    :rtype: bool
+    """
+    wheelhouse = get_wheelhouse_dir(project_root)
+    requirements_file = project_root / "requirements.txt"
+    if not has_wheels(wheelhouse) or not read_requirements(requirements_file):
+        return False
+
+    console.print(
+        f"[bold green]    Installing[/bold green] '{requirements_file.name}' from the wheelhouse"
+    )
+    subprocess.run(
+        [str(pip_executable), "install", "-r", str(requirements_file)]
+        + wheelhouse_pip_args(wheelhouse),
+        check=True,
+        capture_output=True,
+    )
+    return True
+
+
+@error_handling
+def manage_wheelhouse(action: str):
+    """
+    Main dispatcher for 'wheelhouse' sub-commands.
+
+    :param str action: The sub-command to execute ('sync').
+    :raises SystemExit: If not run within a valid project.
+    """
+    console = Console()
+    project_root = find_project_root()
+
+    check_project_root(project_root)
+
+    if action == "sync":
+        sync_wheelhouse(console, project_root)
+
+
+def sync_wheelhouse(console: Console, project_root: Path):
+    """
+    Downloads or builds a wheel for every requirement in `requirements.txt`.
+
+    Requirements that already have a matching wheel are skipped. The others
+    are fetched in parallel, one `pip wheel --no-deps` process per
+    requirement; `requirements.txt` is a fully resolved set, so dependencies
+    are covered by their own lines.
+
+    :param Console console: The rich Console instance for output.
+    :param Path project_root: The root directory of the project.
+    :raises SystemExit: If there is nothing to sync or if any wheel fails.
+    """
+    venv_dir = project_root / "venv"
+    check_venv_exists(venv_dir)
+    pip_executable, _ = check_platform(venv_dir)
+
+    requirements = read_requirements(project_root / "requirements.txt")
+    if not requirements:
+        console.print(
+            "[bold yellow][INFO][/bold yellow] No requirements found in 'requirements.txt'. Nothing to sync."
+        )
+        sys.exit(0)
+
+    wheelhouse = get_wheelhouse_dir(project_root)
+    wheelhouse.mkdir(parents=True, exist_ok=True)
+    index = get_wheelhouse_index(wheelhouse)
+    missing = [req for req in requirements if not is_in_wheelhouse(req, index)]
+
+    console.print(
+        f"[bold green]     Syncing[/bold green] wheelhouse '{wheelhouse}' "
+        f"({len(requirements) - len(missing)} of {len(requirements)} already present)"
+    )
+    if not missing:
+        console.print("[bold green]\n->[/] Wheelhouse is up to date, nothing to do.")
+        return
+
+    def fetch_wheel(requirement: str) -> subprocess.CompletedProcess:
+        return subprocess.run(
+            [
+                str(pip_executable),
+                "wheel",
+                "--no-deps",
+                "--wheel-dir",
+                str(wheelhouse),
+                requirement,
+            ],
+            capture_output=True,
+            text=True,
+        )
+
+    # Fetching is network- and build-bound, so use more workers than CPUs.
+    jobs = min(len(missing), (os.cpu_count() or 1) * 2)
+    failed = []
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        for requirement, result in zip(missing, executor.map(fetch_wheel, missing)):
+            if result.returncode == 0:
+                console.print(f"[bold green]      Fetched[/bold green] '{requirement}'")
+            else:
+                failed.append(requirement)
+                console.print(f"[bold red]       Failed[/bold red] '{requirement}'")
+
+    if failed:
+        failed_str = ", ".join(f"'{f}'" for f in failed)
+        console.print(
+            f"\n[bold red][ERROR][/bold red] Could not fetch wheel(s) for {failed_str}"
+        )
+        sys.exit(1)
+
+    console.print(
+        f"\n[bold green]Successfully[/bold green] added {len(missing)} wheel(s) to the wheelhouse."
+    )
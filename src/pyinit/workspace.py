@@ -0,0 +1,280 @@
+# Copyright (c) 2025 mrbooo895.
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""
+Implements the workspace mode ('pyinit -w <command>') for the pyinit tool.
+
+A workspace is a directory whose `pyproject.toml` declares a
+`[tool.pyinit.workspace]` table listing member projects (glob patterns are
+allowed). This module discovers the members, orders them so that members
+depending on other members run after their dependencies, and executes a
+pyinit command in every member on a bounded pool of worker processes. Output
+is prefixed per member and an aggregated summary is printed at the end.
+"""
+
+import os
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+
+from rich.console import Console
+from rich.markup import escape
+
+from .utils import (
+    get_project_dependencies,
+    get_project_name,
+    get_pyinit_config,
+    normalize_name,
+)
+from .wrappers import error_handling
+
+# Commands that can be fanned out across workspace members.
+WORKSPACE_COMMANDS = ["test", "check", "format", "build", "install", "update"]
+
+
+def find_workspace_root() -> Path | None:
+    """
+    Finds the workspace root by searching upwards for a `pyproject.toml`
+    file that declares a `[tool.pyinit.workspace]` table.
+
+    :return: A Path object to the workspace root, or None if not found.
+    :rtype: Path or None
+    """
+    current_dir = Path.cwd().resolve()
+    for directory in [current_dir, *current_dir.parents]:
+        if (directory / "pyproject.toml").is_file():
+            if "workspace" in get_pyinit_config(directory):
+                return directory
+    return None
+
+
+def get_workspace_members(workspace_root: Path) -> dict[str, Path]:
+    """
+    Expands the workspace member patterns into a mapping of member projects.
+
+    Each pattern in `members` is a path or glob relative to the workspace
+    root. Only directories containing a `pyproject.toml` are kept.
+
+    :param Path workspace_root: The root directory of the workspace.
+    :return: A mapping of member project name to member directory.
+    :rtype: dict[str, Path]
+    """
+    patterns = get_pyinit_config(workspace_root)["workspace"].get("members", [])
+    members: dict[str, Path] = {}
+    for pattern in patterns:
+        for path in sorted(workspace_root.glob(pattern)):
+            if not (path / "pyproject.toml").is_file():
+                continue
+            path = path.resolve()
+            name = get_project_name(path) or path.name
+            members.setdefault(name, path)
+    return members
+
+
+def get_member_dependencies(members: dict[str, Path]) -> dict[str, set[str]]:
+    """
+    Determines which members depend on which other members.
+
+    Dependencies are read from each member's `[project]` dependencies and
+    optional-dependency groups; only names that refer to other members
+    are kept.
+
+    :param dict members: A mapping of member name to member directory.
+    :return: A mapping of member name to the set of member names it depends on.
+    :rtype: dict[str, set[str]]
+    """
+    by_normalized = {normalize_name(name): name for name in members}
+    dependencies = {}
+    for name, path in members.items():
+        declared = {normalize_name(dep) for dep in get_project_dependencies(path)}
+        dependencies[name] = {
+            by_normalized[dep]
+            for dep in declared
+            if dep in by_normalized and by_normalized[dep] != name
+        }
+    return dependencies
+
+
+def topological_order(dependencies: dict[str, set[str]]) -> list[str]:
+    """
+    Orders members so that every member comes after its dependencies.
+
+    :param dict dependencies: A mapping of member name to the names it depends on.
+    :return: The member names in a valid execution order.
+    :rtype: list[str]
+    :raises ValueError: If the members form a dependency cycle.
+    """
+    remaining = {name: set(deps) for name, deps in dependencies.items()}
+    order = []
+    while remaining:
+        ready = sorted(name for name, deps in remaining.items() if not deps)
+        if not ready:
+            cycle = ", ".join(sorted(remaining))
+            raise ValueError(f"Dependency cycle between workspace members: {cycle}")
+        for name in ready:
+            order.append(name)
+            del remaining[name]
+        for deps in remaining.values():
+            deps.difference_update(ready)
+    return order
+
+
+def run_member(
+    name: str,
+    member_dir: Path,
+    pyinit_args: list[str],
+    console: Console,
+    width: int,
+    lock: threading.Lock,
+) -> tuple[int, float]:
+    """
+    Runs a pyinit command in a single member, streaming its prefixed output.
+
+    :param str name: The member project name, used as the output prefix.
+    :param Path member_dir: The member's project directory.
+    :param list pyinit_args: The pyinit command line to run in the member.
+    :param Console console: The rich Console instance for printing messages.
+    :param int width: The width to pad member prefixes to.
+    :param threading.Lock lock: A lock serializing writes to the console.
+    :return: A tuple of the command's return code and its duration in seconds.
+    :rtype: tuple[int, float]
+    """
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "pyinit.main"] + pyinit_args,
+        cwd=member_dir,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        errors="replace",
+    )
+    for line in process.stdout:
+        with lock:
+            console.print(
+                f"[bold cyan]{name:<{width}}[/] | {escape(line.rstrip())}",
+                highlight=False,
+            )
+    return process.wait(), time.perf_counter() - start
+
+
+@error_handling
+def run_workspace(pyinit_args: list[str], jobs: int | None = None):
+    """
+    Runs a pyinit command across all members of the current workspace.
+
+    This function serves as the entry point for 'pyinit -w <command>'. Members
+    are scheduled in dependency order on a bounded pool of worker processes:
+    a member starts as soon as all the members it depends on have succeeded,
+    and is skipped if any of them failed.
+
+    :param list pyinit_args: The pyinit command line to run in every member,
+                             starting with the command name.
+    :param int, optional jobs: The maximum number of members to run at once.
+                               Defaults to the `jobs` workspace setting or the
+                               number of CPUs.
+    :raises SystemExit: If not inside a workspace, if the command is not
+                        supported, or if any member fails.
+    """
+    console = Console()
+    command = pyinit_args[0]
+
+    # --- Pre-flight Checks ---
+    if command not in WORKSPACE_COMMANDS:
+        supported = ", ".join(f"'{c}'" for c in WORKSPACE_COMMANDS)
+        console.print(
+            f"[bold red][ERROR][/bold red] Command '{command}' cannot run in workspace mode. Supported: {supported}"
+        )
+        sys.exit(1)
+
+    workspace_root = find_workspace_root()
+    if not workspace_root:
+        console.print(
+            "[bold red][ERROR][/bold red] Not inside a workspace. Could not find a 'pyproject.toml' with [tool.pyinit.workspace]."
+        )
+        sys.exit(1)
+
+    members = get_workspace_members(workspace_root)
+    if not members:
+        console.print(
+            "[bold yellow][INFO][/bold yellow] The workspace has no members. Nothing to do."
+        )
+        sys.exit(0)
+
+    dependencies = get_member_dependencies(members)
+    order = topological_order(dependencies)
+    jobs = jobs or get_pyinit_config(workspace_root)["workspace"].get("jobs")
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(members)))
+
+    console.print(
+        f"[bold green]    Running[/bold green] '{' '.join(pyinit_args)}' in {len(members)} member(s) with {jobs} job(s)\n"
+    )
+
+    # --- Scheduling ---
+    # A member is submitted once every member it depends on has finished
+    # successfully. Workers only wait on child processes, so a thread pool
+    # bounds the number of concurrently running pyinit processes.
+    results: dict[str, tuple[str, float]] = {}
+    lock = threading.Lock()
+    width = max(len(name) for name in members)
+    pending = list(order)
+    running = {}
+    started = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        while pending or running:
+            for name in list(pending):
+                deps = dependencies[name]
+                if any(results.get(dep, ("",))[0] in ("FAILED", "SKIPPED") for dep in deps):
+                    results[name] = ("SKIPPED", 0.0)
+                    pending.remove(name)
+                elif all(dep in results for dep in deps) and len(running) < jobs:
+                    future = executor.submit(
+                        run_member,
+                        name,
+                        members[name],
+                        pyinit_args,
+                        console,
+                        width,
+                        lock,
+                    )
+                    running[future] = name
+                    pending.remove(name)
+
+            if not running:
+                continue
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                returncode, duration = future.result()
+                results[name] = ("PASSED" if returncode == 0 else "FAILED", duration)
+
+    total_time = time.perf_counter() - started
+
+    # --- Summary ---
+    console.print("\n[bold green]    Summary[/bold green]")
+    styles = {"PASSED": "bold green", "FAILED": "bold red", "SKIPPED": "bold yellow"}
+    for name in order:
+        status, duration = results[name]
+        timing = f"{duration:.2f}s" if status != "SKIPPED" else "-"
+        console.print(
+            f"  [{styles[status]}]{status:<7}[/] {name:<{width}}  {timing}",
+            highlight=False,
+        )
+
+    counts = {status: 0 for status in styles}
+    for status, _ in results.values():
+        counts[status] += 1
+    console.print(
+        f"\n[bold green]->[/] {counts['PASSED']} passed, {counts['FAILED']} failed, "
+        f"{counts['SKIPPED']} skipped in {total_time:.2f}s"
+    )
+
+    if counts["FAILED"] or counts["SKIPPED"]:
+        sys.exit(1)
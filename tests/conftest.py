@@ -0,0 +1,23 @@
+import json
+from importlib.metadata import PathDistribution
+
+import pytest
+
+
+# This fixture writes minimal dist-info directories for metadata tests.
+@pytest.fixture
+def make_dist(tmp_path):
+    def make(name, version, requires=(), direct_url=None, requested=False):
+        """Writes a minimal dist-info directory and returns its distribution."""
+        dist_info = tmp_path / f"{name}-{version}.dist-info"
+        dist_info.mkdir()
+        metadata = f"Metadata-Version: 2.1\nName: {name}\nVersion: {version}\n"
+        metadata += "".join(f"Requires-Dist: {r}\n" for r in requires)
+        (dist_info / "METADATA").write_text(metadata)
+        if direct_url is not None:
+            (dist_info / "direct_url.json").write_text(json.dumps(direct_url))
+        if requested:
+            (dist_info / "REQUESTED").write_text("")
+        return PathDistribution(dist_info)
+
+    return make
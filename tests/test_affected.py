@@ -0,0 +1,54 @@
+from pyinit.affected import find_affected_tests, parse_imports, scan_sources
+
+
+def test_parse_imports_resolves_relative_imports():
+    """Tests absolute, relative and from-imports in modules and packages."""
+    # --- Arrange ---
+    source = b"import os.path\nfrom . import b\nfrom ..core import run\nfrom .c import *\n"
+
+    # --- Act ---
+    module_imports = parse_imports(source, "src/pkg/sub/a.py")
+    package_imports = parse_imports(b"from .a import x\n", "src/pkg/sub/__init__.py")
+
+    # --- Assert ---
+    assert module_imports == [
+        "os.path",
+        "pkg.core",
+        "pkg.core.run",
+        "pkg.sub",
+        "pkg.sub.b",
+        "pkg.sub.c",
+    ]
+    assert package_imports == ["pkg.sub.a", "pkg.sub.a.x"]
+
+
+def test_find_affected_tests_follows_imports_transitively(tmp_path):
+    """Tests the import closure, helpers imported by name and full-run files."""
+    # --- Arrange ---
+    files = {
+        "src/pkg/__init__.py": "",
+        "src/pkg/core.py": "",
+        "src/pkg/api.py": "from .core import run\n",
+        "src/pkg/other.py": "",
+        "tests/helpers.py": "import pkg.other\n",
+        "tests/test_api.py": "from pkg import api\n",
+        "tests/test_core.py": "import pkg.core\n",
+        "tests/test_other.py": "import helpers\n",
+    }
+    for path, source in files.items():
+        (tmp_path / path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / path).write_text(source)
+
+    # --- Act ---
+    sources = scan_sources(tmp_path)
+    cached = scan_sources(tmp_path)
+
+    # --- Assert ---
+    assert cached == sources
+    assert find_affected_tests(sources, ["src/pkg/core.py"]) == {
+        "tests/test_api.py",
+        "tests/test_core.py",
+    }
+    assert find_affected_tests(sources, ["src/pkg/other.py"]) == {"tests/test_other.py"}
+    assert find_affected_tests(sources, ["README.md"]) == set()
+    assert find_affected_tests(sources, ["src/pkg/api.py", "pyproject.toml"]) is None
@@ -0,0 +1,71 @@
+import sys
+
+import pytest
+
+from pyinit.bench import (
+    compare_results,
+    discover_benchmarks,
+    get_bench_config,
+    run_benchmark,
+)
+
+
+def test_discover_benchmarks_filters_by_name_and_signature(tmp_path):
+    """Tests that only argument-free bench_* functions in bench_*.py are found."""
+    # --- Arrange ---
+    (tmp_path / "bench_io.py").write_text(
+        "def bench_read():\n    pass\n"
+        "def bench_param(size):\n    pass\n"
+        "def bench_default(size=3):\n    pass\n"
+        "def helper():\n    pass\n"
+    )
+    (tmp_path / "helpers.py").write_text("def bench_hidden():\n    pass\n")
+
+    # --- Act ---
+    found = discover_benchmarks(tmp_path)
+    filtered = discover_benchmarks(tmp_path, "*default")
+
+    # --- Assert ---
+    assert [name for _, name in found] == ["bench_read", "bench_default"]
+    assert [name for _, name in filtered] == ["bench_default"]
+
+
+def test_run_benchmark_and_compare_flags_slowdowns(tmp_path):
+    """Tests a real timing run and the threshold of the comparison."""
+    # --- Arrange ---
+    bench_file = tmp_path / "bench_math.py"
+    bench_file.write_text("def bench_sum():\n    sum(range(100))\n")
+    config = {"warmup": 0.01, "min-time": 0.005, "repeat": 5}
+
+    # --- Act ---
+    stats = run_benchmark(sys.executable, bench_file, "bench_sum", config, [])
+    rows = compare_results(
+        {"a": {"mean": 1.2}, "b": {"mean": 1.05}, "new": {"mean": 1.0}},
+        {"a": {"mean": 1.0}, "b": {"mean": 1.0}},
+        threshold=10,
+    )
+
+    # --- Assert ---
+    assert stats["rounds"] == 5
+    assert stats["min"] <= stats["median"] <= stats["p99"]
+    assert stats["ops"] == pytest.approx(1 / stats["mean"])
+    assert [(key, regressed) for key, _, _, _, regressed in rows] == [
+        ("a", True),
+        ("b", False),
+    ]
+
+
+@pytest.mark.parametrize(
+    "setting, message",
+    [
+        ("repeat = 0", "'repeat' .* must be an integer of at least 1"),
+        ('repeat = "5"', "'repeat' .* must be an integer of at least 1"),
+        ("min-time = 0", "'min-time' .* must be a positive number"),
+    ],
+)
+def test_get_bench_config_rejects_invalid_settings(tmp_path, setting, message):
+    """Tests that settings which would break the timing loop are reported."""
+    (tmp_path / "pyproject.toml").write_text(f"[tool.pyinit.bench]\n{setting}\n")
+
+    with pytest.raises(ValueError, match=message):
+        get_bench_config(tmp_path)
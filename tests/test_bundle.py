@@ -0,0 +1,34 @@
+import subprocess
+import sys
+
+import pytest
+
+from pyinit.bundle import write_bundle
+
+
+@pytest.mark.parametrize("extract", [False, True])
+def test_write_bundle_runs_main_like_pyinit_run(tmp_path, extract):
+    """Tests that the zipapp runs main.py with sibling and vendored imports."""
+    # --- Arrange ---
+    staging = tmp_path / "staging"
+    (staging / "app").mkdir(parents=True)
+    (staging / "app" / "helper.py").write_text("GREETING = 'hello'\n")
+    (staging / "app" / "main.py").write_text(
+        "import sys\nfrom helper import GREETING\nimport vendored\n"
+        "print(GREETING, vendored.NAME, sys.argv[1:])\n"
+    )
+    (staging / "vendored.py").write_text("NAME = 'dep'\n")
+    target = tmp_path / "dist" / "app.pyz"
+
+    # --- Act ---
+    write_bundle(staging, target, "app", sys.executable, extract)
+    result = subprocess.run(
+        [sys.executable, str(target), "--flag"],
+        capture_output=True,
+        text=True,
+        env={"PYINIT_BUNDLE_CACHE": str(tmp_path / "cache")},
+    )
+
+    # --- Assert ---
+    assert result.stdout == "hello dep ['--flag']\n", result.stderr
+    assert (tmp_path / "cache").exists() is extract
@@ -0,0 +1,28 @@
+import sys
+
+from pyinit.bytecode import compile_paths, get_compile_config
+
+
+def test_compile_paths_writes_every_optimization_level(tmp_path):
+    """Tests that each configured level gets a hash-based .pyc."""
+    # --- Arrange ---
+    (tmp_path / "pyproject.toml").write_text(
+        '[tool.pyinit.compile]\noptimize = [0, 2]\ninvalidation-mode = "unchecked-hash"\n'
+    )
+    package = tmp_path / "src" / "app"
+    package.mkdir(parents=True)
+    (package / "main.py").write_text("print('hello')\n")
+    config = get_compile_config(tmp_path)
+
+    # --- Act ---
+    ok = compile_paths(sys.executable, [tmp_path / "src"], config)
+
+    # --- Assert ---
+    tag = sys.implementation.cache_tag
+    cache = package / "__pycache__"
+    assert ok
+    assert (cache / f"main.{tag}.pyc").is_file()
+    assert (cache / f"main.{tag}.opt-2.pyc").is_file()
+    assert not (cache / f"main.{tag}.opt-1.pyc").exists()
+    # Flags word 0b01: hash-based, unchecked.
+    assert (cache / f"main.{tag}.pyc").read_bytes()[4:8] == b"\x01\x00\x00\x00"
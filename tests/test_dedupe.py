@@ -0,0 +1,40 @@
+import os
+
+from pyinit.dedupe import dedupe_directory, measure_directory
+
+
+def make_site_packages(root, content):
+    """Writes a small package into a fake site-packages directory."""
+    package = root / "site-packages" / "pkg"
+    package.mkdir(parents=True)
+    (package / "__init__.py").write_text(content)
+    (package / "data.txt").write_text("shared data\n")
+    return root / "site-packages"
+
+
+def test_dedupe_links_identical_files_and_detects_modifications(tmp_path):
+    """Tests hardlinking across venvs, read-only storage and later edits."""
+    # --- Arrange ---
+    store = tmp_path / "store"
+    first = make_site_packages(tmp_path / "a", "VERSION = 1\n")
+    second = make_site_packages(tmp_path / "b", "VERSION = 1\n")
+    first_index = tmp_path / "a" / "dedupe.json"
+    second_index = tmp_path / "b" / "dedupe.json"
+
+    # --- Act ---
+    dedupe_directory(first, store, first_index)
+    result = dedupe_directory(second, store, second_index)
+
+    # --- Assert ---
+    shared = first / "pkg" / "data.txt"
+    assert result.linked == 2
+    assert os.path.samefile(shared, second / "pkg" / "data.txt")
+    assert not os.access(shared, os.W_OK) or os.getuid() == 0
+    assert measure_directory(second) == (2, 24, 24, 24)
+
+    # An in-place edit of a shared file is reported and dropped from the store.
+    os.chmod(shared, 0o644)
+    shared.write_text("edited\n")
+    result = dedupe_directory(first, store, first_index)
+    assert result.modified == ["pkg/data.txt"]
+    assert dedupe_directory(first, store, first_index).modified == []
@@ -0,0 +1,199 @@
+import zipfile
+from importlib.metadata import PathDistribution
+
+import pytest
+from packaging.markers import default_environment
+from packaging.tags import Tag
+from rich.console import Console
+
+import pyinit.fastinstall
+from pyinit.fastinstall import (
+    PlannedWheel,
+    fast_install,
+    install_wheel,
+    plan_fast_install,
+    remove_distribution,
+)
+
+SUPPORTED_TAGS = [Tag("py3", "none", "any")]
+
+
+def make_wheel(directory, name, version, requires=(), files=None):
+    """Writes a minimal pure-Python wheel and returns its path."""
+    wheel = directory / f"{name}-{version}-py3-none-any.whl"
+    dist_info = f"{name}-{version}.dist-info"
+    metadata = f"Metadata-Version: 2.1\nName: {name}\nVersion: {version}\n"
+    metadata += "".join(f"Requires-Dist: {r}\n" for r in requires)
+    with zipfile.ZipFile(wheel, "w") as archive:
+        archive.writestr(f"{dist_info}/METADATA", metadata)
+        archive.writestr(f"{dist_info}/WHEEL", "Wheel-Version: 1.0\n")
+        archive.writestr(f"{dist_info}/RECORD", "")
+        for path, content in (files or {}).items():
+            archive.writestr(path, content)
+    return wheel
+
+
+def test_plan_fast_install_follows_pinned_dependencies(tmp_path):
+    """Tests that dependencies, extras and markers are resolved from the pins."""
+    # --- Arrange ---
+    app_requires = [
+        "lib>=2",
+        "extra-dep; extra == 'fancy'",
+        "win-only; sys_platform == 'never'",
+    ]
+    index = {
+        "app": {"1.0": [make_wheel(tmp_path, "app", "1.0", app_requires)]},
+        "lib": {"2.1": [make_wheel(tmp_path, "lib", "2.1")]},
+        "extra-dep": {"0.3": [make_wheel(tmp_path, "extra_dep", "0.3")]},
+    }
+    pins = {"app": "1.0", "lib": "2.1", "extra-dep": "0.3"}
+    environment = default_environment()
+
+    # --- Act ---
+    plain = plan_fast_install("app", pins, index, SUPPORTED_TAGS, environment, {})
+    fancy = plan_fast_install("app[fancy]", pins, index, SUPPORTED_TAGS, environment, {})
+    unpinned = plan_fast_install("app", {"app": "1.0"}, index, SUPPORTED_TAGS, environment, {})
+    mismatch = plan_fast_install("app>=2", pins, index, SUPPORTED_TAGS, environment, {})
+
+    # --- Assert ---
+    assert sorted(p.name for p in plain) == ["app", "lib"]
+    assert [p.requested for p in plain if p.name == "app"] == [True]
+    assert sorted(p.name for p in fancy) == ["app", "extra-dep", "lib"]
+    assert unpinned is None
+    assert mismatch is None
+
+
+def test_install_wheel_writes_files_record_and_scripts(tmp_path):
+    """Tests unpacking, .data routing, entry points and installation metadata."""
+    # --- Arrange ---
+    wheel = make_wheel(
+        tmp_path,
+        "tool",
+        "1.0",
+        files={
+            "tool/__init__.py": "def main():\n    return 0\n",
+            "tool-1.0.data/scripts/tool-legacy": "#!python\nprint('hi')\n",
+            "tool-1.0.dist-info/entry_points.txt": "[console_scripts]\ntool = tool:main\n",
+        },
+    )
+    venv_dir = tmp_path / "venv"
+    site_packages = venv_dir / "lib" / "python3.11" / "site-packages"
+    site_packages.mkdir(parents=True)
+    python_executable = venv_dir / "bin" / "python"
+
+    # --- Act ---
+    install_wheel(
+        PlannedWheel("tool", "1.0", wheel, True), venv_dir, site_packages, python_executable
+    )
+
+    # --- Assert ---
+    dist_info = site_packages / "tool-1.0.dist-info"
+    assert (site_packages / "tool" / "__init__.py").is_file()
+    assert (dist_info / "INSTALLER").read_text() == "pyinit\n"
+    assert (dist_info / "REQUESTED").is_file()
+
+    legacy_script = (venv_dir / "bin" / "tool-legacy").read_text()
+    assert legacy_script.startswith(f"#!{python_executable}\n")
+    console_script = (venv_dir / "bin" / "tool").read_text()
+    assert "from tool import main" in console_script
+
+    record = (dist_info / "RECORD").read_text().splitlines()
+    recorded_paths = {line.split(",")[0] for line in record}
+    assert "tool/__init__.py" in recorded_paths
+    assert "../../../bin/tool" in recorded_paths
+    assert "tool-1.0.dist-info/RECORD" in recorded_paths
+    assert all(line.split(",")[1].startswith("sha256=") for line in record[:-1])
+
+
+@pytest.mark.parametrize(
+    "member",
+    ["../evil.py", "/tmp/evil.py", "bad-1.0.data/../../evil.py", "bad-1.0.data/odd/x.py"],
+)
+def test_unsafe_wheel_members_are_refused(tmp_path, member):
+    """Tests that path traversal and unknown .data schemes are rejected."""
+    # --- Arrange ---
+    wheel = make_wheel(tmp_path, "bad", "1.0", files={member: "x = 1\n"})
+    venv_dir = tmp_path / "venv"
+    site_packages = venv_dir / "lib" / "python3.11" / "site-packages"
+    site_packages.mkdir(parents=True)
+    environment = default_environment()
+
+    # --- Act & Assert ---
+    with pytest.raises(ValueError):
+        plan_fast_install(
+            "bad", {"bad": "1.0"}, {"bad": {"1.0": [wheel]}}, SUPPORTED_TAGS, environment, {}
+        )
+    with pytest.raises(ValueError):
+        install_wheel(
+            PlannedWheel("bad", "1.0", wheel, True),
+            venv_dir,
+            site_packages,
+            venv_dir / "bin" / "python",
+        )
+    assert not (tmp_path / "evil.py").exists()
+
+
+def test_remove_distribution_deletes_files_and_dist_info(tmp_path):
+    """Tests that an installed wheel is removed through its RECORD."""
+    # --- Arrange ---
+    wheel = make_wheel(tmp_path, "lib", "2.0", files={"lib/__init__.py": ""})
+    venv_dir = tmp_path / "venv"
+    site_packages = venv_dir / "lib" / "python3.11" / "site-packages"
+    site_packages.mkdir(parents=True)
+    install_wheel(
+        PlannedWheel("lib", "2.0", wheel, False),
+        venv_dir,
+        site_packages,
+        venv_dir / "bin" / "python",
+    )
+
+    # --- Act ---
+    remove_distribution(PathDistribution(site_packages / "lib-2.0.dist-info"))
+
+    # --- Assert ---
+    assert list(site_packages.iterdir()) == []
+
+
+def test_fast_install_restores_replaced_distributions_on_failure(tmp_path, monkeypatch):
+    """Tests that a failed unpack removes new files and restores old versions."""
+    # --- Arrange ---
+    project_root = tmp_path / "project"
+    wheelhouse = project_root / ".pyinit" / "wheelhouse"
+    wheelhouse.mkdir(parents=True)
+    (project_root / "requirements.txt").write_text("app==1.0\nlib==2.1\n")
+    make_wheel(wheelhouse, "app", "1.0", ["lib"], files={"app/__init__.py": ""})
+    make_wheel(wheelhouse, "lib", "2.1", files={"lib/__init__.py": "NEW = 1\n"})
+
+    venv_dir = tmp_path / "venv"
+    site_packages = venv_dir / "lib" / "python3.11" / "site-packages"
+    site_packages.mkdir(parents=True)
+    old_wheel = make_wheel(tmp_path, "lib", "1.0", files={"lib/__init__.py": "OLD = 1\n"})
+    install_wheel(
+        PlannedWheel("lib", "1.0", old_wheel, True),
+        venv_dir,
+        site_packages,
+        venv_dir / "bin" / "python",
+    )
+    before = sorted(p.relative_to(venv_dir) for p in venv_dir.rglob("*"))
+
+    def failing_install_wheel(item, *args):
+        """Unpacks the wheel, then fails for the 'app' project."""
+        files = install_wheel(item, *args)
+        if item.name == "app":
+            raise OSError("disk full")
+        return files
+
+    monkeypatch.setattr(pyinit.fastinstall, "install_wheel", failing_install_wheel)
+    monkeypatch.setattr(pyinit.fastinstall, "get_supported_tags", lambda _: SUPPORTED_TAGS)
+    monkeypatch.setattr(
+        pyinit.fastinstall, "get_marker_environment", lambda _: default_environment()
+    )
+
+    # --- Act ---
+    with pytest.raises(OSError, match="disk full"):
+        fast_install(project_root, venv_dir, ["app"], Console(quiet=True))
+
+    # --- Assert ---
+    assert sorted(p.relative_to(venv_dir) for p in venv_dir.rglob("*")) == before
+    assert (site_packages / "lib" / "__init__.py").read_text() == "OLD = 1\n"
+    assert (site_packages / "lib-1.0.dist-info" / "REQUESTED").is_file()
@@ -0,0 +1,89 @@
+import sys
+import threading
+
+from rich.console import Console
+
+from pyinit.history import (
+    count_flips,
+    duration_trend,
+    read_history,
+    record_results,
+    write_history,
+    write_priority,
+)
+from pyinit.shard import run_worker
+
+
+def test_history_tracks_failures_changes_and_flips(tmp_path):
+    """Tests the priority file, flaky detection and trends of recorded runs."""
+    # --- Arrange ---
+    history = {}
+    fingerprints = {"tests/test_a.py": "f1", "tests/test_b.py": "f1"}
+    for outcome in ("passed", "failed", "passed"):
+        record_results(
+            history,
+            {
+                "tests/test_a.py::test_x": {"outcome": outcome, "duration": 1.0},
+                "tests/test_b.py::test_y": {"outcome": "passed", "duration": 2.0},
+            },
+            fingerprints,
+            size=2,
+        )
+    record_results(
+        history,
+        {"tests/test_b.py::test_y": {"outcome": "failed", "duration": 3.0}},
+        {"tests/test_b.py": "f2"},
+        size=2,
+    )
+    write_history(tmp_path, history)
+
+    # --- Act ---
+    reloaded = read_history(tmp_path)
+    _, failed, changed = write_priority(
+        tmp_path, reloaded, {**fingerprints, "tests/test_new.py": "f3"}
+    )
+
+    # --- Assert ---
+    assert len(reloaded["tests/test_a.py::test_x"]) == 2
+    # test_y failed last, and its file's code changed since (f2 -> f1).
+    assert (failed, changed) == (1, 2)
+    assert count_flips(reloaded["tests/test_a.py::test_x"]) == 1
+    # The failure of test_y came with a code change, so it is not flaky.
+    assert count_flips(reloaded["tests/test_b.py::test_y"]) == 0
+    assert duration_trend(reloaded["tests/test_b.py::test_y"]) == 50.0
+
+
+def test_plugin_runs_failed_then_changed_tests_first(tmp_path, monkeypatch):
+    """Tests the run order the plugin derives from the priority file."""
+    # --- Arrange ---
+    for name in ("a", "b", "c"):
+        (tmp_path / f"test_{name}.py").write_text(
+            "def test_one():\n    pass\ndef test_two():\n    pass\n"
+        )
+    priority = tmp_path / "priority.json"
+    priority.write_text(
+        '{"failed": ["test_c.py::test_two"], "changed": ["test_b.py"]}'
+    )
+    monkeypatch.setenv("PYINIT_TEST_PRIORITY", str(priority))
+
+    # --- Act ---
+    _, results, _ = run_worker(
+        "w1",
+        sys.executable,
+        tmp_path,
+        ["-p", "no:cacheprovider"],
+        [f"test_{name}.py::test_{test}" for name in "abc" for test in ("one", "two")],
+        tmp_path,
+        Console(file=sys.stderr),
+        threading.Lock(),
+    )
+
+    # --- Assert ---
+    assert list(results) == [
+        "test_c.py::test_two",
+        "test_b.py::test_one",
+        "test_b.py::test_two",
+        "test_a.py::test_one",
+        "test_a.py::test_two",
+        "test_c.py::test_one",
+    ]
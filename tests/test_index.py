@@ -0,0 +1,182 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from packaging.tags import compatible_tags
+
+from pyinit.cache import IndexCache, OfflineCacheMiss
+from pyinit.index import (
+    OutdatedPackage,
+    find_missing_projects,
+    find_outdated,
+    get_index_url,
+)
+
+# Project pages served by the stub index, keyed by normalized project name.
+STUB_PAGES = {
+    "requests": (
+        "application/vnd.pypi.simple.v1+json",
+        json.dumps(
+            {
+                "files": [
+                    {"filename": "requests-2.31.0-py3-none-any.whl"},
+                    {"filename": "requests-2.32.3.tar.gz"},
+                    {"filename": "requests-2.33.0-py3-none-any.whl", "yanked": True},
+                    {"filename": "requests-3.0.0b1-py3-none-any.whl"},
+                ]
+            }
+        ),
+    ),
+    "rich": (
+        "text/html",
+        '<a href="rich-14.2.0-py3-none-any.whl">rich-14.2.0-py3-none-any.whl</a>'
+        '<a href="rich-13.0.0.tar.gz">rich-13.0.0.tar.gz</a>',
+    ),
+    "attrs": (
+        "application/vnd.pypi.simple.v1+json",
+        json.dumps(
+            {
+                "files": [
+                    {"filename": "attrs-23.0.0-py3-none-any.whl"},
+                    {
+                        "filename": "attrs-24.0.0-py3-none-any.whl",
+                        "requires-python": ">=3.12",
+                    },
+                    {"filename": "attrs-25.0.0-cp399-cp399-win_amd64.whl"},
+                ]
+            }
+        ),
+    ),
+    "six": (
+        "text/html",
+        '<a href="six-1.17.0.tar.gz" data-requires-python="&gt;=3.12">'
+        "six-1.17.0.tar.gz</a>"
+        '<a href="six-1.16.0.tar.gz" data-requires-python="&gt;=2.7">'
+        "six-1.16.0.tar.gz</a>",
+    ),
+}
+
+
+# This fixture runs a minimal Simple API index on localhost.
+@pytest.fixture
+def stub_index():
+    requests_seen = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            requests_seen.append((self.path, self.headers.get("If-None-Match")))
+            name = self.path.strip("/").split("/")[-1]
+            if name == "broken":
+                self.send_response(503)
+                self.end_headers()
+                return
+            if name not in STUB_PAGES:
+                self.send_response(404)
+                self.end_headers()
+                return
+            etag = f'"{name}-v1"'
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.end_headers()
+                return
+            content_type, body = STUB_PAGES[name]
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            self.wfile.write(body.encode())
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/simple", requests_seen
+    server.shutdown()
+
+
+def test_find_outdated_against_stub_index(stub_index, tmp_path):
+    """Tests JSON and HTML pages, yanked files, pre-releases and unknown projects."""
+    index_url, _ = stub_index
+    installed = {"requests": "2.31.0", "rich": "14.2.0", "private-pkg": "1.0"}
+
+    outdated, errors = find_outdated(installed, index_url, IndexCache(tmp_path))
+
+    assert outdated == [OutdatedPackage("requests", "2.31.0", "2.32.3")]
+    assert errors == {}
+
+
+def test_find_outdated_skips_incompatible_files(stub_index, tmp_path):
+    """Tests that Requires-Python and wheel tags rule out uninstallable versions."""
+    index_url, _ = stub_index
+    installed = {"attrs": "22.0.0", "six": "1.15.0"}
+    supported = list(compatible_tags((3, 11)))
+
+    outdated, _ = find_outdated(
+        installed, index_url, IndexCache(tmp_path), 4, "3.11.7", supported
+    )
+
+    assert outdated == [
+        OutdatedPackage("attrs", "22.0.0", "23.0.0"),
+        OutdatedPackage("six", "1.15.0", "1.16.0"),
+    ]
+
+
+def test_find_outdated_returns_fetch_errors(stub_index, tmp_path):
+    """Tests that a failing index is reported instead of taken for up to date."""
+    index_url, _ = stub_index
+
+    outdated, errors = find_outdated({"broken": "1.0"}, index_url, IndexCache(tmp_path))
+
+    assert outdated == []
+    assert list(errors) == ["broken"]
+
+
+def test_find_outdated_revalidates_stale_entries(stub_index, tmp_path):
+    """Tests that an expired entry is revalidated with its ETag."""
+    index_url, requests_seen = stub_index
+    cache = IndexCache(tmp_path, ttl=0)
+
+    first, _ = find_outdated({"requests": "2.0.0"}, index_url, cache)
+    second, _ = find_outdated({"requests": "2.0.0"}, index_url, cache)
+
+    assert first == second == [OutdatedPackage("requests", "2.0.0", "2.32.3")]
+    assert requests_seen == [
+        ("/simple/requests/", None),
+        ("/simple/requests/", '"requests-v1"'),
+    ]
+
+
+def test_fresh_and_offline_lookups_skip_the_network(stub_index, tmp_path):
+    """Tests that fresh entries, cached 404s and offline mode make no requests."""
+    index_url, requests_seen = stub_index
+    find_missing_projects(["requests", "private-pkg"], index_url, IndexCache(tmp_path))
+    assert len(requests_seen) == 2
+
+    fresh = find_missing_projects(
+        ["requests", "private-pkg"], index_url, IndexCache(tmp_path, ttl=3600)
+    )
+    offline, errors = find_outdated(
+        {"requests": "2.0.0", "rich": "1.0"},
+        index_url,
+        IndexCache(tmp_path, ttl=0, offline=True),
+    )
+
+    assert fresh == ["private-pkg"]
+    assert offline == [OutdatedPackage("requests", "2.0.0", "2.32.3")]
+    assert list(errors) == ["rich"]
+    assert isinstance(errors["rich"], OfflineCacheMiss)
+    assert len(requests_seen) == 2
+
+
+def test_get_index_url_prefers_project_config(tmp_path, monkeypatch):
+    """Tests that the configured index URL overrides the environment."""
+    monkeypatch.setenv("PIP_INDEX_URL", "https://env.example/simple")
+    assert get_index_url(tmp_path) == "https://env.example/simple"
+
+    (tmp_path / "pyproject.toml").write_text(
+        '[tool.pyinit]\nindex-url = "https://config.example/simple/"\n'
+    )
+    assert get_index_url(tmp_path) == "https://config.example/simple"
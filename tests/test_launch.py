@@ -0,0 +1,41 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from pyinit.launch import read_launch_record, write_launch_record
+
+
+def test_launch_record_is_invalidated_by_stamped_files(tmp_path):
+    """Tests that a launch record is valid until a stamped file changes."""
+    # --- Arrange ---
+    pyproject = tmp_path / "pyproject.toml"
+    pyproject.write_text("[project]\nname = 'demo'\n")
+    main_file = tmp_path / "main.py"
+    main_file.write_text("print('hi')\n")
+    argv = [sys.executable, str(main_file)]
+
+    # --- Act ---
+    write_launch_record(str(tmp_path), argv, "demo", [str(pyproject)])
+    record = read_launch_record(str(tmp_path))
+    pyproject.write_text("[project]\nname = 'demo2'\n")
+    os.utime(pyproject, ns=(0, 0))
+
+    # --- Assert ---
+    assert record["argv"] == argv
+    assert record["banner"] == "demo"
+    assert read_launch_record(str(tmp_path)) is None
+
+
+def test_entry_point_does_not_import_rich():
+    """Tests that the fast path of 'pyinit run' starts without loading rich."""
+    src = Path(__file__).parent.parent / "src"
+    code = "import sys, pyinit.main; print('rich' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        env={**os.environ, "PYTHONPATH": str(src)},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "False"
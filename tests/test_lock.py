@@ -0,0 +1,102 @@
+import pytest
+from packaging.markers import default_environment
+
+from pyinit.lock import (
+    TOOL_PACKAGES,
+    build_lock,
+    compute_sync_delta,
+    find_dependency_closure,
+)
+
+
+def report_item(name, version, requires=(), sha256=None):
+    """Builds one entry of a pip installation report."""
+    item = {"metadata": {"name": name, "version": version, "requires_dist": list(requires)}}
+    if sha256:
+        item["download_info"] = {"archive_info": {"hashes": {"sha256": sha256}}}
+    return item
+
+
+def test_build_lock_records_direct_transitive_and_groups():
+    """Tests the direct/transitive split, group reachability and markers."""
+    # --- Arrange ---
+    groups = {
+        "main": ["Rich>=13", "tomli; python_version < '3.11'"],
+        "dev": ["pytest"],
+    }
+    report = {
+        "install": [
+            report_item("rich", "14.2.0", ["markdown-it-py (>=2.2.0)", "ipywidgets; extra == 'jupyter'"], "aa"),
+            report_item("markdown-it-py", "4.0.0", ["mdurl~=0.1"], "bb"),
+            report_item("mdurl", "0.1.2"),
+            report_item("tomli", "2.3.0"),
+            report_item("pytest", "8.4.2", ["mdurl"]),
+        ]
+    }
+
+    # --- Act ---
+    packages = {p["name"]: p for p in build_lock(groups, report, default_environment())}
+
+    # --- Assert ---
+    assert list(packages) == ["markdown-it-py", "mdurl", "pytest", "rich", "tomli"]
+    assert packages["rich"]["direct"] is True
+    assert packages["rich"]["hashes"] == ["sha256:aa"]
+    assert packages["rich"]["dependencies"] == ["markdown-it-py"]
+    assert packages["markdown-it-py"]["direct"] is False
+    assert packages["mdurl"]["groups"] == ["dev", "main"]
+    assert packages["tomli"]["markers"] == 'python_version < "3.11"'
+    assert "markers" not in packages["rich"]
+
+
+def test_compute_sync_delta_only_touches_changes():
+    """Tests that only missing, mismatched and extraneous packages are synced."""
+    environment = {**default_environment(), "python_version": "3.12"}
+    packages = [
+        {"name": "rich", "version": "14.2.0"},
+        {"name": "mdurl", "version": "0.1.2"},
+        {"name": "tomli", "version": "2.3.0", "markers": 'python_version < "3.11"'},
+        {"name": "pygments", "version": "2.19.2"},
+    ]
+    installed = {
+        "rich": "14.2",
+        "mdurl": "0.1.0",
+        "six": "1.17.0",
+        "pip": "25.0",
+        "my-project": "0.1.0",
+    }
+
+    to_install, to_remove = compute_sync_delta(
+        packages, installed, environment, {"pip", "my-project"}
+    )
+
+    assert [p["name"] for p in to_install] == ["mdurl", "pygments"]
+    assert to_remove == ["six"]
+    assert compute_sync_delta(packages[:1], {"rich": "14.2.0"}, environment, set()) == ([], [])
+
+
+def test_build_lock_reports_invalid_declared_requirements():
+    """Tests that an invalid declared requirement names its group."""
+    with pytest.raises(ValueError, match="'rich>=>13' in the 'dev' dependencies"):
+        build_lock({"dev": ["rich>=>13"]}, {}, default_environment())
+
+
+def test_tools_and_their_dependencies_are_kept(make_dist):
+    """Tests that pyinit's tools and their dependency closure are never extraneous."""
+    # --- Arrange ---
+    installed = {
+        "pytest": make_dist("pytest", "8.4.2", ["pluggy", "iniconfig"]),
+        "pluggy": make_dist("pluggy", "1.6.0"),
+        "iniconfig": make_dist("iniconfig", "2.1.0"),
+        "six": make_dist("six", "1.17.0"),
+    }
+    environment = default_environment()
+
+    # --- Act ---
+    keep = find_dependency_closure(installed, TOOL_PACKAGES, environment)
+    _, to_remove = compute_sync_delta(
+        [], {name: dist.version for name, dist in installed.items()}, environment, keep
+    )
+
+    # --- Assert ---
+    assert keep == {"pytest", "pluggy", "iniconfig"}
+    assert to_remove == ["six"]
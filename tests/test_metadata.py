@@ -0,0 +1,31 @@
+from packaging.markers import default_environment
+from packaging.requirements import Requirement
+
+from pyinit.metadata import is_requirement_satisfied
+
+
+
+def test_is_requirement_satisfied_checks_specifiers_extras_and_markers(make_dist):
+    """Tests version specifiers, extra dependencies and environment markers."""
+    # --- Arrange ---
+    installed = {
+        "requests": make_dist(
+            "requests", "2.20.0", ["idna", "PySocks!=1.5.7; extra == 'socks'"]
+        ),
+        "idna": make_dist("idna", "3.10"),
+        "rich": make_dist("rich", "14.0.0rc1", ["pygments; extra == 'syntax'"]),
+    }
+    environment = default_environment()
+
+    def satisfied(line):
+        return is_requirement_satisfied(Requirement(line), installed, environment)
+
+    # --- Act & Assert ---
+    assert satisfied("Requests>=2.0,<3")
+    assert not satisfied("requests>=2.31")
+    assert not satisfied("requests[socks]")
+    assert not satisfied("missing")
+    assert satisfied("missing; sys_platform == 'never'")
+    assert satisfied("rich>=13")
+    assert not satisfied("rich[syntax]")
+    assert not satisfied("requests @ https://example.com/requests-2.20.0.tar.gz")
@@ -0,0 +1,202 @@
+import os
+import pstats
+import signal
+import subprocess
+import sys
+import time
+
+import pytest
+from rich.console import Console
+
+from pyinit.profiling import (
+    build_collapsed_stacks,
+    filter_own,
+    get_bootstrap,
+    load_snapshot,
+    mem_script,
+    profile_script,
+    sample_script,
+)
+
+
+def test_collapsed_stacks_split_time_between_callers(tmp_path):
+    """Tests that a shared callee's self time is apportioned per call edge."""
+    # --- Arrange ---
+    # main -> a -> leaf (0.3s) and main -> b -> leaf (0.1s), plus recursion in leaf.
+    main = (str(tmp_path / "src" / "app" / "main.py"), 1, "main")
+    a = (str(tmp_path / "src" / "app" / "main.py"), 5, "a")
+    b = (str(tmp_path / "src" / "app" / "main.py"), 9, "b")
+    leaf = ("/usr/lib/python3.11/json/encoder.py", 1, "leaf")
+    stats = {
+        main: (1, 1, 0.1, 0.5, {}),
+        a: (1, 1, 0.0, 0.3, {main: (1, 1, 0.0, 0.3)}),
+        b: (1, 1, 0.0, 0.1, {main: (1, 1, 0.0, 0.1)}),
+        leaf: (
+            2,
+            4,
+            0.4,
+            0.4,
+            {a: (1, 1, 0.3, 0.3), b: (1, 1, 0.1, 0.1), leaf: (2, 2, 0.0, 0.0)},
+        ),
+    }
+
+    # --- Act ---
+    stacks = build_collapsed_stacks(stats, tmp_path)
+
+    # --- Assert ---
+    rounded = {stack: round(seconds, 6) for stack, seconds in stacks.items() if seconds}
+    assert rounded == {
+        "src/app/main.py:1(main)": 0.1,
+        "src/app/main.py:1(main);src/app/main.py:5(a);json/encoder.py:1(leaf)": 0.3,
+        "src/app/main.py:1(main);src/app/main.py:9(b);json/encoder.py:1(leaf)": 0.1,
+    }
+    assert set(filter_own(stats, tmp_path / "src")) == {main, a, b}
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGTERM"), reason="POSIX only")
+def test_profile_bootstrap_dumps_on_sys_exit_and_sigterm(tmp_path):
+    """Tests that the profile is written however the script ends."""
+    # --- Arrange ---
+    exiting = tmp_path / "exiting.py"
+    exiting.write_text("import sys\ndef work():\n    sum(range(1000))\nwork()\nsys.exit(3)\n")
+    waiting = tmp_path / "waiting.py"
+    waiting.write_text("import time\nprint('ready', flush=True)\ntime.sleep(30)\n")
+    bootstrap = str(get_bootstrap("pyinit_profile"))
+
+    def start(script, output, **kwargs):
+        env = {**os.environ, "PYINIT_PROFILE_OUTPUT": str(output)}
+        return subprocess.Popen([sys.executable, bootstrap, str(script)], env=env, **kwargs)
+
+    # --- Act ---
+    exited = start(exiting, tmp_path / "exit.pstats").wait(timeout=30)
+    process = start(waiting, tmp_path / "term.pstats", stdout=subprocess.PIPE, text=True)
+    try:
+        assert process.stdout.readline() == "ready\n"
+    finally:
+        process.terminate()
+        terminated = process.wait(timeout=10)
+
+    # --- Assert ---
+    assert exited == 3
+    assert "work" in {func[2] for func in pstats.Stats(str(tmp_path / "exit.pstats")).stats}
+    assert terminated == 128 + signal.SIGTERM
+    assert (tmp_path / "term.pstats").stat().st_size > 0
+
+
+def test_profile_script_filters_own_code_and_compares(tmp_path):
+    """Tests '--profile-own' and '--profile-compare' through the bootstrap."""
+    # --- Arrange ---
+    main = tmp_path / "src" / "app" / "main.py"
+    main.parent.mkdir(parents=True)
+    main.write_text(
+        "import json\ndef encode():\n    json.dumps(list(range(1000)))\nencode()\n"
+    )
+    run_cmd = [sys.executable, str(main)]
+    console = Console(record=True, width=200)
+
+    # --- Act ---
+    first = profile_script(console, tmp_path, run_cmd, {"--profile-own": True})
+    baseline = next((tmp_path / ".pyinit").rglob("*.pstats"))
+    console.export_text()
+    second = profile_script(
+        console, tmp_path, run_cmd, {"--profile-own": True, "--profile-compare": str(baseline)}
+    )
+    output = console.export_text()
+
+    # --- Assert ---
+    assert first == second == 0
+    assert "src/app/main.py:2(encode)" in output
+    assert "json" + os.sep + "encoder.py" not in output
+    assert "Largest changes in cumulative time" in output
+
+
+@pytest.mark.parametrize(
+    "run, options, message",
+    [
+        (profile_script, {"--profile-sort": "name"}, "'--profile-sort' must be one of"),
+        (profile_script, {"--profile-top": "ten"}, "'--profile-top' must be a positive"),
+        (sample_script, {"--sample-interval": "fast"}, "'--sample-interval' must be a"),
+        (sample_script, {"--sample-interval": "0"}, "'--sample-interval' must be a"),
+        (mem_script, {"--mem-top": "0"}, "'--mem-top' must be a positive"),
+        (mem_script, {"--mem-frames": "x"}, "'--mem-frames' must be a positive"),
+        (mem_script, {"--mem-interval": "-1"}, "'--mem-interval' must be a non-negative"),
+        (mem_script, {"--mem-interval": "1s"}, "'--mem-interval' must be a non-negative"),
+    ],
+)
+def test_invalid_run_options_are_reported(tmp_path, run, options, message):
+    """Tests that bad option values are refused before the script runs."""
+    with pytest.raises(ValueError, match=message):
+        run(Console(), tmp_path, [sys.executable, "main.py"], options)
+    assert not (tmp_path / ".pyinit").exists()
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGUSR2"), reason="POSIX only")
+def test_sample_bootstrap_dumps_on_sigusr2_and_on_exit(tmp_path):
+    """Tests that the sampler writes collapsed stacks while running and at exit."""
+    # --- Arrange ---
+    script = tmp_path / "main.py"
+    script.write_text(
+        "import time\n"
+        "def wait_here():\n"
+        "    print('ready', flush=True)\n"
+        "    time.sleep(30)\n"
+        "wait_here()\n"
+    )
+    output = tmp_path / "out.collapsed"
+    env = {
+        **os.environ,
+        "PYINIT_SAMPLE_OUTPUT": str(output),
+        "PYINIT_SAMPLE_INTERVAL": "5",
+        "PYINIT_PROJECT_ROOT": str(tmp_path),
+    }
+    process = subprocess.Popen(
+        [sys.executable, str(get_bootstrap("pyinit_sample")), str(script)],
+        env=env,
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+
+    # --- Act ---
+    try:
+        assert process.stdout.readline() == "ready\n"
+        time.sleep(0.2)
+        process.send_signal(signal.SIGUSR2)
+        for _ in range(50):
+            if output.exists():
+                break
+            time.sleep(0.05)
+        early = output.read_text()
+    finally:
+        process.terminate()
+        returncode = process.wait(timeout=10)
+
+    # --- Assert ---
+    assert "thread (MainThread);<module> (main.py:1);wait_here (main.py:2) " in early
+    assert returncode == 128 + signal.SIGTERM
+    assert "wait_here (main.py:2)" in output.read_text()
+
+
+def test_mem_bootstrap_writes_start_and_exit_snapshots(tmp_path):
+    """Tests that allocation growth between snapshots is attributed to its line."""
+    # --- Arrange ---
+    script = tmp_path / "main.py"
+    script.write_text("kept = [bytearray(50_000) for _ in range(20)]\n")
+    env = {**os.environ, "PYINIT_MEM_OUTPUT": str(tmp_path)}
+
+    # --- Act ---
+    subprocess.run(
+        [sys.executable, str(get_bootstrap("pyinit_mem")), str(script)],
+        env=env,
+        check=True,
+    )
+
+    # --- Assert ---
+    snapshots = sorted(tmp_path.glob("*.tracemalloc"))
+    assert [path.name for path in snapshots] == [
+        "0001-start.tracemalloc",
+        "0002-exit.tracemalloc",
+    ]
+    growth = load_snapshot(snapshots[1]).compare_to(load_snapshot(snapshots[0]), "lineno")
+    assert growth[0].traceback[0].filename == str(script)
+    assert growth[0].size_diff >= 20 * 50_000
+    assert (tmp_path / "rss.csv").read_text().splitlines()[0].startswith("seconds,event,rss")
@@ -0,0 +1,46 @@
+from pyinit.requirements import patch_requirements
+
+
+def test_patch_requirements_touches_only_changed_lines(make_dist):
+    """Tests upgrades, removals and sorted insertions, keeping other lines."""
+    # --- Arrange ---
+    lines = [
+        "# pinned by hand",
+        "-e ./libs/core",
+        "Markdown-It-Py==3.0.0  # keep this comment",
+        "rich==13.0.0",
+        "six==1.16.0",
+    ]
+    before = {"markdown-it-py": "3.0.0", "rich": "13.0.0", "six": "1.16.0", "core": "0.1"}
+    after = {
+        "markdown-it-py": make_dist("Markdown-It-Py", "4.0.0"),
+        "rich": make_dist("rich", "13.0.0"),
+        "pygments": make_dist("Pygments", "2.19.2"),
+        "pip": make_dist("pip", "25.0"),
+        "core": make_dist(
+            "core",
+            "0.2",
+            direct_url={"url": "file:///libs/core", "dir_info": {"editable": True}},
+        ),
+    }
+
+    # --- Act ---
+    patched, changed = patch_requirements(lines, before, after)
+
+    # --- Assert ---
+    assert changed is True
+    assert patched == [
+        "# pinned by hand",
+        "-e ./libs/core",
+        "Markdown-It-Py==4.0.0  # keep this comment",
+        "Pygments==2.19.2",
+        "rich==13.0.0",
+    ]
+
+
+def test_patch_requirements_without_changes_is_a_no_op(make_dist):
+    """Tests that identical snapshots leave the lines untouched."""
+    lines = ["rich==13.0.0"]
+    after = {"rich": make_dist("rich", "13.0.0")}
+
+    assert patch_requirements(lines, {"rich": "13.0.0"}, after) == (lines, False)
@@ -0,0 +1,102 @@
+import sys
+import threading
+
+import pytest
+
+from rich.console import Console
+
+from pyinit.shard import (
+    balance_tests,
+    collect_tests,
+    estimate_durations,
+    parse_shard,
+    run_worker,
+)
+
+
+def test_balance_tests_is_greedy_and_keeps_collection_order():
+    """Tests the longest-first placement into a deterministic split."""
+    # --- Arrange ---
+    tests = ["a", "b", "c", "d", "e", "f"]
+    durations = {"a": 1.0, "b": 5.0, "c": 3.0, "d": 3.0, "e": 2.0, "f": 2.8}
+
+    # --- Act ---
+    groups = balance_tests(tests, durations, 2)
+    again = balance_tests(tests, durations, 2)
+    too_many = balance_tests(["a", "b"], durations, 4)
+
+    # --- Assert ---
+    # b=5 | c=3, d=3 | f=2.8 | e=2 | a=1, each on the lighter group
+    assert groups == [["a", "b", "f"], ["c", "d", "e"]]
+    assert again == groups
+    assert too_many == [["b"], ["a"], [], []]
+
+
+def test_estimate_durations_scales_file_sizes_by_recorded_timings(tmp_path):
+    """Tests the file-size fallback for tests without a recorded duration."""
+    # --- Arrange ---
+    (tmp_path / "test_small.py").write_text("x" * 100)
+    (tmp_path / "test_big.py").write_text("x" * 400)
+    tests = [
+        "test_small.py::test_a",
+        "test_small.py::test_b",
+        "test_big.py::test_c",
+        "test_big.py::test_d",
+    ]
+
+    # --- Act ---
+    # test_a is recorded at 0.5s for 50 bytes: 0.01s per byte.
+    estimated = estimate_durations(tmp_path, tests, {"test_small.py::test_a": 0.5})
+    unknown = estimate_durations(tmp_path, tests, {})
+
+    # --- Assert ---
+    assert estimated == pytest.approx(
+        {
+            "test_small.py::test_a": 0.5,
+            "test_small.py::test_b": 0.5,
+            "test_big.py::test_c": 2.0,
+            "test_big.py::test_d": 2.0,
+        }
+    )
+    # Without any timing, an average test takes one second.
+    assert sum(unknown.values()) == pytest.approx(4.0)
+    assert parse_shard("2/3") == (2, 3)
+    with pytest.raises(ValueError):
+        parse_shard("4/3")
+
+
+def test_collect_and_run_worker_through_the_plugin(tmp_path):
+    """Tests that a worker runs exactly its selected tests and reports them."""
+    # --- Arrange ---
+    (tmp_path / "test_sample.py").write_text(
+        "import pytest\n"
+        "def test_one():\n    pass\n"
+        "def test_two():\n    assert False\n"
+        "@pytest.mark.skip\ndef test_three():\n    pass\n"
+    )
+    console = Console(file=sys.stderr)
+
+    # --- Act ---
+    tests = collect_tests(sys.executable, tmp_path, ["-p", "no:cacheprovider"])
+    returncode, results, _ = run_worker(
+        "w1",
+        sys.executable,
+        tmp_path,
+        ["-p", "no:cacheprovider"],
+        [tests[1], tests[2]],
+        tmp_path,
+        console,
+        threading.Lock(),
+    )
+
+    # --- Assert ---
+    assert tests == [
+        "test_sample.py::test_one",
+        "test_sample.py::test_two",
+        "test_sample.py::test_three",
+    ]
+    assert returncode == 1
+    assert {nodeid: result["outcome"] for nodeid, result in results.items()} == {
+        "test_sample.py::test_two": "failed",
+        "test_sample.py::test_three": "skipped",
+    }
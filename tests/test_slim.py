@@ -0,0 +1,80 @@
+from importlib.metadata import PathDistribution
+from pathlib import PurePosixPath
+
+from pyinit.slim import (
+    get_slim_config,
+    is_removable,
+    remove_stale_bytecode,
+    slim_distribution,
+)
+
+CACHE_TAG = "cpython-311"
+
+
+def test_is_removable_honours_the_slim_settings(tmp_path):
+    """Tests which recorded paths are stripped with default and custom settings."""
+    config = get_slim_config(tmp_path)
+    stubs = {**config, "stubs": True, "remove": ["*/benchmarks/*"]}
+
+    assert is_removable(PurePosixPath("pkg/tests/test_core.py"), config)
+    assert is_removable(PurePosixPath("pkg/docs/index.txt"), config)
+    assert is_removable(PurePosixPath("pkg/README.md"), config)
+    assert not is_removable(PurePosixPath("tests/__init__.py"), config)
+    assert not is_removable(PurePosixPath("pkg-1.0.dist-info/LICENSE.md"), config)
+    assert not is_removable(PurePosixPath("../../../bin/tool"), config)
+    assert not is_removable(PurePosixPath("pkg/core.pyi"), config)
+    assert is_removable(PurePosixPath("pkg/core.pyi"), stubs)
+    assert is_removable(PurePosixPath("pkg/benchmarks/run.py"), stubs)
+
+
+def test_slim_distribution_removes_files_and_rewrites_record(tmp_path):
+    """Tests that stripped files, and their bytecode, leave RECORD."""
+    # --- Arrange ---
+    files = {
+        "pkg/__init__.py": "x = 1\n",
+        f"pkg/__pycache__/__init__.{CACHE_TAG}.pyc": "compiled",
+        "pkg/tests/test_pkg.py": "def test(): pass\n",
+        f"pkg/tests/__pycache__/test_pkg.{CACHE_TAG}.pyc": "compiled",
+        "pkg-1.0.dist-info/METADATA": "Metadata-Version: 2.1\nName: pkg\nVersion: 1.0\n",
+    }
+    for path, content in files.items():
+        (tmp_path / path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / path).write_text(content)
+    record = [f"{path},sha256=x,{len(content)}" for path, content in files.items()]
+    record.append("pkg-1.0.dist-info/RECORD,,")
+    (tmp_path / "pkg-1.0.dist-info" / "RECORD").write_text("\n".join(record) + "\n")
+    dist = PathDistribution(tmp_path / "pkg-1.0.dist-info")
+
+    # --- Act ---
+    freed = slim_distribution(dist, tmp_path, get_slim_config(tmp_path), CACHE_TAG)
+
+    # --- Assert ---
+    assert freed == len("def test(): pass\n") + len("compiled")
+    assert not (tmp_path / "pkg" / "tests" / "test_pkg.py").exists()
+    assert (tmp_path / "pkg" / "__pycache__" / f"__init__.{CACHE_TAG}.pyc").exists()
+    recorded = [line.split(",")[0] for line in dist.read_text("RECORD").splitlines()]
+    assert recorded == [
+        "pkg/__init__.py",
+        f"pkg/__pycache__/__init__.{CACHE_TAG}.pyc",
+        "pkg-1.0.dist-info/METADATA",
+        "pkg-1.0.dist-info/RECORD",
+    ]
+
+
+def test_remove_stale_bytecode_only_prunes_directories_it_emptied(tmp_path):
+    """Tests that pre-existing empty directories survive slimming."""
+    # --- Arrange ---
+    stale = tmp_path / "pkg" / "old" / "__pycache__" / "gone.cpython-38.pyc"
+    stale.parent.mkdir(parents=True)
+    stale.write_text("compiled")
+    (tmp_path / "pkg" / "__init__.py").write_text("")
+    (tmp_path / "other" / "data").mkdir(parents=True)
+
+    # --- Act ---
+    freed = remove_stale_bytecode(tmp_path, CACHE_TAG)
+
+    # --- Assert ---
+    assert freed == len("compiled")
+    assert not (tmp_path / "pkg" / "old").exists()
+    assert (tmp_path / "pkg" / "__init__.py").exists()
+    assert (tmp_path / "other" / "data").is_dir()
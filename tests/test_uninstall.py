@@ -0,0 +1,45 @@
+from packaging.markers import default_environment
+from packaging.requirements import Requirement
+
+from pyinit.uninstall import find_orphans
+
+
+def test_find_orphans_keeps_shared_declared_and_top_level_packages(make_dist):
+    """Tests that only dependencies unreachable after the removal are orphans."""
+    # --- Arrange ---
+    installed = {
+        "flask": make_dist("flask", "3.0", ["werkzeug", "jinja2", "click"]),
+        "werkzeug": make_dist("werkzeug", "3.0", ["markupsafe"]),
+        "jinja2": make_dist("jinja2", "3.1", ["markupsafe"]),
+        "markupsafe": make_dist("markupsafe", "2.1"),
+        "click": make_dist("click", "8.1"),
+        "rich": make_dist("rich", "14.0", ["pygments; extra == 'syntax'"]),
+        "pygments": make_dist("pygments", "2.19"),
+        "black": make_dist("black", "25.1", ["click"]),
+        "pip": make_dist("pip", "25.0"),
+    }
+    roots = [Requirement("rich[syntax]")]
+
+    # --- Act ---
+    orphans = find_orphans(
+        installed, {"flask"}, roots, default_environment(), {"pip"}
+    )
+
+    # --- Assert ---
+    assert orphans == ["jinja2", "markupsafe", "werkzeug"]
+
+
+def test_find_orphans_keeps_requested_dependencies(make_dist):
+    """Tests that a package installed on request survives its dependents."""
+    # --- Arrange ---
+    installed = {
+        "requests": make_dist("requests", "2.32", ["certifi", "idna"]),
+        "certifi": make_dist("certifi", "2025.1", requested=True),
+        "idna": make_dist("idna", "3.10"),
+    }
+
+    # --- Act ---
+    orphans = find_orphans(installed, {"requests"}, [], default_environment(), set())
+
+    # --- Assert ---
+    assert orphans == ["idna"]
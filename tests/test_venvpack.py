@@ -0,0 +1,82 @@
+import io
+import json
+import os
+import tarfile
+
+import pytest
+
+from pyinit.venvpack import (
+    MANIFEST_NAME,
+    find_pack_path,
+    get_pack_path,
+    pack_venv,
+    unpack_venv,
+)
+
+
+def test_pack_and_unpack_relocate_the_venv(tmp_path):
+    """Tests that absolute paths are rewritten when a venv is moved."""
+    # --- Arrange ---
+    venv_dir = tmp_path / "old" / "venv"
+    site_packages = venv_dir / "lib" / "python3.11" / "site-packages"
+    site_packages.mkdir(parents=True)
+    (venv_dir / "bin").mkdir()
+    prefix = str(venv_dir.resolve())
+    script = venv_dir / "bin" / "tool"
+    script.write_text(f"#!{prefix}/bin/python\nimport tool\n")
+    script.chmod(0o755)
+    (venv_dir / "bin" / "python").symlink_to("/usr/bin/python3")
+    (venv_dir / "pyvenv.cfg").write_text(f"home = /usr/bin\ncommand = python -m venv {prefix}\n")
+    (site_packages / "module.py").write_text(f"# {prefix} is not rewritten here\n")
+    archive = tmp_path / "venv.tar.gz"
+    new_venv = tmp_path / "new" / "venv"
+    new_venv.parent.mkdir()
+
+    # --- Act ---
+    templated = pack_venv(venv_dir, archive, "3.11.7")
+    rewritten = unpack_venv(archive, new_venv)
+
+    # --- Assert ---
+    new_prefix = str(new_venv.resolve())
+    assert templated == rewritten == 2
+    assert (new_venv / "bin" / "tool").read_text().startswith(f"#!{new_prefix}/bin/python\n")
+    assert os.access(new_venv / "bin" / "tool", os.X_OK)
+    assert os.readlink(new_venv / "bin" / "python") == "/usr/bin/python3"
+    assert new_prefix in (new_venv / "pyvenv.cfg").read_text()
+    assert prefix in (new_venv / "lib" / "python3.11" / "site-packages" / "module.py").read_text()
+    assert not (new_venv / MANIFEST_NAME).exists()
+
+
+def test_find_pack_path_uses_the_archived_python_version(tmp_path):
+    """Tests that the default archive is keyed by the packed venv's Python."""
+    # --- Arrange ---
+    (tmp_path / "requirements.txt").write_text("rich==14.2.0\n")
+    venv_dir = tmp_path / "venv"
+    (venv_dir / "bin").mkdir(parents=True)
+    archive = get_pack_path(tmp_path, "3.9.1")
+    pack_venv(venv_dir, archive, "3.9.1")
+    pack_venv(venv_dir, archive.with_name("venv-stale.tar.gz"), "3.9.1")
+
+    # --- Act & Assert ---
+    assert find_pack_path(tmp_path) == archive
+    (tmp_path / "requirements.txt").write_text("rich==14.3.0\n")
+    assert find_pack_path(tmp_path) is None
+
+
+def test_unpack_refuses_templated_members_outside_the_venv(tmp_path):
+    """Tests that templated files get the same path check as extracted ones."""
+    # --- Arrange ---
+    archive = tmp_path / "evil.tar.gz"
+    manifest = json.dumps({"version": 1, "python": "3.11.7", "templated": ["../evil"]})
+    with tarfile.open(archive, "w:gz") as tar:
+        for name, data in ((MANIFEST_NAME, manifest.encode()), ("../evil", b"x")):
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+    (tmp_path / "new").mkdir()
+
+    # --- Act & Assert ---
+    with pytest.raises(ValueError, match="not a file inside the venv"):
+        unpack_venv(archive, tmp_path / "new" / "venv")
+    assert not (tmp_path / "new" / "evil").exists()
+    assert list((tmp_path / "new").iterdir()) == []
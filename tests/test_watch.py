@@ -0,0 +1,72 @@
+import os
+import sys
+
+import pytest
+
+from pyinit.run import parse_run_options
+from pyinit.watch import FileIndex, InotifyWatcher, PollingWatcher
+
+
+def test_file_index_refresh_reports_incremental_changes(tmp_path):
+    """Tests added, modified, removed and ignored files and directories."""
+    # --- Arrange ---
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "a.py").write_text("a = 1\n")
+    (tmp_path / "pkg" / "b.py").write_text("b = 1\n")
+    index = FileIndex(tmp_path)
+
+    # --- Act ---
+    (tmp_path / "pkg" / "a.py").write_text("a = 22\n")
+    (tmp_path / "pkg" / "b.py").unlink()
+    (tmp_path / "pkg" / "sub").mkdir()
+    (tmp_path / "pkg" / "sub" / "c.py").write_text("c = 1\n")
+    (tmp_path / "pkg" / "__pycache__").mkdir()
+    (tmp_path / "pkg" / "__pycache__" / "a.cpython-311.pyc").write_bytes(b"x")
+    changed = index.refresh()
+
+    # --- Assert ---
+    relative = {os.path.relpath(path, tmp_path) for path in changed}
+    assert relative == {
+        os.path.join("pkg", "a.py"),
+        os.path.join("pkg", "b.py"),
+        os.path.join("pkg", "sub", "c.py"),
+    }
+    assert index.refresh() == set()
+
+
+@pytest.mark.parametrize(
+    "watcher_class",
+    [
+        PollingWatcher,
+        pytest.param(
+            InotifyWatcher,
+            marks=pytest.mark.skipif(not sys.platform.startswith("linux"), reason="Linux only"),
+        ),
+    ],
+)
+def test_watchers_detect_new_files_in_new_directories(tmp_path, watcher_class):
+    """Tests that both watchers see a file written into a new subdirectory."""
+    watcher = watcher_class(tmp_path)
+    try:
+        (tmp_path / "new").mkdir()
+        (tmp_path / "new" / "module.py").write_text("x = 1\n")
+        changed = set()
+        for _ in range(5):
+            changed |= watcher.wait(0.2)
+        assert str(tmp_path / "new" / "module.py") in changed
+    finally:
+        watcher.close()
+
+
+def test_parse_run_options_stops_at_script_arguments():
+    """Tests leading run flags, the '--' separator and passthrough arguments."""
+    assert parse_run_options(["--watch", "input.txt", "--watch"]) == (
+        {"--watch": True},
+        ["input.txt", "--watch"],
+    )
+    assert parse_run_options(["--", "--watch"]) == ({}, ["--watch"])
+    assert parse_run_options([]) == ({}, [])
+    assert parse_run_options(["--profile-top", "5", "--profile-sort=tottime", "-v"]) == (
+        {"--profile-top": "5", "--profile-sort": "tottime"},
+        ["-v"],
+    )
@@ -0,0 +1,39 @@
+from pyinit.wheelhouse import (
+    get_wheelhouse_dir,
+    get_wheelhouse_index,
+    is_in_wheelhouse,
+    read_requirements,
+)
+
+
+def test_read_requirements_skips_comments_and_options(tmp_path):
+    """Tests that only requirement lines are returned."""
+    requirements_file = tmp_path / "requirements.txt"
+    requirements_file.write_text(
+        "# pinned\nrich==14.2.0  # ui\n\n-e .\n--hash=sha256:abc\ntomli==2.3.0\n"
+    )
+
+    assert read_requirements(requirements_file) == ["rich==14.2.0", "tomli==2.3.0"]
+
+
+def test_is_in_wheelhouse_matches_normalized_names(tmp_path):
+    """Tests matching pinned requirements against wheel filenames."""
+    (tmp_path / "tomli_w-1.2.0-py3-none-any.whl").touch()
+    (tmp_path / "not-a-wheel.whl").touch()
+    index = get_wheelhouse_index(tmp_path)
+
+    assert is_in_wheelhouse("Tomli-W==1.2.0", index)
+    assert not is_in_wheelhouse("tomli-w==1.1.0", index)
+    assert not is_in_wheelhouse("rich==14.2.0", index)
+
+
+def test_get_wheelhouse_dir_settings(tmp_path, monkeypatch):
+    """Tests the default, project-relative and user-level wheelhouse locations."""
+    assert get_wheelhouse_dir(tmp_path) == tmp_path / ".pyinit" / "wheelhouse"
+
+    (tmp_path / "pyproject.toml").write_text('[tool.pyinit]\nwheelhouse = "wheels"\n')
+    assert get_wheelhouse_dir(tmp_path) == tmp_path / "wheels"
+
+    monkeypatch.setenv("PYINIT_CACHE_DIR", str(tmp_path / "cache"))
+    (tmp_path / "pyproject.toml").write_text('[tool.pyinit]\nwheelhouse = "user"\n')
+    assert get_wheelhouse_dir(tmp_path) == tmp_path / "cache" / "wheelhouse"
@@ -0,0 +1,91 @@
+import pytest
+
+from pyinit.workspace import (
+    get_member_dependencies,
+    get_workspace_members,
+    run_workspace,
+    topological_order,
+)
+
+
+# This fixture creates a fake workspace with three member projects.
+@pytest.fixture
+def mock_workspace(tmp_path):
+    (tmp_path / "pyproject.toml").write_text(
+        '[tool.pyinit.workspace]\nmembers = ["libs/*", "app"]\n'
+    )
+    projects = {
+        "libs/core": ("core-lib", []),
+        "libs/utils": ("utils_lib", ["core-lib>=1.0"]),
+        "app": ("app", ["Utils-Lib", "requests"]),
+    }
+    for path, (name, deps) in projects.items():
+        member_dir = tmp_path / path
+        member_dir.mkdir(parents=True)
+        deps_toml = ", ".join(f'"{d}"' for d in deps)
+        (member_dir / "pyproject.toml").write_text(
+            f'[project]\nname = "{name}"\ndependencies = [{deps_toml}]\n'
+        )
+    # A directory matching the glob but without a pyproject.toml is ignored.
+    (tmp_path / "libs" / "scratch").mkdir()
+    return tmp_path
+
+
+def test_get_workspace_members_expands_globs(mock_workspace):
+    """Tests that member globs are expanded and non-projects are skipped."""
+    members = get_workspace_members(mock_workspace)
+
+    assert sorted(members) == ["app", "core-lib", "utils_lib"]
+    assert members["app"] == (mock_workspace / "app").resolve()
+
+
+def test_member_dependencies_and_order(mock_workspace):
+    """Tests that only inter-member dependencies are kept and ordered first."""
+    members = get_workspace_members(mock_workspace)
+    dependencies = get_member_dependencies(members)
+
+    assert dependencies == {
+        "core-lib": set(),
+        "utils_lib": {"core-lib"},
+        "app": {"utils_lib"},
+    }
+    assert topological_order(dependencies) == ["core-lib", "utils_lib", "app"]
+
+
+def test_member_dependencies_ignore_extras_and_markers(mock_workspace):
+    """Tests that extras and environment markers do not hide a member dependency."""
+    (mock_workspace / "app" / "pyproject.toml").write_text(
+        '[project]\nname = "app"\n'
+        "dependencies = [\"Utils-Lib[cli]; python_version >= '3'\"]\n"
+        '[project.optional-dependencies]\nfast = ["core-lib[speedups]>=1.0"]\n'
+    )
+    members = get_workspace_members(mock_workspace)
+
+    assert get_member_dependencies(members)["app"] == {"core-lib", "utils_lib"}
+
+
+def test_topological_order_detects_cycles():
+    """Tests that a dependency cycle is reported instead of looping forever."""
+    with pytest.raises(ValueError, match="cycle"):
+        topological_order({"a": {"b"}, "b": {"a"}, "c": set()})
+
+
+def test_run_workspace_skips_dependents_of_failed_members(mocker, mock_workspace):
+    """Tests that members depending on a failed member are skipped."""
+    # --- Arrange ---
+    mocker.patch("pathlib.Path.cwd", return_value=mock_workspace / "app")
+    mock_run_member = mocker.patch(
+        "pyinit.workspace.run_member",
+        side_effect=lambda name, *args: (1 if name == "utils_lib" else 0, 0.1),
+    )
+    mock_console_print = mocker.patch("rich.console.Console.print")
+
+    # --- Act & Assert ---
+    with pytest.raises(SystemExit) as excinfo:
+        run_workspace(["test"], jobs=2)
+
+    assert excinfo.value.code == 1
+    ran = [call.args[0] for call in mock_run_member.call_args_list]
+    assert ran == ["core-lib", "utils_lib"]
+    summary = mock_console_print.call_args_list[-1].args[0]
+    assert "1 passed, 1 failed, 1 skipped" in summary